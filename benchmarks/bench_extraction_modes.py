@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the "blocks" and "dict" text extraction modes.
+
+Reads every page of the given PDFs (default: a synthetic thesis) in both
+modes and reports the time and the peak Python memory per page, checks
+that both modes produce the same text blocks and times a complete
+extraction of each document.
+
+Usage:
+    python benchmarks/bench_extraction_modes.py
+    python benchmarks/bench_extraction_modes.py thesis.pdf --repeat 5
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+import fitz  # PyMuPDF
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO_ROOT = BENCHMARK_DIR.parent
+sys.path.insert(0, str(BENCHMARK_DIR))
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from synthetic_thesis import create_synthetic_thesis  # noqa: E402
+from veritascribe.config import get_settings  # noqa: E402
+from veritascribe.pdf_processor import PDFProcessor  # noqa: E402
+
+MODES = ["dict", "blocks"]
+
+
+def _processor(mode: str) -> PDFProcessor:
+    # One process extracts, so the modes are compared page for page
+    settings = get_settings().model_copy(update={"text_extraction_mode": mode, "extraction_processes": 1})
+    return PDFProcessor(settings)
+
+
+def measure_pages(pdf_path: str, mode: str, repeat: int) -> Dict[str, float]:
+    """Time and peak traced memory of reading the layout of every page."""
+    processor = _processor(mode)
+    with fitz.open(pdf_path) as doc:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for page in doc:
+                processor._read_page_layout(page, page.number + 1)
+            best = min(best, time.perf_counter() - start)
+
+        peaks: List[int] = []
+        tracemalloc.start()
+        try:
+            for page in doc:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                layout = processor._read_page_layout(page, page.number + 1)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+                del layout
+        finally:
+            tracemalloc.stop()
+        page_count = len(doc)
+
+    return {
+        "ms_per_page": best / page_count * 1e3,
+        "mean_kib_per_page": sum(peaks) / len(peaks) / 1024,
+        "max_kib_per_page": max(peaks) / 1024,
+    }
+
+
+def measure_document(pdf_path: str, mode: str, repeat: int):
+    """Best wall time of a complete extraction, with the extracted blocks."""
+    processor = _processor(mode)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extraction = processor.extract_document(pdf_path)
+        best = min(best, time.perf_counter() - start)
+    return best, extraction
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the text extraction modes")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to extract (default: a synthetic thesis)")
+    parser.add_argument("--pages", type=int, default=200, help="Pages of the default synthetic thesis")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing rounds (the best one counts)")
+    args = parser.parse_args()
+
+    differences = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_paths = args.pdfs or [create_synthetic_thesis(str(Path(work_dir) / "thesis.pdf"), args.pages)]
+        for pdf_path in pdf_paths:
+            print(Path(pdf_path).name)
+            extractions = {}
+            for mode in MODES:
+                pages = measure_pages(pdf_path, mode, args.repeat)
+                document_time, extractions[mode] = measure_document(pdf_path, mode, args.repeat)
+                print(
+                    f"  {mode:>6}: {pages['ms_per_page']:.2f} ms/page, "
+                    f"{pages['mean_kib_per_page']:.1f} KiB/page peak (max {pages['max_kib_per_page']:.1f}), "
+                    f"document {document_time:.2f}s"
+                )
+
+            dict_result, blocks_result = extractions["dict"], extractions["blocks"]
+            if (
+                [block.model_dump() for block in dict_result.text_blocks]
+                != [block.model_dump() for block in blocks_result.text_blocks]
+                or dict_result.page_texts != blocks_result.page_texts
+            ):
+                differences += 1
+                print("  the modes extracted different blocks or page texts")
+
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
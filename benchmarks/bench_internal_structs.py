@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark of slotted raw blocks against Pydantic models inside extraction.
+
+Reads the raw blocks of every page of the given PDFs (default: a synthetic
+thesis of about 1000 analysis blocks) and holds them once as the slotted
+``RawBlock`` structs the extraction uses and once as validated
+``TextBlock`` models, as before. Reports the CPU time and traced memory of
+building them, the size and time of pickling them (the transfer from
+extraction worker processes) and of chunking them into analysis blocks,
+and checks that both produce the same analysis blocks.
+
+Usage:
+    python benchmarks/bench_internal_structs.py
+    python benchmarks/bench_internal_structs.py thesis.pdf --repeat 5
+"""
+
+import argparse
+import itertools
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import astuple, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import fitz  # PyMuPDF
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO_ROOT = BENCHMARK_DIR.parent
+sys.path.insert(0, str(BENCHMARK_DIR))
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from synthetic_thesis import create_synthetic_thesis  # noqa: E402
+from veritascribe.chunking import RawBlock  # noqa: E402
+from veritascribe.config import get_settings  # noqa: E402
+from veritascribe.data_models import TextBlock  # noqa: E402
+from veritascribe.pdf_processor import PDFProcessor  # noqa: E402
+
+RAW_BLOCK_FIELDS = [field.name for field in fields(RawBlock)]
+
+STRUCTS: Dict[str, Callable[..., object]] = {
+    "RawBlock": RawBlock,
+    "TextBlock": TextBlock,
+}
+
+
+def collect_raw_blocks(processor: PDFProcessor, pdf_path: str) -> List[tuple]:
+    """Field values of the raw blocks of every page, before filtering and chunking."""
+    rows: List[tuple] = []
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            rows.extend(
+                astuple(raw_block)
+                for raw_block in processor._extract_page_blocks(page, page.number + 1, first_block_index=len(rows))
+            )
+    return rows
+
+
+def build(struct: Callable[..., object], rows: List[tuple]) -> list:
+    return [struct(**dict(zip(RAW_BLOCK_FIELDS, row))) for row in rows]
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Best wall time of several calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def traced_bytes(function: Callable[[], object]) -> Tuple[int, object]:
+    """Traced memory still allocated by the result of a call, with the result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def chunk_pages(processor: PDFProcessor, blocks: list) -> list:
+    """Chunk blocks page by page, as the extraction does."""
+    chunks = []
+    for _, page_blocks in itertools.groupby(blocks, key=lambda block: block.page_number):
+        chunks.extend(processor.chunker.chunk(list(page_blocks), first_index=len(chunks)))
+    return chunks
+
+
+def measure(processor: PDFProcessor, name: str, rows: List[tuple], repeat: int) -> Tuple[Dict[str, float], list]:
+    struct = STRUCTS[name]
+    build_time = best_time(lambda: build(struct, rows), repeat)
+    memory, blocks = traced_bytes(lambda: build(struct, rows))
+    pickled = pickle.dumps(blocks, protocol=pickle.HIGHEST_PROTOCOL)
+    transfer_time = best_time(
+        lambda: pickle.loads(pickle.dumps(blocks, protocol=pickle.HIGHEST_PROTOCOL)), repeat
+    )
+    chunk_time = best_time(lambda: chunk_pages(processor, blocks), repeat)
+    return {
+        "build_us": build_time / len(rows) * 1e6,
+        "memory_bytes": memory / len(rows),
+        "pickle_bytes": len(pickled) / len(rows),
+        "transfer_us": transfer_time / len(rows) * 1e6,
+        "chunk_ms": chunk_time * 1e3,
+    }, chunk_pages(processor, blocks)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare slotted raw blocks with Pydantic models")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to extract (default: a synthetic thesis)")
+    parser.add_argument("--pages", type=int, default=400, help="Pages of the default synthetic thesis")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds (the best one counts)")
+    args = parser.parse_args()
+
+    settings = get_settings().model_copy(update={"extraction_cache_enabled": False, "extraction_processes": 1})
+    processor = PDFProcessor(settings)
+
+    differences = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_paths = args.pdfs or [create_synthetic_thesis(str(Path(work_dir) / "thesis.pdf"), args.pages)]
+        for pdf_path in pdf_paths:
+            rows = collect_raw_blocks(processor, pdf_path)
+            start = time.perf_counter()
+            extraction = processor.extract_document(pdf_path)
+            extraction_time = time.perf_counter() - start
+            print(
+                f"{Path(pdf_path).name}: {len(rows)} raw blocks, {len(extraction.text_blocks)} analysis blocks, "
+                f"extraction {extraction_time:.2f}s"
+            )
+
+            results = {name: measure(processor, name, rows, args.repeat) for name in STRUCTS}
+            for name, (metrics, _) in results.items():
+                print(
+                    f"  {name:>9}: build {metrics['build_us']:5.1f} us/block, "
+                    f"{metrics['memory_bytes']:6.0f} B/block, "
+                    f"pickled {metrics['pickle_bytes']:6.0f} B/block, "
+                    f"pickle round trip {metrics['transfer_us']:5.1f} us/block, "
+                    f"chunking {metrics['chunk_ms']:6.1f} ms"
+                )
+
+            chunks = {name: [chunk.model_dump() for chunk in result[1]] for name, result in results.items()}
+            if chunks["RawBlock"] != chunks["TextBlock"]:
+                differences += 1
+                print("  the representations produced different analysis blocks")
+
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of the text cleaning applied to every extracted block.
+
+Collects the raw text of every block of real PDFs, cleans it with the
+current engine and with the previous multi-pass implementation, fails if
+any output differs and reports the time per block of both.
+
+Usage:
+    python benchmarks/bench_text_cleaning.py
+    python benchmarks/bench_text_cleaning.py thesis.pdf other.pdf --repeat 10
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import fitz  # PyMuPDF
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO_ROOT = BENCHMARK_DIR.parent
+sys.path.insert(0, str(BENCHMARK_DIR))
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from synthetic_thesis import create_synthetic_thesis  # noqa: E402
+from veritascribe.text_cleaning import clean_extracted_text  # noqa: E402
+
+# Inputs exercising the rarely hit rules, in addition to the PDF blocks
+EDGE_CASES = [
+    "Die Pr¨ufung der Ergebnisse f“ur gro\"se Daten, \"ortlich und ¨Uberblick¨A“O.",
+    "Zusammen-\nfassung und Anwendungs-\n, Daten-\n bank",
+    "Version 1.2.3 kostet 3,50 Euro ; siehe Abb . 4:Ergebnisse!Weiter?Ja.",
+    "Mehr unter https://example.org/a.b,c. oder www.uni.de/x?y=1.Kontakt: max.mustermann@uni-x.de,danach",
+    "Kontrolle\x00 \x01 zeichen\x07und\x1f Leer\x0b\x0craum \t\n Ende .",
+    "Hochzahlen x². 5 und ①.② sowie 2²,3 a@b.c1,5",
+    "  \n  ",
+    "-\n-\n-\n",
+]
+
+
+def legacy_clean_extracted_text(text: str) -> str:
+    """The multi-pass cleaning used before the combined patterns."""
+    if not text:
+        return ""
+
+    for pattern, umlaut in [
+        (r'¨a', 'ä'), (r'“a', 'ä'), (r'¨A', 'Ä'), (r'“A', 'Ä'),
+        (r'"o', 'ö'), (r'¨o', 'ö'), (r'“o', 'ö'), (r'¨O', 'Ö'), (r'“O', 'Ö'),
+        (r'"u', 'ü'), (r'¨u', 'ü'), (r'“u', 'ü'), (r'¨U', 'Ü'), (r'“U', 'Ü'),
+    ]:
+        text = re.sub(pattern, umlaut, text)
+
+    text = re.sub(r'-\n(?![ ,])', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    text = re.sub(r'\s+([.,;:!?])', r'\1', text)
+
+    protected = []
+
+    def _mask(match):
+        protected.append(match.group(0))
+        return f"__PROTECTED_{len(protected)-1}__"
+    url_email_pattern = r'\b(?:https?://\S+|www\.\S+|[\w\.-]+@[\w\.-]+\.\w+)\b'
+    text = re.sub(url_email_pattern, _mask, text)
+
+    def _ensure_space_after_punct(match):
+        punct = match.group(1)
+        start = match.start(1)
+        end = match.end(1)
+        prev_char = text[start-1] if start > 0 else ''
+        next_char = text[end] if end < len(text) else ''
+        if prev_char.isdigit() and next_char.isdigit():
+            return punct
+        return punct + ' '
+    text = re.sub(r'([.,;:!?])\s*', _ensure_space_after_punct, text)
+
+    for i, original in enumerate(protected):
+        text = text.replace(f"__PROTECTED_{i}__", original)
+
+    return text.strip()
+
+
+def collect_block_texts(pdf_paths: List[str]) -> List[str]:
+    """Collect the uncleaned text of every text block, as the PDF processor joins it."""
+    texts = []
+    for pdf_path in pdf_paths:
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                for block in page.get_text("dict").get("blocks", []):
+                    lines = []
+                    for line in block.get("lines", []):
+                        line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+                        if line_text.strip():
+                            lines.append(line_text.strip())
+                    if lines:
+                        texts.append("\n".join(lines))
+    return texts
+
+
+def time_per_block(clean: Callable[[str], str], texts: List[str], repeat: int) -> float:
+    """Best time over several rounds of cleaning all texts, in microseconds per block."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            clean(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark and verify the text cleaning engine")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to take blocks from (default: demo and synthetic theses)")
+    parser.add_argument("--pages", type=int, default=100, help="Pages of the default synthetic thesis")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds (the best one counts)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_paths = args.pdfs or [
+            str(REPO_ROOT / "demo_thesis.pdf"),
+            create_synthetic_thesis(str(Path(work_dir) / "thesis.pdf"), args.pages),
+        ]
+        texts = collect_block_texts(pdf_paths) + EDGE_CASES
+
+    mismatches = 0
+    for text in texts:
+        expected, actual = legacy_clean_extracted_text(text), clean_extracted_text(text)
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"Mismatch for {text!r}:\n  previous: {expected!r}\n  current:  {actual!r}")
+
+    legacy_time = time_per_block(legacy_clean_extracted_text, texts, args.repeat)
+    current_time = time_per_block(clean_extracted_text, texts, args.repeat)
+    total_chars = sum(len(text) for text in texts)
+
+    print(f"{len(texts)} blocks ({total_chars / len(texts):.0f} characters on average), {mismatches} mismatches")
+    print(f"  previous: {legacy_time:8.1f} us/block")
+    print(f"  current:  {current_time:8.1f} us/block ({legacy_time / current_time:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
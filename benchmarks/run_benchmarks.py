@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmarks for VeritaScribe.
+
+Generates synthetic theses, runs the full analysis pipeline against a local
+stand-in LM and records throughput, latency percentiles, peak RSS and
+per-stage wall time. Results are written as JSON so runs can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 10 100 --concurrency 8
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/previous.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCHMARK_DIR = Path(__file__).parent
+REPO_ROOT = BENCHMARK_DIR.parent
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from stand_in_lm import StandInLMServer  # noqa: E402
+from synthetic_thesis import create_synthetic_thesis  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 500]
+
+# Metrics compared between runs, with True meaning "higher is better"
+COMPARED_METRICS = {
+    "blocks_per_second": True,
+    "requests_per_second": True,
+    "latency_p50": False,
+    "latency_p95": False,
+    "latency_p99": False,
+    "peak_rss_mb": False,
+    "wall_time_seconds": False,
+}
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    """Compute p50/p95/p99 of a list of latencies."""
+    if not values:
+        return {"latency_p50": 0.0, "latency_p95": 0.0, "latency_p99": 0.0}
+    if len(values) == 1:
+        return {"latency_p50": values[0], "latency_p95": values[0], "latency_p99": values[0]}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "latency_p50": round(cuts[49], 4),
+        "latency_p95": round(cuts[94], 4),
+        "latency_p99": round(cuts[98], 4),
+    }
+
+
+def _run_case(pdf_path: str, env: Dict[str, str], queue: multiprocessing.Queue) -> None:
+    """Run one pipeline analysis in a fresh process and report its metrics."""
+    os.environ.update(env)
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+
+    import resource
+
+    import dspy
+    from veritascribe.config import get_dspy_config, get_rate_limiter, initialize_system
+    from veritascribe.pipeline import create_analysis_pipeline
+
+    # Cached completions would hide the cost of every repeated request
+    if hasattr(dspy, "configure_cache"):
+        dspy.configure_cache(enable_disk_cache=False, enable_memory_cache=False)
+
+    try:
+        # One-off client setup (imports, tokenizer loading) is not part of throughput
+        warmup_start = time.perf_counter()
+        initialize_system()
+        get_dspy_config().get_llm()("warm-up")
+        warmup_time = time.perf_counter() - warmup_start
+
+        pipeline = create_analysis_pipeline()
+        start = time.perf_counter()
+        report = pipeline.analyze_thesis(pdf_path)
+        wall_time = time.perf_counter() - start
+
+        latencies = [
+            result.processing_time_seconds
+            for result in report.analysis_results
+            if result.processing_time_seconds is not None
+        ]
+        stage_timings = report.stage_timings or {}
+        analysis_time = stage_timings.get("analysis", {}).get("duration", wall_time)
+
+        metrics: Dict[str, Any] = {
+            "pages": report.total_pages,
+            "blocks": report.total_text_blocks,
+            "errors": report.total_errors,
+            "wall_time_seconds": round(wall_time, 4),
+            "warmup_seconds": round(warmup_time, 4),
+            "analysis_time_seconds": round(analysis_time, 4),
+            "blocks_per_second": round(report.total_text_blocks / analysis_time, 3) if analysis_time else 0.0,
+            "stage_timings": stage_timings,
+            "token_usage": report.token_usage,
+            "rate_limiter": get_rate_limiter().get_all_stats(),
+            "request_stats": report.request_stats,
+            # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+            "peak_rss_mb": round(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+                1,
+            ),
+        }
+        metrics.update(_percentiles(latencies))
+        queue.put({"ok": True, "metrics": metrics})
+    except Exception as e:  # pragma: no cover - reported back to the parent
+        queue.put({"ok": False, "error": f"{type(e).__name__}: {e}"})
+
+
+def run_case(pdf_path: str, server: StandInLMServer, args: argparse.Namespace, output_dir: str) -> Dict[str, Any]:
+    """Run one benchmark case in a spawned subprocess so peak RSS is per case."""
+    env = {
+        "LLM_PROVIDER": "custom",
+        "OPENAI_API_KEY": "stand-in",
+        "OPENAI_BASE_URL": server.base_url,
+        "DEFAULT_MODEL": "openai/stand-in",
+        "PARALLEL_PROCESSING": "true" if args.concurrency > 1 else "false",
+        "MAX_CONCURRENT_REQUESTS": str(args.concurrency),
+        "RATE_LIMIT_ENABLED": "true" if args.rpm else "false",
+        "RATE_LIMIT_REQUESTS_PER_MINUTE": str(args.rpm or 0),
+        "OUTPUT_DIRECTORY": output_dir,
+        # Keep LiteLLM from fetching its model cost map over the network
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+    }
+    if not args.rpm:
+        env.pop("RATE_LIMIT_REQUESTS_PER_MINUTE")
+    env.update(args.settings)
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    requests_before = server.stats.snapshot()
+
+    process = context.Process(target=_run_case, args=(pdf_path, env, queue))
+    process.start()
+    outcome = queue.get()
+    process.join()
+
+    requests_after = server.stats.snapshot()
+    if not outcome["ok"]:
+        raise RuntimeError(outcome["error"])
+
+    metrics = outcome["metrics"]
+    # The warm-up request is excluded from the request count
+    metrics["requests"] = requests_after["requests"] - requests_before["requests"] - 1
+    metrics["connections"] = requests_after["connections"] - requests_before["connections"]
+    analysis_time = metrics["analysis_time_seconds"]
+    metrics["requests_per_second"] = round(metrics["requests"] / analysis_time, 3) if analysis_time else 0.0
+    return metrics
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare_results(current: Dict[str, Any], previous: Dict[str, Any]) -> None:
+    """Print relative changes of the compared metrics between two runs."""
+    print(f"\nComparison with run from {previous.get('timestamp', 'unknown')} "
+          f"(revision {previous.get('git_revision') or 'unknown'}):")
+    for size, metrics in current["results"].items():
+        old = previous.get("results", {}).get(size)
+        if not old:
+            print(f"  {size} pages: no previous result")
+            continue
+        print(f"  {size} pages:")
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            new_value, old_value = metrics.get(metric), old.get(metric)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value * 100
+            better = change > 0 if higher_is_better else change < 0
+            marker = "+" if better else "-" if change else " "
+            print(f"    [{marker}] {metric:<22} {old_value:>10} -> {new_value:>10} ({change:+.1f}%)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run VeritaScribe throughput benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Thesis sizes in pages")
+    parser.add_argument("--concurrency", type=int, default=5, help="MAX_CONCURRENT_REQUESTS for the pipeline")
+    parser.add_argument("--rpm", type=int, default=0, help="Rate limit in requests/minute (0 disables the limiter)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Median stand-in LM latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal sigma of the latency tail")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for documents and latencies")
+    parser.add_argument("--output", type=str, default=None, help="Result JSON path")
+    parser.add_argument("--compare", type=str, default=None, help="Previous result JSON to compare against")
+    parser.add_argument(
+        "--setting", action="append", default=[], metavar="KEY=VALUE",
+        help="Extra VeritaScribe setting for the run, e.g. TARGET_BLOCK_TOKENS=600 (repeatable)",
+    )
+    args = parser.parse_args()
+    args.settings = dict(item.split("=", 1) for item in args.setting)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = Path(args.output or BENCHMARK_DIR / "results" / f"benchmark_{timestamp}.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    run: Dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "concurrency": args.concurrency,
+            "rpm": args.rpm,
+            "median_latency": args.latency,
+            "latency_sigma": args.latency_sigma,
+            "seed": args.seed,
+            "settings": args.settings,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as work_dir, StandInLMServer(
+        median_latency=args.latency, latency_sigma=args.latency_sigma, seed=args.seed
+    ) as server:
+        for size in args.sizes:
+            pdf_path = create_synthetic_thesis(str(Path(work_dir) / f"thesis_{size}.pdf"), size, seed=args.seed)
+            print(f"Running {size}-page benchmark...", flush=True)
+            metrics = run_case(pdf_path, server, args, work_dir)
+            run["results"][str(size)] = metrics
+            print(
+                f"  {metrics['blocks']} blocks, {metrics['requests']} requests in {metrics['wall_time_seconds']:.2f}s | "
+                f"{metrics['blocks_per_second']:.2f} blocks/s, {metrics['requests_per_second']:.2f} req/s | "
+                f"p50/p95/p99 {metrics['latency_p50']:.3f}/{metrics['latency_p95']:.3f}/{metrics['latency_p99']:.3f}s | "
+                f"peak RSS {metrics['peak_rss_mb']:.1f} MB"
+            )
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2)
+    print(f"\nResults saved to: {output_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare_results(run, json.load(f))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Local stand-in LM for VeritaScribe benchmarks.
+
+Serves an OpenAI-compatible ``/v1/chat/completions`` endpoint on localhost so
+the full pipeline (DSPy, LiteLLM, HTTP, rate limiter, thread pool) can be
+exercised without a real provider. Responses follow the DSPy chat adapter
+field format and are produced after a simulated, seeded latency.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# Output fields of the VeritaScribe DSPy signatures
+OUTPUT_FIELDS = ("grammar_errors", "content_errors", "citation_errors")
+FIELD_HEADER_PATTERN = re.compile(r"\[\[ ## (\w+) ## \]\]")
+TEXT_CHUNK_PATTERN = re.compile(r"\[\[ ## text_chunk ## \]\]\s*(.*?)\s*(?:\[\[ ## |\Z)", re.DOTALL)
+
+
+class StandInLMStats:
+    """Thread-safe request counters for the stand-in server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "connections": self.connections}
+
+
+def _finding(field: str, text: str) -> List[Dict]:
+    """Produce a deterministic finding for roughly a fifth of all chunks."""
+    digest = int(hashlib.sha1(f"{field}:{text}".encode("utf-8")).hexdigest(), 16)
+    words = text.split()
+    if digest % 5 != 0 or len(words) < 5:
+        return []
+
+    error = {
+        "severity": ("high", "medium", "low")[digest % 3],
+        "original_text": " ".join(words[:5]),
+        "suggested_correction": " ".join(words[:5]),
+        "explanation": "Synthetic finding produced by the benchmark stand-in LM.",
+        "confidence_score": 0.8,
+    }
+    if field == "grammar_errors":
+        error.update(error_type="grammar", grammar_rule="subject-verb agreement")
+    elif field == "content_errors":
+        error.update(error_type="content_plausibility", plausibility_issue="consistency", requires_fact_check=False)
+    else:
+        error.update(error_type="citation_format", citation_style_expected="APA", missing_elements=["page_number"])
+    return [error]
+
+
+def build_completion(messages: List[Dict[str, str]]) -> str:
+    """Build a chat-adapter formatted completion for the requested signature."""
+    prompt = "\n".join(str(message.get("content", "")) for message in messages)
+    requested = [name for name in OUTPUT_FIELDS if f"[[ ## {name} ## ]]" in prompt]
+    last_message = str(messages[-1].get("content", "")) if messages else ""
+    match = TEXT_CHUNK_PATTERN.search(last_message)
+    text = match.group(1) if match else ""
+
+    parts = ["[[ ## reasoning ## ]]", "Checked the text chunk.", ""]
+    for field in requested:
+        parts.extend([f"[[ ## {field} ## ]]", json.dumps(_finding(field, text)), ""])
+    parts.append("[[ ## completed ## ]]")
+    return "\n".join(parts)
+
+
+class StandInLMServer:
+    """Threaded OpenAI-compatible HTTP server with simulated latency."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        median_latency: float = 0.05,
+        latency_sigma: float = 0.5,
+        seed: int = 42,
+    ):
+        """
+        Initialize the stand-in server.
+
+        Args:
+            host: Interface to bind to
+            port: Port to bind to (0 picks a free port)
+            median_latency: Median simulated response latency in seconds
+            latency_sigma: Log-normal sigma of the latency distribution (controls the tail)
+            seed: Random seed for the latency distribution
+        """
+        self.median_latency = median_latency
+        self.latency_sigma = latency_sigma
+        self.stats = StandInLMStats()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server.stats.record_connection()
+
+            def log_message(self, format, *args):  # noqa: A002 - signature from base class
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                server.stats.record_request()
+                time.sleep(server._sample_latency())
+
+                content = build_completion(payload.get("messages", []))
+                prompt_tokens = sum(len(str(m.get("content", ""))) for m in payload.get("messages", [])) // 4
+                completion_tokens = len(content) // 4
+                body = json.dumps({
+                    "id": f"chatcmpl-{server.stats.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": payload.get("model", "stand-in"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                }).encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+
+    def _sample_latency(self) -> float:
+        with self._rng_lock:
+            return self._rng.lognormvariate(0.0, self.latency_sigma) * self.median_latency
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StandInLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandInLMServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the stand-in LM server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Median latency in seconds")
+    args = parser.parse_args()
+
+    with StandInLMServer(port=args.port, median_latency=args.latency) as lm_server:
+        print(f"Stand-in LM listening on {lm_server.base_url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,272 @@
+"""
+Synthetic thesis generator for VeritaScribe benchmarks.
+
+Builds on the approach of ``veritascribe.pdf_processor.create_test_pdf`` but
+produces multi-page documents with a realistic thesis layout: title page,
+chapters with numbered headings, running headers, page-number footers,
+footnotes, numeric tables, an outline and a bibliography chapter.
+"""
+
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+import fitz  # PyMuPDF
+
+# A4 page geometry in points
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN_LEFT = 72
+MARGIN_RIGHT = PAGE_WIDTH - 72
+BODY_TOP = 90
+BODY_BOTTOM = PAGE_HEIGHT - 110
+
+BODY_FONT_SIZE = 11
+HEADING_FONT_SIZE = 16
+SUBHEADING_FONT_SIZE = 13
+SMALL_FONT_SIZE = 8
+
+THESIS_TITLE = "The Impact of Social Media on Academic Performance"
+UNIVERSITY = "University of Applied Sciences - Faculty of Social Sciences"
+
+CHAPTER_TITLES = [
+    "Introduction",
+    "Theoretical Background",
+    "Literature Review",
+    "Methodology",
+    "Data Collection",
+    "Results",
+    "Discussion",
+    "Limitations",
+    "Conclusion",
+]
+
+SUBJECTS = [
+    "The study", "This research", "The survey", "The participants", "The results",
+    "The analysis", "Previous work", "The data", "The model", "The literature",
+]
+VERBS = [
+    "indicates", "suggests", "shows", "demonstrates", "confirms",
+    "has shown", "was found to reveal", "implies", "highlights", "supports",
+]
+OBJECTS = [
+    "a negative correlation between screen time and grade point average",
+    "that students who spend more than three hours online tend to sleep less",
+    "a moderate effect of notification frequency on attention span",
+    "no significant difference between undergraduate and graduate cohorts",
+    "that self-regulation mediates the effect of social media use",
+    "that academic performance depends on a variety of contextual factors",
+    "an increase in multitasking behaviour during lectures",
+    "that the sample is representative of the student population",
+]
+CONNECTORS = [
+    "However,", "Furthermore,", "In addition,", "Consequently,", "Nevertheless,",
+    "As expected,", "Interestingly,", "In contrast,",
+]
+# Deliberate mistakes so the stand-in LM and reports have something to show
+FLAWED_SENTENCES = [
+    "The results shows that participants was more distracted.",
+    "Data was collected in 2025 with surveys from 2026.",
+    "The study aims to investigate weather excessive use correlates with lower grades.",
+    "According to Smith 2020 the effect is large.",
+]
+AUTHORS = [
+    "Smith, J.", "Johnson, M.", "Williams, R.", "Brown, K.", "Jones, L.",
+    "Garcia, P.", "Miller, S.", "Davis, T.", "Martinez, A.", "Wilson, E.",
+]
+SECTION_TOPICS = [
+    "Research questions", "Sampling strategy", "Survey design", "Statistical analysis",
+    "Descriptive statistics", "Regression results", "Qualitative findings", "Interpretation",
+]
+JOURNALS = [
+    "Journal of Educational Technology", "Computers & Education",
+    "Learning and Instruction", "Educational Psychology Review",
+    "Journal of Computer Assisted Learning",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    """Generate one pseudo-academic sentence."""
+    if rng.random() < 0.05:
+        return rng.choice(FLAWED_SENTENCES)
+    sentence = f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+    if rng.random() < 0.3:
+        sentence = f"{rng.choice(CONNECTORS)} {sentence[0].lower()}{sentence[1:]}"
+    if rng.random() < 0.25:
+        sentence += f" ({rng.choice(AUTHORS).split(',')[0]}, {rng.randint(2005, 2024)})"
+    return sentence + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    """Generate a paragraph of 3-9 sentences."""
+    return " ".join(_sentence(rng) for _ in range(rng.randint(3, 9)))
+
+
+def _table_block(rng: random.Random) -> str:
+    """Generate a small numeric table rendered as text rows."""
+    rows = ["Group   N   Mean   SD   p"]
+    for group in ("Control", "Low use", "High use"):
+        rows.append(
+            f"{group}   {rng.randint(40, 200)}   {rng.uniform(1.5, 4.0):.2f}   "
+            f"{rng.uniform(0.2, 1.2):.2f}   {rng.uniform(0.001, 0.2):.3f}"
+        )
+    return "\n".join(rows)
+
+
+def _bibliography_entries(rng: random.Random, count: int) -> List[str]:
+    """Generate bibliography entries in a loose APA style."""
+    entries = []
+    for _ in range(count):
+        authors = ", ".join(rng.sample(AUTHORS, rng.randint(1, 3)))
+        year = rng.randint(2000, 2024)
+        title = rng.choice(OBJECTS).capitalize()
+        journal = rng.choice(JOURNALS)
+        entries.append(
+            f"{authors} ({year}). {title}. {journal}, {rng.randint(1, 40)}({rng.randint(1, 6)}), "
+            f"{rng.randint(1, 300)}-{rng.randint(301, 600)}."
+        )
+    return sorted(entries)
+
+
+class _PageWriter:
+    """Writes flowing content onto pages, adding running headers and footers."""
+
+    def __init__(self, doc: fitz.Document, rng: random.Random):
+        self.doc = doc
+        self.rng = rng
+        self.page = None
+        self.cursor = BODY_TOP
+        self.chapter_title = ""
+        self.toc: List[Tuple[int, str, int]] = []
+
+    @property
+    def page_number(self) -> int:
+        return len(self.doc)
+
+    def new_page(self) -> None:
+        self.page = self.doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        self.cursor = BODY_TOP
+        # Running header and footer repeat on every body page
+        self._insert(
+            fitz.Rect(MARGIN_LEFT, 30, MARGIN_RIGHT, 60),
+            f"{THESIS_TITLE}\n{self.chapter_title}",
+            SMALL_FONT_SIZE,
+        )
+        self._insert(
+            fitz.Rect(MARGIN_LEFT, PAGE_HEIGHT - 50, MARGIN_RIGHT, PAGE_HEIGHT - 30),
+            f"{UNIVERSITY}   {self.page_number}",
+            SMALL_FONT_SIZE,
+        )
+
+    def _insert(self, rect: fitz.Rect, text: str, fontsize: float, fontname: str = "helv") -> float:
+        try:
+            return self.page.insert_textbox(rect, text, fontsize=fontsize, fontname=fontname)
+        except Exception:
+            # Fallback to default font if the requested one fails
+            return self.page.insert_textbox(rect, text, fontsize=fontsize)
+
+    def write(self, text: str, fontsize: float = BODY_FONT_SIZE, fontname: str = "helv", gap: float = 10) -> None:
+        if self.page is None or self.cursor > BODY_BOTTOM - 2 * fontsize:
+            self.new_page()
+        for _ in range(2):
+            rect = fitz.Rect(MARGIN_LEFT, self.cursor, MARGIN_RIGHT, BODY_BOTTOM)
+            # insert_textbox returns the unused height, or a negative value if the text did not fit
+            remaining = self._insert(rect, text, fontsize, fontname)
+            if remaining >= 0:
+                self.cursor = BODY_BOTTOM - remaining + gap
+                return
+            self.new_page()
+        raise ValueError(f"Text does not fit on an empty page: {text[:50]}...")
+
+    def footnote(self, text: str) -> None:
+        rect = fitz.Rect(MARGIN_LEFT, BODY_BOTTOM + 10, MARGIN_RIGHT, BODY_BOTTOM + 50)
+        self._insert(rect, text, SMALL_FONT_SIZE)
+
+    def heading(self, text: str, level: int) -> None:
+        if level == 1:
+            self.chapter_title = text
+            self.new_page()
+        fontsize = HEADING_FONT_SIZE if level == 1 else SUBHEADING_FONT_SIZE
+        self.write(text, fontsize=fontsize, fontname="hebo", gap=14)
+        self.toc.append((level, text, self.page_number))
+
+
+def create_synthetic_thesis(output_path: str, pages: int, seed: int = 42) -> str:
+    """
+    Create a synthetic thesis PDF with roughly the requested number of pages.
+
+    Args:
+        output_path: Path where the PDF should be created
+        pages: Target page count (title page and bibliography included)
+        seed: Random seed so that runs are reproducible
+
+    Returns:
+        Path to the created PDF file
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+    writer = _PageWriter(doc, rng)
+
+    # Title page without running header
+    title_page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    title_page.insert_textbox(
+        fitz.Rect(MARGIN_LEFT, 200, MARGIN_RIGHT, 400),
+        f"Bachelor Thesis\n\n{THESIS_TITLE}\n\n{UNIVERSITY}",
+        fontsize=20,
+        fontname="hebo",
+        align=fitz.TEXT_ALIGN_CENTER,
+    )
+    writer.toc.append((1, "Title", 1))
+
+    bibliography_pages = max(1, pages // 25)
+    body_pages = max(1, pages - 1 - bibliography_pages)
+    chapters = max(1, min(len(CHAPTER_TITLES), body_pages // 3 or 1))
+    pages_per_chapter = body_pages / chapters
+
+    for chapter_index in range(chapters):
+        chapter_title = f"{chapter_index + 1} {CHAPTER_TITLES[chapter_index % len(CHAPTER_TITLES)]}"
+        writer.heading(chapter_title, level=1)
+        chapter_end = 1 + (chapter_index + 1) * pages_per_chapter
+        section_number = 0
+
+        while writer.page_number < chapter_end:
+            if rng.random() < 0.15:
+                section_number += 1
+                writer.heading(
+                    f"{chapter_index + 1}.{section_number} {rng.choice(SECTION_TOPICS)}",
+                    level=2,
+                )
+            roll = rng.random()
+            if roll < 0.06:
+                writer.write(f"Table {chapter_index + 1}.{rng.randint(1, 9)}: Descriptive statistics", fontsize=9)
+                writer.write(_table_block(rng), fontsize=9, fontname="cour")
+            else:
+                writer.write(_paragraph(rng))
+            if rng.random() < 0.08:
+                writer.footnote(f"{rng.randint(1, 99)} {_sentence(rng)}")
+
+    writer.chapter_title = "References"
+    writer.heading("References", level=1)
+    entries_per_page = 12
+    for entry in _bibliography_entries(rng, bibliography_pages * entries_per_page):
+        writer.write(entry, gap=6)
+
+    doc.set_toc([[level, title, page] for level, title, page in writer.toc])
+    output_path = str(Path(output_path))
+    doc.save(output_path)
+    doc.close()
+    return output_path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic thesis PDF")
+    parser.add_argument("output", help="Output PDF path")
+    parser.add_argument("--pages", type=int, default=10, help="Target page count")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    path = create_synthetic_thesis(args.output, args.pages, args.seed)
+    with fitz.open(path) as generated:
+        print(f"Created {path} ({len(generated)} pages)")
@@ -0,0 +1,218 @@
+"""Batch analysis of many PDFs sharing one block scheduler and rate-limit budget."""
+
+import glob
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from .config import get_settings, get_dspy_config, get_request_controller, initialize_system
+from .data_models import BatchDocumentResult, BatchSummary
+from .pipeline import AnalysisProgress, calculate_llm_usage, create_analysis_pipeline
+from .scheduler import FairScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def collect_batch_inputs(source: str) -> List[Path]:
+    """
+    Resolve a directory or glob pattern to the PDF files it contains.
+
+    Args:
+        source: Directory (its PDFs are used, not recursively) or glob
+            pattern such as ``theses/**/*.pdf``
+
+    Returns:
+        Sorted list of PDF paths
+    """
+    path = Path(source)
+    if path.is_dir():
+        candidates = path.glob("*")
+    else:
+        candidates = (Path(match) for match in glob.glob(source, recursive=True))
+    return sorted(
+        candidate for candidate in candidates
+        if candidate.is_file() and candidate.suffix.lower() == '.pdf'
+    )
+
+
+class BatchAnalyzer:
+    """Analyzes many documents at once with blocks interleaved on one scheduler."""
+
+    def __init__(
+        self,
+        output_directory: str,
+        citation_style: str = "APA",
+        context: str = "academic thesis",
+        max_active_documents: Optional[int] = None,
+        resume: bool = False
+    ):
+        """
+        Initialize the batch analyzer.
+
+        Args:
+            output_directory: Directory for per-document reports and the batch summary
+            citation_style: Expected citation style of all documents
+            context: Document context for content analysis
+            max_active_documents: Documents prepared and analyzed concurrently
+                (defaults to the BATCH_MAX_DOCUMENTS setting)
+            resume: Resume documents from checkpoints of an interrupted batch
+        """
+        self.settings = get_settings()
+        self.output_directory = output_directory
+        self.citation_style = citation_style
+        self.context = context
+        self.max_active_documents = max(1, max_active_documents or self.settings.batch_max_documents)
+        self.resume = resume
+
+    def run(
+        self,
+        pdf_paths: List[Path],
+        on_progress: Optional[Callable[[Path, AnalysisProgress], None]] = None,
+        on_document_complete: Optional[Callable[[BatchDocumentResult], None]] = None
+    ) -> BatchSummary:
+        """
+        Analyze all documents and summarize the batch.
+
+        Each document's report is saved as soon as it completes. Block
+        analyses of all active documents share one worker pool of
+        MAX_CONCURRENT_REQUESTS workers served round-robin, and all LLM calls
+        share the process-wide rate limiter.
+
+        Args:
+            pdf_paths: Documents to analyze
+            on_progress: Called from worker threads with every progress event
+            on_document_complete: Called when a document completes or fails
+
+        Returns:
+            BatchSummary with per-document outcomes and throughput statistics
+        """
+        initialize_system()
+        # Token usage is counted for the whole batch, from a cleared LLM history
+        calculate_llm_usage(self.settings)
+        request_stats_before = get_request_controller().get_stats()
+        connection_stats_before = get_dspy_config().get_connection_stats()
+
+        summary = BatchSummary(
+            max_active_documents=self.max_active_documents,
+            max_concurrent_requests=self.settings.max_concurrent_requests
+        )
+        start = time.perf_counter()
+        logger.info(
+            f"Starting batch of {len(pdf_paths)} documents "
+            f"({self.max_active_documents} active, {self.settings.max_concurrent_requests} concurrent requests)"
+        )
+
+        scheduler = FairScheduler(self.settings.max_concurrent_requests)
+        documents = ThreadPoolExecutor(max_workers=self.max_active_documents, thread_name_prefix="batch-document")
+        try:
+            futures = [
+                documents.submit(self._analyze_document, pdf_path, scheduler, on_progress)
+                for pdf_path in pdf_paths
+            ]
+            for future in as_completed(futures):
+                document = future.result()
+                summary.documents.append(document)
+                if on_document_complete:
+                    on_document_complete(document)
+        except BaseException:
+            documents.shutdown(wait=False, cancel_futures=True)
+            scheduler.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            documents.shutdown(wait=True)
+            scheduler.shutdown(wait=True)
+
+        summary.wall_time_seconds = round(time.perf_counter() - start, 4)
+        token_usage, estimated_cost = calculate_llm_usage(self.settings)
+        summary.token_usage = token_usage or None
+        summary.estimated_cost = estimated_cost
+        summary.request_stats = {
+            **get_request_controller().get_stats().since(request_stats_before).to_dict(),
+            **get_dspy_config().get_connection_stats().since(connection_stats_before).to_dict(),
+        }
+
+        logger.info(
+            f"Batch completed in {summary.wall_time_seconds:.1f}s: {summary.documents_completed} completed, "
+            f"{summary.documents_failed} failed"
+        )
+        return summary
+
+    def _analyze_document(
+        self,
+        pdf_path: Path,
+        scheduler: FairScheduler,
+        on_progress: Optional[Callable[[Path, AnalysisProgress], None]]
+    ) -> BatchDocumentResult:
+        """Analyze one document of the batch, turning a failure into a failed result."""
+        start = time.perf_counter()
+        # Usage counters are process-wide, so they are collected for the whole batch instead
+        pipeline = create_analysis_pipeline(block_scheduler=scheduler, report_usage=False)
+
+        try:
+            final = None
+            for progress in pipeline.stream_analysis(
+                str(pdf_path),
+                self.output_directory,
+                citation_style=self.citation_style,
+                context=self.context,
+                resume=self.resume
+            ):
+                if on_progress:
+                    on_progress(pdf_path, progress)
+                final = progress
+
+            report = final.report
+            return BatchDocumentResult(
+                document_name=pdf_path.name,
+                document_path=str(pdf_path),
+                status="completed",
+                total_pages=report.total_pages,
+                total_text_blocks=report.total_text_blocks,
+                total_errors=report.total_errors,
+                processing_time_seconds=round(time.perf_counter() - start, 4),
+                report_path=final.report_path
+            )
+        except Exception as e:
+            logger.error(f"Batch analysis of {pdf_path.name} failed: {e}")
+            return BatchDocumentResult(
+                document_name=pdf_path.name,
+                document_path=str(pdf_path),
+                status="failed",
+                processing_time_seconds=round(time.perf_counter() - start, 4),
+                error_message=str(e)
+            )
+
+
+def save_batch_summary(summary: BatchSummary, output_directory: str) -> Path:
+    """
+    Write the batch summary with totals and throughput as JSON.
+
+    Args:
+        summary: Summary of a finished batch
+        output_directory: Directory to write to
+
+    Returns:
+        Path of the summary file
+    """
+    output_path = Path(output_directory)
+    output_path.mkdir(parents=True, exist_ok=True)
+    summary_path = output_path / f"batch_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+    data = summary.model_dump(mode='json')
+    data.update({
+        'documents_completed': summary.documents_completed,
+        'documents_failed': summary.documents_failed,
+        'total_pages': summary.total_pages,
+        'total_text_blocks': summary.total_text_blocks,
+        'total_errors': summary.total_errors,
+        'throughput': summary.throughput(),
+    })
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+    logger.info(f"Batch summary saved to: {summary_path}")
+    return summary_path
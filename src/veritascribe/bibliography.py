@@ -0,0 +1,213 @@
+"""Location of the bibliography section by the document outline or its heading line."""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from .sections import NUMBERED_HEADING_PATTERN
+from .text_cleaning import clean_extracted_text
+
+logger = logging.getLogger(__name__)
+
+# Optional chapter numbering ("7", "7.1.", "A") in front of a heading
+_NUMBERING = r'(?:(\d+(?:\.\d+)*)\.?\s+|[A-Z]\.?\s+)?'
+
+# A line that is nothing but a bibliography title (English, German, French)
+BIBLIOGRAPHY_TITLE_PATTERN = re.compile(
+    rf'^{_NUMBERING}'
+    r'(?:references|bibliography|list\s+of\s+references|works\s+cited|sources|literature'
+    r'|literatur|literaturverzeichnis|quellen|quellenverzeichnis'
+    r'|références(?:\s+bibliographiques)?|bibliographie)\s*:?$',
+    re.IGNORECASE
+)
+
+# Unnumbered back matter that commonly follows the bibliography
+BACK_MATTER_TITLE_PATTERN = re.compile(
+    rf'^{_NUMBERING}'
+    r'(?:appendix|appendices|anhang|annexes?|glossary|glossar|index'
+    r'|declaration(?:\s+of\s+\w+)*|affidavit|(?:eidesstattliche\s+)?erklärung|déclaration'
+    r'|curriculum\s+vitae|lebenslauf)(?:\s+(?:[A-Z]|[IVX]+|\d+))?\s*:?$',
+    re.IGNORECASE
+)
+
+# Headings are short lines
+_MAX_HEADING_LENGTH = 100
+
+
+@dataclass
+class BibliographyLocation:
+    """Where the bibliography lies in the plain page texts of a document."""
+    # 1-indexed page of the bibliography heading
+    first_page: int
+    # Index of the heading line in the first page's text lines
+    first_line: int
+    # 1-indexed last page with bibliography text
+    last_page: int
+    # Index of the line on the last page where the next section starts (None: page end)
+    end_line: Optional[int]
+    # "outline" or "heading", whichever located the bibliography
+    source: str
+
+    @property
+    def pages(self) -> List[int]:
+        """1-indexed pages the bibliography spans."""
+        return list(range(self.first_page, self.last_page + 1))
+
+
+def _strip_numbering(title: str) -> str:
+    return re.sub(r'^\d+(?:\.\d+)*\.?\s+', '', title.strip()).casefold()
+
+
+def _numbering(title: str) -> Optional[Tuple[int, ...]]:
+    match = re.match(r'^(\d+(?:\.\d+)*)\.?\s', title.strip())
+    return tuple(int(part) for part in match.group(1).split('.')) if match else None
+
+
+def _find_line(lines: List[str], matches: Callable[[str], bool], start: int = 0) -> Optional[int]:
+    """Index of the first heading-length line from ``start`` on that matches."""
+    for index in range(start, len(lines)):
+        line = lines[index].strip()
+        if line and len(line) <= _MAX_HEADING_LENGTH and matches(line):
+            return index
+    return None
+
+
+def _locate_by_outline(
+    outline: List[list],
+    page_count: int,
+    page_text: Callable[[int], str]
+) -> Optional[BibliographyLocation]:
+    """Locate the bibliography by the last outline entry titled like one."""
+    for position in range(len(outline) - 1, -1, -1):
+        level, title, page = outline[position][:3]
+        if 1 <= page <= page_count and BIBLIOGRAPHY_TITLE_PATTERN.match(title.strip()):
+            break
+    else:
+        return None
+
+    first_line = _find_line(
+        page_text(page).splitlines(),
+        lambda line: _strip_numbering(line) == _strip_numbering(title)
+    ) or 0
+
+    # The bibliography ends where the next section of the same or a higher level starts
+    for next_level, next_title, next_page in (entry[:3] for entry in outline[position + 1:]):
+        if next_level <= level and 1 <= next_page <= page_count:
+            break
+    else:
+        return BibliographyLocation(page, first_line, page_count, None, "outline")
+
+    next_page = max(page, next_page)
+    lines = page_text(next_page).splitlines()
+    end_line = _find_line(
+        lines,
+        lambda line: _strip_numbering(line) == _strip_numbering(next_title),
+        start=first_line + 1 if next_page == page else 0
+    )
+    if end_line is None or (end_line == 0 and next_page > page):
+        # The next section starts with its page
+        return BibliographyLocation(page, first_line, max(page, next_page - 1), None, "outline")
+    return BibliographyLocation(page, first_line, next_page, end_line, "outline")
+
+
+def _locate_by_heading(page_count: int, page_text: Callable[[int], str]) -> Optional[BibliographyLocation]:
+    """
+    Locate the bibliography by scanning pages backwards for its heading line.
+
+    Running headers repeat the title on every bibliography page, so the
+    scan continues backwards while pages carry it and takes the first one.
+    """
+    start: Optional[Tuple[int, int]] = None
+    for page in range(page_count, 0, -1):
+        line = _find_line(page_text(page).splitlines(), BIBLIOGRAPHY_TITLE_PATTERN.match)
+        if line is not None:
+            start = (page, line)
+        elif start:
+            break
+    if not start:
+        return None
+
+    first_page, first_line = start
+    heading = page_text(first_page).splitlines()[first_line]
+    numbering = _numbering(heading)
+
+    def ends_bibliography(line: str) -> bool:
+        if BACK_MATTER_TITLE_PATTERN.match(line):
+            return True
+        # Only numbered bibliographies are ended by a numbered heading, and only
+        # by the one following it ("8" or "8.1" after "7.3"), since numbered
+        # reference entries look like headings too
+        if numbering and NUMBERED_HEADING_PATTERN.match(line):
+            next_numbering = _numbering(line)
+            depth = len(next_numbering)
+            return (
+                depth <= len(numbering)
+                and next_numbering[:-1] == numbering[:depth - 1]
+                and next_numbering[-1] == numbering[depth - 1] + 1
+            )
+        return False
+
+    for page in range(first_page, page_count + 1):
+        end_line = _find_line(
+            page_text(page).splitlines(),
+            ends_bibliography,
+            start=first_line + 1 if page == first_page else 0
+        )
+        if end_line is None:
+            continue
+        if end_line == 0 and page > first_page:
+            return BibliographyLocation(first_page, first_line, page - 1, None, "heading")
+        return BibliographyLocation(first_page, first_line, page, end_line, "heading")
+    return BibliographyLocation(first_page, first_line, page_count, None, "heading")
+
+
+def locate_bibliography(
+    outline: List[list],
+    page_count: int,
+    page_text: Callable[[int], str]
+) -> Optional[BibliographyLocation]:
+    """
+    Locate the bibliography section of a document.
+
+    The outline entry titled like a bibliography is used when there is one;
+    otherwise pages are scanned backwards from the end for a line that is
+    only a bibliography title. The section ends where the next section of
+    the same or a higher level starts. Only the pages needed are read.
+
+    Args:
+        outline: Document outline as returned by ``fitz.Document.get_toc()``
+        page_count: Number of pages in the document
+        page_text: Returns the plain text of a 1-indexed page
+
+    Returns:
+        BibliographyLocation, or None if the document has no bibliography heading
+    """
+    location = _locate_by_outline(outline, page_count, page_text) if outline else None
+    if location is None:
+        location = _locate_by_heading(page_count, page_text)
+    if location:
+        logger.debug(
+            f"Bibliography on pages {location.first_page}-{location.last_page} (located by {location.source})"
+        )
+    return location
+
+
+def bibliography_text(location: BibliographyLocation, page_text: Callable[[int], str]) -> str:
+    """
+    Cleaned text of a located bibliography, from its heading to the next section.
+
+    Args:
+        location: Location from ``locate_bibliography``
+        page_text: Returns the plain text of a 1-indexed page
+
+    Returns:
+        Cleaned bibliography text, one line per page
+    """
+    page_parts = []
+    for page in location.pages:
+        lines = page_text(page).splitlines()
+        start = location.first_line if page == location.first_page else 0
+        end = location.end_line if page == location.last_page else None
+        page_parts.append(clean_extracted_text("\n".join(lines[start:end])))
+    return "\n".join(part for part in page_parts if part)
@@ -0,0 +1,229 @@
+"""Local classification of extracted blocks into prose, tables, formulas, code and references."""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+
+from .data_models import BlockKind
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[float, float, float, float]
+
+# Whitespace-delimited numbers as they appear in tables: "102", "-0.94",
+# "3,5%", "(0.136)", "±2.1"
+_NUMBER_TOKEN_PATTERN = re.compile(r'(?<!\S)[(\[]?[-+−±]?\d[\d.,]*%?[)\]]?[.,;:*]*(?!\S)')
+
+# Whitespace-delimited words of at least three letters, with punctuation around them
+_WORD_TOKEN_PATTERN = re.compile(r'(?<!\S)["\'(\[]?[^\W\d_]{3,}[.,;:!?)\]"\']*(?!\S)')
+
+# Relations and operators that make a block with few words a formula
+_MATH_RELATION_PATTERN = re.compile(r'[=<>≤≥≈≠∑∏∫√∂∇]')
+
+# End of a sentence, possibly followed by closing quotes or brackets
+_SENTENCE_END_PATTERN = re.compile(r'[.!?]["\'’”)\]]*$')
+
+_CODE_KEYWORD_PATTERN = re.compile(
+    r'\b(?:def|return|import|class|public|private|static|void|function|const|let|var'
+    r'|elif|while|print|printf|include|SELECT|FROM|WHERE)\b'
+)
+_CODE_SYMBOLS = '{}[];=<>'
+
+# One bibliography entry: "Smith, J., & Doe, A. B. (2020)." or "[3] Müller, K. (n.d.)."
+_REFERENCE_ENTRY_PATTERN = re.compile(
+    r"(?:^|\s)(?:\[\d+\]\s*)?[A-ZÄÖÜ][\w'’-]+,\s(?:[A-ZÄÖÜ]\.\s?-?)+"
+    r"[^()]{0,200}?\((?:\d{4}[a-z]?|n\.\s?d\.)\)\."
+)
+
+# PyMuPDF span flag of monospaced fonts
+_MONOSPACE_FLAG = 8
+_MONOSPACE_FONT_NAMES = ('courier', 'mono', 'consol', 'menlo')
+
+# Table thresholds: share of tokens that are numbers, and how many at least
+TABLE_NUMBER_RATIO = 0.4
+TABLE_MIN_NUMBERS = 4
+
+# Formulas: share of tokens that are plain words, below which a relation makes a formula,
+# and how many plain words at most
+MATH_MAX_WORD_RATIO = 0.5
+MATH_MAX_WORDS = 3
+
+# Sentences: plain words that, with a sentence end, make a block read as prose
+SENTENCE_MIN_WORDS = 4
+
+# Grids: lines with this many numbers at least, as many as the next, form table rows
+GRID_MIN_NUMBERS_PER_ROW = 2
+GRID_MIN_ROWS = 2
+
+# Code: share of characters that are code symbols, together with a keyword
+CODE_SYMBOL_RATIO = 0.04
+
+# References: at least one entry per this many characters, starting the block;
+# a block with fewer entries than this must be a single entry of at most that length
+REFERENCE_CHARS_PER_ENTRY = 400
+REFERENCE_MIN_ENTRIES = 2
+
+
+def _monospace_ratio(block: Dict[str, Any]) -> Optional[float]:
+    """Share of a "dict" block's characters set in a monospaced font, None without font data ("blocks" mode)."""
+    total = monospace = 0
+    for line in block.get("lines", []):
+        for span in line.get("spans", []):
+            if "font" not in span:
+                return None
+            characters = len(span.get("text", "").strip())
+            total += characters
+            if span.get("flags", 0) & _MONOSPACE_FLAG or span["font"].lower().startswith(_MONOSPACE_FONT_NAMES):
+                monospace += characters
+    return monospace / total if total else None
+
+
+def _reads_as_sentence(text: str, word_count: int) -> bool:
+    """Whether a block has enough words and a sentence end to be prose, however many numbers it holds."""
+    return word_count >= SENTENCE_MIN_WORDS and bool(_SENTENCE_END_PATTERN.search(text))
+
+
+def _is_grid(block: Dict[str, Any]) -> bool:
+    """Whether a block's lines are rows holding the same number of numbers, with no more words than numbers."""
+    run = 0
+    previous_count = None
+    for line in block.get("lines", []):
+        line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+        number_count = len(_NUMBER_TOKEN_PATTERN.findall(line_text))
+        is_row = (
+            number_count >= GRID_MIN_NUMBERS_PER_ROW
+            and len(_WORD_TOKEN_PATTERN.findall(line_text)) <= number_count
+        )
+        if not is_row:
+            run = 0
+            previous_count = None
+            continue
+        run = run + 1 if number_count == previous_count else 1
+        previous_count = number_count
+        if run >= GRID_MIN_ROWS:
+            return True
+    return False
+
+
+def _center_in_regions(box: Optional[Box], regions: Sequence[Box]) -> bool:
+    if not box:
+        return False
+    x = (box[0] + box[2]) / 2
+    y = (box[1] + box[3]) / 2
+    return any(x0 <= x <= x1 and y0 <= y <= y1 for x0, y0, x1, y1 in regions)
+
+
+class BlockClassifier:
+    """
+    Labels blocks as prose, table, math, code or reference from their text and layout.
+
+    Tables are blocks inside a table region found by ``page.find_tables()``
+    or made up of numbers; code is set in a monospaced font or dense with
+    code symbols and keywords (fonts are only known when pages are read in
+    "dict" mode, so in the default "blocks" mode code detection is purely
+    lexical); formulas hold a relation among few words;
+    references are runs of bibliography entries. Number-heavy blocks that
+    read as sentences, such as reported statistics ("t(98) = 2.31, p < .05"),
+    are only tables when their lines form a grid and never formulas.
+    Everything else is prose.
+    All checks are local and cost microseconds per block, except locating
+    table regions, which takes about 0.1s per page and is only done on
+    pages with number-heavy lines.
+    """
+
+    def __init__(self, detect_table_regions: bool = False):
+        """
+        Initialize the classifier.
+
+        Args:
+            detect_table_regions: Locate ruled and aligned tables with
+                ``page.find_tables()`` on pages that may contain tables
+        """
+        self.detect_table_regions = detect_table_regions
+
+    def table_regions(self, page: fitz.Page, text_dict: Dict[str, Any]) -> List[Box]:
+        """
+        Locate the tables of a page, if enabled and any line looks tabular.
+
+        Args:
+            page: PyMuPDF page
+            text_dict: The page's ``"dict"``-shaped layout
+
+        Returns:
+            Bounding boxes of the page's tables
+        """
+        if not self.detect_table_regions or not self._has_tabular_line(text_dict):
+            return []
+        try:
+            return [tuple(table.bbox) for table in page.find_tables().tables]
+        except Exception as e:
+            logger.warning(f"Error locating tables on page {page.number + 1}: {e}")
+            return []
+
+    def _has_tabular_line(self, text_dict: Dict[str, Any]) -> bool:
+        for block in text_dict.get("blocks", []):
+            for line in block.get("lines", []):
+                line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+                if len(_NUMBER_TOKEN_PATTERN.findall(line_text)) >= 2:
+                    return True
+        return False
+
+    def classify(
+        self,
+        text: str,
+        block: Optional[Dict[str, Any]] = None,
+        table_regions: Sequence[Box] = ()
+    ) -> BlockKind:
+        """
+        Classify the cleaned text of a block.
+
+        Args:
+            text: Cleaned block text
+            block: The block's ``"dict"`` entry, for its position and fonts
+            table_regions: Table bounding boxes on the block's page
+
+        Returns:
+            BlockKind of the block
+        """
+        token_count = len(text.split())
+        if not token_count:
+            return BlockKind.PROSE
+
+        if table_regions and block and _center_in_regions(block.get("bbox"), table_regions):
+            return BlockKind.TABLE
+
+        # Tokens are counted by C-level pattern scans rather than per token in Python
+        number_count = len(_NUMBER_TOKEN_PATTERN.findall(text))
+        number_ratio = number_count / token_count
+        word_count = len(_WORD_TOKEN_PATTERN.findall(text))
+        is_sentence = _reads_as_sentence(text, word_count)
+        if number_ratio >= TABLE_NUMBER_RATIO and number_count >= TABLE_MIN_NUMBERS:
+            if not is_sentence or (block and _is_grid(block)):
+                return BlockKind.TABLE
+
+        monospace_ratio = _monospace_ratio(block) if block else None
+        if monospace_ratio is not None and monospace_ratio >= 0.8:
+            # Tables are often set in a monospaced font too
+            return BlockKind.TABLE if number_ratio >= TABLE_NUMBER_RATIO / 2 else BlockKind.CODE
+
+        symbol_count = sum(text.count(symbol) for symbol in _CODE_SYMBOLS)
+        if symbol_count >= CODE_SYMBOL_RATIO * len(text) and _CODE_KEYWORD_PATTERN.search(text):
+            return BlockKind.CODE
+
+        if (
+            _MATH_RELATION_PATTERN.search(text)
+            and not is_sentence
+            and word_count <= MATH_MAX_WORDS
+            and word_count / token_count < MATH_MAX_WORD_RATIO
+        ):
+            return BlockKind.MATH
+
+        if _REFERENCE_ENTRY_PATTERN.match(text):
+            entries = len(_REFERENCE_ENTRY_PATTERN.findall(text))
+            is_single_entry = len(text) <= REFERENCE_CHARS_PER_ENTRY
+            if (entries >= REFERENCE_MIN_ENTRIES or is_single_entry) and entries * REFERENCE_CHARS_PER_ENTRY >= len(text):
+                return BlockKind.REFERENCE
+
+        return BlockKind.PROSE
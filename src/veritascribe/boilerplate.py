@@ -0,0 +1,156 @@
+"""Detection of running headers, footers and other text repeated in page margins."""
+
+import logging
+import re
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .chunking import RawBlock
+from .incremental import normalize_block_text
+
+logger = logging.getLogger(__name__)
+
+# Repeats are counted on this many pages before and after a block's page
+NEIGHBOR_PAGES = 5
+
+_NUMBER_PATTERN = re.compile(r'\d+')
+
+
+def margin_text_key(text: str) -> str:
+    """Normalize block text so that running headers with changing page numbers compare equal."""
+    return _NUMBER_PATTERN.sub('#', normalize_block_text(text))
+
+
+class RepeatedMarginDetector:
+    """
+    Flags blocks whose text recurs in the same page margin on nearby pages.
+
+    A block in the top or bottom margin band of its page is a repeat when
+    text equal to it up to numbers (running titles, chapter headers,
+    university names with page numbers) lies in the same band on at least
+    ``min_pages`` pages within ``window`` pages of it. Body text and
+    one-off footnotes never qualify.
+    """
+
+    def __init__(self, margin_fraction: float = 0.12, min_pages: int = 3, window: int = NEIGHBOR_PAGES):
+        """
+        Initialize the detector.
+
+        Args:
+            margin_fraction: Height of the top and bottom margin bands as a
+                fraction of the page height
+            min_pages: Pages (the block's own included) the text must appear on
+            window: Pages before and after a block's page that are searched
+        """
+        self.margin_fraction = margin_fraction
+        self.min_pages = max(2, min_pages)
+        self.window = max(1, window)
+
+    def find_repeated(self, blocks: Sequence[RawBlock], page_heights: Dict[int, float]) -> np.ndarray:
+        """
+        Flag the repeated margin blocks among the blocks of consecutive pages.
+
+        Args:
+            blocks: Blocks of all pages to consider
+            page_heights: Height of every page by 1-indexed page number
+
+        Returns:
+            Boolean array, True for blocks that are repeats
+        """
+        repeated = np.zeros(len(blocks), dtype=bool)
+        if not blocks:
+            return repeated
+
+        boxes = np.array([block.bounding_box or (0.0, 0.0, 0.0, 0.0) for block in blocks], dtype=float)
+        has_box = np.array([block.bounding_box is not None for block in blocks])
+        pages = np.array([block.page_number for block in blocks], dtype=np.int64)
+        heights = np.array([page_heights.get(block.page_number, 0.0) for block in blocks], dtype=float)
+
+        band = heights * self.margin_fraction
+        in_top = has_box & (boxes[:, 3] <= band)
+        in_bottom = has_box & (boxes[:, 1] >= heights - band)
+        candidates = np.flatnonzero(in_top | in_bottom)
+        if len(candidates) < self.min_pages:
+            return repeated
+
+        # One group per text and band
+        groups: Dict[Tuple[str, bool], int] = {}
+        group_ids = np.array([
+            groups.setdefault((margin_text_key(blocks[i].content), bool(in_bottom[i])), len(groups))
+            for i in candidates
+        ], dtype=np.int64)
+
+        # Group and page in one sortable number; pages of different groups are
+        # more than a window apart, so windows never reach into another group
+        span = int(pages.max()) + self.window + 1
+        keys = group_ids * span + pages[candidates]
+        occurrences = np.unique(keys)
+        counts = (
+            np.searchsorted(occurrences, keys + self.window, side='right')
+            - np.searchsorted(occurrences, keys - self.window, side='left')
+        )
+        repeated[candidates] = counts >= self.min_pages
+        return repeated
+
+    def remove_repeated(self, blocks: List[RawBlock], page_heights: Dict[int, float]) -> List[RawBlock]:
+        """
+        Drop the repeated margin blocks of a whole document.
+
+        Args:
+            blocks: Blocks of all pages in document order
+            page_heights: Height of every page by 1-indexed page number
+
+        Returns:
+            Blocks that are not repeats
+        """
+        repeated = self.find_repeated(blocks, page_heights)
+        if repeated.any():
+            logger.info(f"Dropped {int(repeated.sum())} running headers, footers and other repeated margin blocks")
+        return [block for block, is_repeat in zip(blocks, repeated) if not is_repeat]
+
+    def iter_pages(
+        self,
+        pages: Iterable[Tuple[int, float, List[RawBlock]]]
+    ) -> Iterator[Tuple[int, List[RawBlock]]]:
+        """
+        Drop repeated margin blocks from a stream of pages.
+
+        Each page is released once the pages within the window after it have
+        been read, so at most ``window`` pages are held back. The result
+        equals ``remove_repeated`` on the whole document.
+
+        Args:
+            pages: (1-indexed page number, page height, blocks) in page order
+
+        Yields:
+            (page number, blocks without repeats) in page order
+        """
+        buffered: Deque[Tuple[int, float, List[RawBlock]]] = deque()
+        pending = 0  # Index into buffered of the next page to release
+
+        def release(page_index: int) -> Tuple[int, List[RawBlock]]:
+            page_number, _, page_blocks = buffered[page_index]
+            window_pages = [page for page in buffered if abs(page[0] - page_number) <= self.window]
+            window_blocks = [block for page in window_pages for block in page[2]]
+            repeated = self.find_repeated(window_blocks, {page[0]: page[1] for page in window_pages})
+            start = sum(len(page[2]) for page in window_pages if page[0] < page_number)
+            return page_number, [
+                block for block, is_repeat in zip(page_blocks, repeated[start:start + len(page_blocks)])
+                if not is_repeat
+            ]
+
+        for page in pages:
+            buffered.append(page)
+            while pending < len(buffered) and page[0] - buffered[pending][0] > self.window:
+                yield release(pending)
+                pending += 1
+            # Pages more than a window before the next page to release are no longer needed
+            while pending and buffered[pending][0] - buffered[0][0] > self.window:
+                buffered.popleft()
+                pending -= 1
+
+        while pending < len(buffered):
+            yield release(pending)
+            pending += 1
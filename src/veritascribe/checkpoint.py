@@ -0,0 +1,177 @@
+"""Durable per-block checkpoints so interrupted analyses can be resumed."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+from .data_models import AnalysisResult
+from .pdf_processor import compute_pdf_hash
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+def compute_checkpoint_key(pdf_hash: str, configuration: Dict[str, Any]) -> str:
+    """
+    Derive the checkpoint key from the document and the analysis configuration.
+
+    Args:
+        pdf_hash: SHA-256 hash of the PDF file
+        configuration: Settings that influence block extraction or analysis
+
+    Returns:
+        Hex digest identifying the checkpoint
+    """
+    payload = json.dumps(
+        {'pdf_hash': pdf_hash, 'configuration': configuration, 'version': CHECKPOINT_FORMAT_VERSION},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class AnalysisCheckpoint:
+    """Append-only JSONL file of completed block results for one document and configuration."""
+
+    def __init__(self, path: Path, key: str, document_name: str = ""):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: Location of the JSONL checkpoint file
+            key: Checkpoint key stored in the header line
+            document_name: Name of the analyzed document, for diagnostics
+        """
+        self.path = Path(path)
+        self.key = key
+        self.document_name = document_name
+        self._file = None
+        self._lock = threading.Lock()
+        # Byte offset after the last complete, valid line
+        self._valid_size = 0
+
+    @classmethod
+    def for_document(
+        cls,
+        pdf_path: str,
+        configuration: Dict[str, Any],
+        directory: str
+    ) -> "AnalysisCheckpoint":
+        """
+        Create the checkpoint for a PDF analyzed with the given configuration.
+
+        Args:
+            pdf_path: Path to the PDF file
+            configuration: Settings that influence block extraction or analysis
+            directory: Directory holding checkpoint files
+
+        Returns:
+            AnalysisCheckpoint (the file is only created once opened)
+        """
+        key = compute_checkpoint_key(compute_pdf_hash(pdf_path), configuration)
+        path = Path(directory) / f"{Path(pdf_path).stem}_{key[:16]}.jsonl"
+        return cls(path, key, Path(pdf_path).name)
+
+    def load(self) -> Dict[int, AnalysisResult]:
+        """
+        Read completed results from an existing checkpoint.
+
+        A truncated last line, as left behind by a crash during a write, is
+        ignored. Failed block analyses are not returned so they are retried.
+
+        Returns:
+            Mapping of block index to completed AnalysisResult
+        """
+        results: Dict[int, AnalysisResult] = {}
+        self._valid_size = 0
+        if not self.path.exists():
+            return results
+
+        with open(self.path, 'rb') as f:
+            header_line = f.readline()
+            try:
+                header = json.loads(header_line)
+            except ValueError:
+                header = {}
+            if header.get('checkpoint_key') != self.key or not header_line.endswith(b'\n'):
+                logger.warning(f"Ignoring checkpoint with mismatching key: {self.path}")
+                return results
+            self._valid_size = len(header_line)
+
+            for line in f:
+                if not line.endswith(b'\n'):
+                    logger.warning(f"Discarding incomplete last entry of checkpoint {self.path.name}")
+                    break
+                try:
+                    result = AnalysisResult.model_validate_json(line)
+                except ValueError:
+                    logger.warning(f"Discarding corrupted entry of checkpoint {self.path.name}")
+                    break
+                self._valid_size += len(line)
+                if not result.analysis_failed:
+                    results[result.text_block.block_index] = result
+
+        logger.info(f"Loaded {len(results)} completed blocks from checkpoint {self.path.name}")
+        return results
+
+    def open(self, resume: bool = False) -> None:
+        """
+        Open the checkpoint for appending.
+
+        Args:
+            resume: Keep the results already in the checkpoint (``load`` must
+                have been called) instead of starting a new one
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if resume and self._valid_size:
+            self._file = open(self.path, 'r+b')
+            # Drop a partially written trailing entry before appending
+            self._file.truncate(self._valid_size)
+            self._file.seek(self._valid_size)
+            return
+
+        self._file = open(self.path, 'wb')
+        header = {
+            'checkpoint_key': self.key,
+            'document_name': self.document_name,
+            'version': CHECKPOINT_FORMAT_VERSION,
+        }
+        self._write_line(json.dumps(header).encode('utf-8'))
+
+    def append(self, result: AnalysisResult) -> None:
+        """
+        Durably append a completed block result.
+
+        Args:
+            result: Result of one analyzed block
+        """
+        if self._file is None:
+            return
+        self._write_line(result.model_dump_json().encode('utf-8'))
+
+    def _write_line(self, data: bytes) -> None:
+        with self._lock:
+            self._file.write(data + b'\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the checkpoint file, keeping it on disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the checkpoint after a successful analysis."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
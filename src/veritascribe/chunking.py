@@ -0,0 +1,241 @@
+"""Token-budget-aware coalescing and splitting of extracted text blocks."""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .data_models import BlockKind, TextBlock
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English and German prose with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+# Blocks are only split once they exceed the target by this factor, so that
+# slightly long paragraphs are not cut into one full and one tiny chunk
+SPLIT_TOLERANCE = 1.5
+
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate token count (at least 1 for non-empty text)
+    """
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _union_bounding_box(
+    boxes: List[Optional[Tuple[float, float, float, float]]]
+) -> Optional[Tuple[float, float, float, float]]:
+    """Return the bounding box enclosing all given boxes."""
+    boxes = [box for box in boxes if box]
+    if not boxes:
+        return None
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+@dataclass(slots=True)
+class RawBlock:
+    """
+    A block as read from a page, before filtering and chunking.
+
+    Pages yield several raw blocks per analysis block, and raw blocks are
+    sent back from extraction worker processes, so they are plain slotted
+    objects; only the chunks built from them become validated ``TextBlock``
+    models.
+    """
+    content: str
+    page_number: int
+    bounding_box: Optional[Tuple[float, float, float, float]]
+    # Document-wide index of the block among the raw blocks
+    block_index: int
+    kind: BlockKind = BlockKind.PROSE
+    section_path: List[str] = field(default_factory=list)
+
+
+class BlockChunker:
+    """Merges small adjacent blocks and splits oversized ones to a token target."""
+
+    def __init__(self, target_tokens: int, max_chars: int, coalesce: bool = True):
+        """
+        Initialize the chunker.
+
+        Args:
+            target_tokens: Token target per analysis block
+            max_chars: Hard upper limit of characters per block
+            coalesce: Whether adjacent small blocks should be merged
+        """
+        self.target_tokens = max(1, target_tokens)
+        self.max_chars = max(1, max_chars)
+        self.coalesce = coalesce
+        # Character budget corresponding to the token target
+        self.target_chars = min(self.target_tokens * CHARS_PER_TOKEN, self.max_chars)
+
+    def chunk(self, blocks: List[RawBlock], first_index: int = 0) -> List[TextBlock]:
+        """
+        Coalesce and split raw blocks into analysis blocks in document order.
+
+        Args:
+            blocks: Raw blocks in document order with unique block indices
+            first_index: Block index assigned to the first resulting block
+
+        Returns:
+            Blocks sized to the token target with sequential integer block
+            indices; provenance is kept in ``source_block_indices`` and, for
+            split chunks, ``parent_block_index``
+        """
+        chunks: List[TextBlock] = []
+        # Blocks of each kind are coalesced in their own run, so a table or
+        # formula between two paragraphs does not split the prose around it
+        pending: Dict[BlockKind, List[RawBlock]] = {}
+        pending_chars: Dict[BlockKind, int] = {}
+
+        def flush(kind: BlockKind) -> None:
+            blocks_of_kind = pending.pop(kind, None)
+            if blocks_of_kind:
+                chunks.append(self._merge(blocks_of_kind))
+            pending_chars.pop(kind, None)
+
+        for block in blocks:
+            if self._is_oversized(block):
+                flush(block.kind)
+                chunks.extend(self._split(block))
+                continue
+
+            if not self.coalesce:
+                chunks.append(self._merge([block]))
+                continue
+
+            run = pending.get(block.kind)
+            # Separator adds two characters between merged blocks
+            merged_chars = pending_chars.get(block.kind, 0) + (2 if run else 0) + len(block.content)
+            if run and (not self._can_merge(run[-1], block) or merged_chars > self.target_chars):
+                flush(block.kind)
+                merged_chars = len(block.content)
+
+            pending.setdefault(block.kind, []).append(block)
+            pending_chars[block.kind] = merged_chars
+
+        for kind in list(pending):
+            flush(kind)
+
+        # Runs of different kinds complete out of order
+        chunks.sort(key=lambda chunk: chunk.source_block_indices[0])
+
+        for index, chunk in enumerate(chunks, start=first_index):
+            chunk.block_index = index
+
+        if len(chunks) != len(blocks):
+            logger.debug(f"Chunked {len(blocks)} extracted blocks into {len(chunks)} analysis blocks")
+        return chunks
+
+    def _is_oversized(self, block: RawBlock) -> bool:
+        """Check whether a block exceeds the split threshold."""
+        return (
+            len(block.content) > self.max_chars
+            or estimate_tokens(block.content) > self.target_tokens * SPLIT_TOLERANCE
+        )
+
+    def _can_merge(self, previous: RawBlock, block: RawBlock) -> bool:
+        """Blocks are only merged within the same page and section."""
+        return previous.page_number == block.page_number and previous.section_path == block.section_path
+
+    def _merge(self, blocks: List[RawBlock]) -> TextBlock:
+        """Combine adjacent raw blocks into a single analysis block."""
+        first = blocks[0]
+        return TextBlock(
+            content="\n\n".join(block.content for block in blocks),
+            page_number=first.page_number,
+            bounding_box=_union_bounding_box([block.bounding_box for block in blocks]),
+            block_index=first.block_index,
+            source_block_indices=[block.block_index for block in blocks],
+            section_path=first.section_path,
+            kind=first.kind,
+        )
+
+    def _split(self, block: RawBlock) -> List[TextBlock]:
+        """
+        Split an oversized block at sentence boundaries in linear time.
+
+        The block is divided into the smallest number of roughly equal chunks
+        that respect the token target; sentences longer than the hard character
+        limit are wrapped at word boundaries.
+        """
+        text = block.content
+        chunk_count = max(
+            -(-estimate_tokens(text) // self.target_tokens),
+            -(-len(text) // self.max_chars),
+        )
+        # Balanced chunk size, never above the hard limit
+        limit = min(self.max_chars, -(-len(text) // chunk_count))
+
+        pieces: List[str] = []
+        current: List[str] = []
+        current_length = 0
+
+        for sentence in self._sentences(text):
+            added = len(sentence) + (1 if current else 0)
+            if current and current_length + added > limit:
+                pieces.append(" ".join(current))
+                current = []
+                current_length = 0
+                added = len(sentence)
+            current.append(sentence)
+            current_length += added
+
+        if current:
+            pieces.append(" ".join(current))
+
+        if len(pieces) <= 1:
+            return [self._merge([block])]
+
+        return [
+            TextBlock(
+                content=piece,
+                page_number=block.page_number,
+                bounding_box=block.bounding_box,
+                block_index=block.block_index,
+                parent_block_index=block.block_index,
+                source_block_indices=[block.block_index],
+                section_path=block.section_path,
+                kind=block.kind,
+            )
+            for piece in pieces
+        ]
+
+    def _sentences(self, text: str) -> List[str]:
+        """Split text into sentences, wrapping any sentence above the hard limit."""
+        sentences = []
+        for sentence in SENTENCE_BOUNDARY_PATTERN.split(text):
+            if len(sentence) <= self.max_chars:
+                sentences.append(sentence)
+                continue
+
+            words: List[str] = []
+            length = 0
+            for word in sentence.split(" "):
+                if words and length + 1 + len(word) > self.max_chars:
+                    sentences.append(" ".join(words))
+                    words = []
+                    length = 0
+                length += len(word) + (1 if words else 0)
+                words.append(word)
+            if words:
+                sentences.append(" ".join(words))
+
+        return [sentence for sentence in sentences if sentence.strip()]
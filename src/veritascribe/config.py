@@ -1,10 +1,16 @@
 """Configuration management for VeritaScribe using Pydantic Settings."""
 
 import os
-from typing import Optional, Dict, Any, Literal
+import logging
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import dspy
+import litellm
+
+from .http_client import ConnectionStats, PooledHTTPClient
+
+logger = logging.getLogger(__name__)
 
 
 class VeritaScribeSettings(BaseSettings):
@@ -51,18 +57,58 @@ class VeritaScribeSettings(BaseSettings):
     # Processing Configuration
     max_text_block_size: int = Field(default=2000, description="Maximum characters per text block for analysis")
     min_text_block_size: int = Field(default=50, description="Minimum characters for text block analysis")
+    target_block_tokens: int = Field(default=400, description="Token target per analysis block (adjacent small blocks are merged up to it, larger ones split)")
+    coalesce_small_blocks: bool = Field(default=True, description="Merge adjacent small blocks on the same page into one analysis block")
+    remove_repeated_margin_text: bool = Field(default=True, description="Drop running headers, footers and other text repeated in the page margins of nearby pages")
+    margin_band_fraction: float = Field(default=0.12, description="Height of the top and bottom page margin bands as a fraction of the page height")
+    repeated_margin_min_pages: int = Field(default=3, description="Pages within five pages of each other that margin text must repeat on to be dropped")
+    text_extraction_mode: Literal["blocks", "dict"] = Field(default="blocks", description="Page text extraction: 'blocks' reads only block text and positions, 'dict' full span dictionaries with fonts (always used when font information is needed)")
+    classify_blocks: bool = Field(default=True, description="Label blocks as prose, table, math, code or reference and send only prose to all analysis modules (code skips analysis) (monospaced fonts only count as a code signal in 'dict' mode)")
+    detect_table_regions: bool = Field(default=False, description="Also locate tables with PyMuPDF's table finder (about 0.1s per page with number-heavy lines)")
+    detect_sections: bool = Field(default=False, description="Recognize chapter and section headings by their font size and tag every block with its section path (reads pages in 'dict' mode)")
+    extraction_processes: int = Field(default=0, description="Worker processes extracting the pages of large documents (0 uses all CPU cores, 1 extracts in-process)")
+    parallel_extraction_min_pages: int = Field(default=150, description="Documents with fewer pages are always extracted in-process")
+    deduplicate_blocks: bool = Field(default=True, description="Analyze repeated blocks once and share the result with their duplicates")
+    near_duplicate_threshold: float = Field(default=0.9, description="Minimum word-shingle similarity for near-duplicate blocks (above 1 disables near-duplicate detection)")
     parallel_processing: bool = Field(default=True, description="Enable parallel LLM processing")
     max_concurrent_requests: int = Field(default=5, description="Maximum concurrent LLM requests")
+    pipelined_analysis: bool = Field(default=False, description="Start analyzing blocks while later pages are still being extracted")
+    pipeline_queue_size: int = Field(default=64, description="Extracted blocks that may wait for analysis in pipelined mode")
+    batch_max_documents: int = Field(default=4, description="Documents prepared and analyzed concurrently by the batch command")
+    
+    # HTTP Connection Pool Configuration
+    http_max_connections: Optional[int] = Field(None, description="Pooled connections per provider (defaults to the request concurrency plus room for hedges)")
+    http_keepalive_expiry: float = Field(default=60.0, description="Seconds an idle pooled connection is kept open")
+    http2_enabled: bool = Field(default=False, description="Negotiate HTTP/2 with the LLM provider where supported")
     
     # Output Configuration
     output_directory: str = Field(default="./analysis_output", description="Default output directory")
     generate_visualizations: bool = Field(default=True, description="Generate error visualization charts")
     save_detailed_reports: bool = Field(default=True, description="Save detailed text reports")
+    compact_reports: bool = Field(default=False, description="Leave block text out of saved JSON reports, referencing blocks by location and content hash")
+    report_formats: List[Literal["json", "ndjson", "parquet"]] = Field(default=["json"], description="Files saved per analysis: 'json' full report, 'ndjson' one error per line, 'parquet' table of errors (needs the 'export' extra)")
+    report_compression: Literal["none", "gzip", "zstd"] = Field(default="none", description="Compression of saved JSON and NDJSON reports ('zstd' needs the 'export' extra)")
+    
+    # Checkpoint Configuration
+    checkpoint_enabled: bool = Field(default=True, description="Append per-block results to a checkpoint so interrupted analyses can be resumed")
+    checkpoint_directory: Optional[str] = Field(default=None, description="Directory for analysis checkpoints (default: 'checkpoints' in the output directory)")
+    
+    # Extraction Cache Configuration
+    extraction_cache_enabled: bool = Field(default=True, description="Cache PDF extractions on disk so unchanged documents are not parsed again")
+    extraction_cache_directory: Optional[str] = Field(default=None, description="Directory for cached PDF extractions (default: 'extraction_cache' in the output directory)")
+    extraction_cache_max_mb: float = Field(default=256.0, description="Total size of cached extractions above which the least recently used are deleted")
     
     # Retry Configuration
     max_retries: int = Field(default=3, description="Maximum retries for failed LLM requests")
     retry_delay: float = Field(default=1.0, description="Delay between retries in seconds")
     
+    # Request Deadline and Hedging Configuration
+    llm_request_timeout: float = Field(default=120.0, description="Deadline per LLM call in seconds (0 disables it)")
+    hedge_requests: bool = Field(default=False, description="Send a duplicate request for calls slower than the observed tail latency")
+    hedge_percentile: float = Field(default=0.95, description="Latency quantile after which a call is hedged")
+    hedge_budget: float = Field(default=0.05, description="Maximum share of LLM calls that may be hedged")
+    hedge_min_samples: int = Field(default=20, description="Completed calls observed before hedging starts")
+    
     # Rate Limiting Configuration
     rate_limit_enabled: bool = Field(default=True, description="Enable rate limiting for LLM API calls")
     rate_limit_requests_per_minute: Optional[int] = Field(None, description="Custom requests per minute limit (auto-detected by provider if None)")
@@ -79,6 +125,14 @@ class VeritaScribeSettings(BaseSettings):
             raise ValueError(f"Invalid LLM provider '{v}'. Must be one of: {valid_providers}")
         return v
     
+    def checkpoint_directory_for(self, output_directory: Optional[str] = None) -> str:
+        """Checkpoint directory of a run writing to ``output_directory`` (the configured one if None)."""
+        return self.checkpoint_directory or os.path.join(output_directory or self.output_directory, "checkpoints")
+    
+    def extraction_cache_directory_for(self, output_directory: Optional[str] = None) -> str:
+        """Extraction cache directory of a run writing to ``output_directory`` (the configured one if None)."""
+        return self.extraction_cache_directory or os.path.join(output_directory or self.output_directory, "extraction_cache")
+    
     def get_api_key(self) -> str:
         """Get the appropriate API key based on provider."""
         if self.llm_provider == "openai" or self.llm_provider == "custom":
@@ -262,6 +316,44 @@ class DSPyConfig:
     def __init__(self, settings: VeritaScribeSettings):
         self.settings = settings
         self._lm: Optional[dspy.LM] = None
+        # One pooled HTTP client per provider, reused across blocks and documents
+        self._http_clients: Dict[str, PooledHTTPClient] = {}
+    
+    def get_http_client(self, provider: Optional[str] = None) -> PooledHTTPClient:
+        """
+        Get the pooled HTTP client of a provider, creating it on first use.
+        
+        Args:
+            provider: LLM provider name (defaults to the configured provider)
+            
+        Returns:
+            PooledHTTPClient shared by all LLM calls to that provider
+        """
+        provider = provider or self.settings.llm_provider
+        if provider not in self._http_clients:
+            max_connections = self.settings.http_max_connections
+            if not max_connections:
+                # Every concurrent call may have a hedge in flight
+                max_connections = self.settings.max_concurrent_requests * (2 if self.settings.hedge_requests else 1)
+            self._http_clients[provider] = PooledHTTPClient(
+                max_connections=max_connections,
+                keepalive_expiry=self.settings.http_keepalive_expiry,
+                http2=self.settings.http2_enabled,
+                timeout=self.settings.llm_request_timeout or None
+            )
+            logger.info(f"Created HTTP connection pool for {provider}: {max_connections} connections")
+        return self._http_clients[provider]
+    
+    def get_connection_stats(self) -> ConnectionStats:
+        """Get the connection counters of the configured provider's HTTP client."""
+        client = self._http_clients.get(self.settings.llm_provider)
+        return client.get_stats() if client else ConnectionStats()
+    
+    def close_http_clients(self) -> None:
+        """Close the pooled connections of all providers."""
+        for client in self._http_clients.values():
+            client.close()
+        self._http_clients.clear()
     
     def initialize_llm(self) -> dspy.LM:
         """Initialize and configure DSPy LLM backend based on provider."""
@@ -279,6 +371,9 @@ class DSPyConfig:
                     # OpenAI, OpenRouter, or custom OpenAI-compatible
                     self._lm = self._initialize_openai_compatible(api_key, base_url, provider)
                 
+                # Route LiteLLM's OpenAI-compatible requests through the shared pool
+                litellm.client_session = self.get_http_client(provider).client
+                
                 # Configure DSPy to use this LLM
                 dspy.configure(lm=self._lm)
                 
@@ -297,12 +392,15 @@ class DSPyConfig:
         """Initialize Anthropic Claude model."""
         formatted_model = self.settings.format_model_name()
         max_tokens = self.settings.get_provider_specific_max_tokens()
-        return dspy.LM(
-            model=formatted_model,
-            api_key=api_key,
-            max_tokens=max_tokens,
-            temperature=self.settings.temperature
-        )
+        init_params = {
+            "model": formatted_model,
+            "api_key": api_key,
+            "max_tokens": max_tokens,
+            "temperature": self.settings.temperature
+        }
+        if self.settings.llm_request_timeout:
+            init_params["timeout"] = self.settings.llm_request_timeout
+        return dspy.LM(**init_params)
     
     def _initialize_openai_compatible(self, api_key: str, base_url: Optional[str], provider: str) -> dspy.LM:
         """Initialize OpenAI-compatible model (OpenAI, OpenRouter, or custom)."""
@@ -317,6 +415,8 @@ class DSPyConfig:
             "max_tokens": max_tokens,
             "temperature": self.settings.temperature
         }
+        if self.settings.llm_request_timeout:
+            init_params["timeout"] = self.settings.llm_request_timeout
         
         # Add base URL if specified
         if base_url:
@@ -468,4 +568,33 @@ def get_rate_limiter():
 def reset_rate_limiter() -> None:
     """Reset global rate limiter instance."""
     global _rate_limiter
-    _rate_limiter = None
\ No newline at end of file
+    _rate_limiter = None
+
+# Global request controller instance
+_request_controller = None
+
+
+def get_request_controller():
+    """Get global controller applying deadlines and hedging to LLM calls."""
+    global _request_controller
+    if _request_controller is None:
+        from .hedging import RequestController
+        settings = get_settings()
+        _request_controller = RequestController(
+            timeout=settings.llm_request_timeout,
+            hedging_enabled=settings.hedge_requests,
+            hedge_percentile=settings.hedge_percentile,
+            hedge_budget=settings.hedge_budget,
+            hedge_min_samples=settings.hedge_min_samples,
+            # Room for one hedge per concurrent call plus abandoned attempts
+            max_workers=max(4, settings.max_concurrent_requests * 3)
+        )
+    return _request_controller
+
+
+def reset_request_controller() -> None:
+    """Reset global request controller instance."""
+    global _request_controller
+    if _request_controller is not None:
+        _request_controller.shutdown()
+    _request_controller = None
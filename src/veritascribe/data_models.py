@@ -2,9 +2,11 @@
 
 from typing import List, Optional, Dict, Any, Literal, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from enum import Enum
 
+from .report_index import ReportIndex
+
 
 class ErrorSeverity(str, Enum):
     """Enumeration for error severity levels."""
@@ -22,6 +24,15 @@ class ErrorType(str, Enum):
     STYLE = "style"
 
 
+class BlockKind(str, Enum):
+    """Enumeration for the kinds of extracted text blocks."""
+    PROSE = "prose"
+    TABLE = "table"
+    MATH = "math"
+    CODE = "code"
+    REFERENCE = "reference"
+
+
 class LocationHint(BaseModel):
     """Represents the precise location of content or errors in a PDF document."""
     
@@ -186,7 +197,21 @@ class TextBlock(BaseModel):
         None, 
         description="Bounding box coordinates (x0, y0, x1, y1)"
     )
-    block_index: int = Field(..., ge=0, description="Index of this block within the page")
+    block_index: int = Field(..., ge=0, description="Document-wide index of this block in reading order")
+    parent_block_index: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Index of the extracted block this chunk was split from, if it was split"
+    )
+    source_block_indices: List[int] = Field(
+        default_factory=list,
+        description="Indices of the extracted blocks this block was built from"
+    )
+    section_path: List[str] = Field(
+        default_factory=list,
+        description="Titles of the chapter and sections containing this block, outermost first"
+    )
+    kind: BlockKind = Field(default=BlockKind.PROSE, description="Whether the block is prose, a table, formula, code or references")
     word_count: int = Field(default=0, ge=0, description="Number of words in this block")
     character_count: int = Field(default=0, ge=0, description="Number of characters in this block")
     
@@ -235,6 +260,19 @@ class AnalysisResult(BaseModel):
         ge=0.0, 
         description="Time taken to analyze this block"
     )
+    analysis_failed: bool = Field(
+        default=False,
+        description="Whether the LLM analysis of this block failed"
+    )
+    reused_from_baseline: bool = Field(
+        default=False,
+        description="Whether this result was carried over from a baseline report"
+    )
+    duplicate_of: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Index of the identical or near-identical block whose analysis was shared with this block"
+    )
     
     @property
     def error_count(self) -> int:
@@ -251,6 +289,47 @@ class AnalysisResult(BaseModel):
         """Whether this block has any errors."""
         return len(self.errors) > 0
     
+    def relocated(self, text_block: TextBlock, **updates: Any) -> "AnalysisResult":
+        """
+        Create a copy of this result attached to a block at a new location.
+        
+        Error locations are moved along with the block: page and paragraph
+        index are taken from the new block and bounding boxes are shifted by
+        the offset between the old and new block positions.
+        
+        Args:
+            text_block: Block with the same content at another location
+            **updates: Further fields to set on the copy, e.g. provenance flags
+            
+        Returns:
+            AnalysisResult for the new block
+        """
+        old_box = self.text_block.bounding_box
+        new_box = text_block.bounding_box
+        
+        errors = []
+        for error in self.errors:
+            error_box = error.location.bounding_box
+            if error_box and old_box and new_box:
+                dx = new_box[0] - old_box[0]
+                dy = new_box[1] - old_box[1]
+                error_box = (error_box[0] + dx, error_box[1] + dy, error_box[2] + dx, error_box[3] + dy)
+            elif error_box == old_box:
+                error_box = new_box
+            
+            location = error.location.model_copy(update={
+                'page_number': text_block.page_number,
+                'bounding_box': error_box,
+                'paragraph_index': text_block.block_index,
+            })
+            errors.append(error.model_copy(update={'location': location}))
+        
+        return self.model_copy(update={
+            'text_block': text_block,
+            'errors': errors,
+            **updates,
+        })
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -331,38 +410,49 @@ class ThesisAnalysisReport(BaseModel):
         description="Estimated cost in USD for the analysis"
     )
     
+    # Incremental re-analysis against a previous report
+    baseline_report: Optional[str] = Field(
+        None,
+        description="Path of the baseline report whose results were reused"
+    )
+    reused_blocks: int = Field(default=0, ge=0, description="Number of blocks reused from the baseline report")
+    reanalyzed_blocks: int = Field(default=0, ge=0, description="Number of blocks analyzed by the LLM rather than reused from the baseline or shared with a duplicate")
+    resumed_blocks: int = Field(default=0, ge=0, description="Number of blocks restored from the checkpoint of an interrupted run")
+    deduplicated_blocks: int = Field(
+        default=0,
+        ge=0,
+        description="Number of duplicate blocks that shared the analysis of another block instead of being sent to the LLM"
+    )
+    
+    # LLM call deadlines, hedging and HTTP connection reuse
+    request_stats: Optional[Dict[str, int]] = Field(
+        None,
+        description="LLM call counts of the run: calls, timeouts, failures, hedged_requests, hedges_won, "
+                    "hedges_skipped, and HTTP requests, new_connections, reused_connections, tls_handshakes"
+    )
+    
+    # Per-stage wall-clock timings
+    stage_timings: Optional[Dict[str, Dict[str, float]]] = Field(
+        None,
+        description="Start/end offsets and duration in seconds for each pipeline stage"
+    )
+    
+    _index: ReportIndex = PrivateAttr(default_factory=ReportIndex)
+    
     def __init__(self, **data):
         super().__init__(**data)
         self._calculate_statistics()
     
+    @property
+    def index(self) -> ReportIndex:
+        """Counts and error lists by type, severity and page of the results."""
+        return self._index
+    
     def _calculate_statistics(self):
-        """Calculate summary statistics from analysis results."""
-        self.total_errors = sum(result.error_count for result in self.analysis_results)
-        self.total_text_blocks = len(self.analysis_results)
-        self.total_words = sum(result.text_block.word_count for result in self.analysis_results)
-        
-        # Calculate errors by type
-        type_counts = {}
-        severity_counts = {}
-        page_counts = {}
-        
-        for result in self.analysis_results:
-            page_num = result.text_block.page_number
-            page_error_count = len(result.errors)
-            page_counts[page_num] = page_counts.get(page_num, 0) + page_error_count
-            
-            for error in result.errors:
-                # Count by type
-                error_type = error.error_type
-                type_counts[error_type] = type_counts.get(error_type, 0) + 1
-                
-                # Count by severity
-                severity = error.severity
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
-        self.errors_by_type = type_counts
-        self.errors_by_severity = severity_counts
-        self.errors_by_page = page_counts
+        """Index the analysis results in one pass and take the summary statistics from the index."""
+        self._index = ReportIndex(self.analysis_results)
+        for name, value in self._index.statistics().items():
+            setattr(self, name, value)
     
     @property
     def error_rate(self) -> float:
@@ -374,7 +464,7 @@ class ThesisAnalysisReport(BaseModel):
     @property
     def pages_with_errors(self) -> int:
         """Number of pages that contain errors."""
-        return len([page for page, count in self.errors_by_page.items() if count > 0])
+        return sum(1 for count in self.errors_by_page.values() if count > 0)
     
     @property
     def average_errors_per_page(self) -> float:
@@ -385,13 +475,7 @@ class ThesisAnalysisReport(BaseModel):
     
     def get_high_severity_errors(self) -> List[Union[GrammarCorrectionError, ContentPlausibilityError, CitationFormatError]]:
         """Get all high-severity errors across all blocks."""
-        high_severity_errors = []
-        for result in self.analysis_results:
-            high_severity_errors.extend([
-                error for error in result.errors 
-                if error.severity == ErrorSeverity.HIGH
-            ])
-        return high_severity_errors
+        return list(self._index.high_severity_errors)
     
     class Config:
         json_schema_extra = {
@@ -414,4 +498,65 @@ class ThesisAnalysisReport(BaseModel):
                 "analysis_timestamp": "2024-01-15T11:45:00",
                 "total_processing_time_seconds": 45.2
             }
-        }
\ No newline at end of file
+        }
+
+class BatchDocumentResult(BaseModel):
+    """Outcome of one document of a batch analysis."""
+    
+    document_name: str = Field(..., description="Name of the PDF document")
+    document_path: str = Field(..., description="Path of the PDF document")
+    status: Literal["completed", "failed"] = Field(..., description="Whether the analysis completed")
+    total_pages: int = Field(default=0, ge=0, description="Number of pages")
+    total_text_blocks: int = Field(default=0, ge=0, description="Number of analyzed text blocks")
+    total_errors: int = Field(default=0, ge=0, description="Number of detected errors")
+    processing_time_seconds: float = Field(default=0.0, ge=0.0, description="Time from start to completion of the document")
+    report_path: Optional[str] = Field(None, description="Path of the saved JSON report")
+    error_message: Optional[str] = Field(None, description="Why the analysis failed")
+
+
+class BatchSummary(BaseModel):
+    """Summary and throughput statistics of a batch analysis."""
+    
+    started_at: datetime = Field(default_factory=datetime.now, description="When the batch started")
+    wall_time_seconds: float = Field(default=0.0, ge=0.0, description="Wall-clock time of the whole batch")
+    max_active_documents: int = Field(default=1, ge=1, description="Documents analyzed concurrently")
+    max_concurrent_requests: int = Field(default=1, ge=1, description="Block analyses running concurrently across documents")
+    documents: List[BatchDocumentResult] = Field(default_factory=list, description="Per-document outcomes in completion order")
+    token_usage: Optional[Dict[str, int]] = Field(None, description="Token usage of the whole batch")
+    estimated_cost: Optional[float] = Field(None, ge=0.0, description="Estimated cost in USD of the whole batch")
+    request_stats: Optional[Dict[str, int]] = Field(None, description="LLM call and HTTP connection counts of the whole batch")
+    
+    @property
+    def documents_completed(self) -> int:
+        """Number of documents analyzed successfully."""
+        return sum(1 for document in self.documents if document.status == "completed")
+    
+    @property
+    def documents_failed(self) -> int:
+        """Number of documents whose analysis failed."""
+        return sum(1 for document in self.documents if document.status == "failed")
+    
+    @property
+    def total_pages(self) -> int:
+        """Pages of all completed documents."""
+        return sum(document.total_pages for document in self.documents)
+    
+    @property
+    def total_text_blocks(self) -> int:
+        """Text blocks of all completed documents."""
+        return sum(document.total_text_blocks for document in self.documents)
+    
+    @property
+    def total_errors(self) -> int:
+        """Errors found in all completed documents."""
+        return sum(document.total_errors for document in self.documents)
+    
+    def throughput(self) -> Dict[str, float]:
+        """Documents per hour, pages per minute and blocks per second of the batch."""
+        if self.wall_time_seconds <= 0:
+            return {'documents_per_hour': 0.0, 'pages_per_minute': 0.0, 'blocks_per_second': 0.0}
+        return {
+            'documents_per_hour': round(self.documents_completed * 3600 / self.wall_time_seconds, 2),
+            'pages_per_minute': round(self.total_pages * 60 / self.wall_time_seconds, 2),
+            'blocks_per_second': round(self.total_text_blocks / self.wall_time_seconds, 3),
+        }
@@ -0,0 +1,216 @@
+"""Exact and near-duplicate detection of text blocks within a document."""
+
+import logging
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from .data_models import AnalysisResult, TextBlock
+from .incremental import block_fingerprint, normalize_block_text
+
+logger = logging.getLogger(__name__)
+
+# Word n-grams compared between blocks
+SHINGLE_SIZE = 5
+
+# MinHash signature length and LSH banding (16 bands of 4 rows); pairs with a
+# Jaccard similarity of about 0.5 and more become candidates
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+@dataclass
+class DuplicateMatch:
+    """A block whose analysis is shared with an earlier representative block."""
+    representative_index: int
+    exact: bool
+    similarity: float = 1.0
+
+
+def _shingles(text: str, size: int) -> Set[int]:
+    """Hash the word n-grams of a normalized text."""
+    words = normalize_block_text(text).split()
+    if len(words) < size:
+        return set()
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode('utf-8')) & _MERSENNE_PRIME
+        for i in range(len(words) - size + 1)
+    }
+
+
+class BlockDeduplicator:
+    """
+    Groups exact duplicates by content hash and near-duplicates by MinHash similarity.
+
+    The deduplicator remembers every block it has seen, so one instance is
+    used per document.
+    """
+
+    def __init__(
+        self,
+        near_duplicate_threshold: float = 0.9,
+        shingle_size: int = SHINGLE_SIZE,
+        num_permutations: int = NUM_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+        seed: int = 1
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            near_duplicate_threshold: Minimum Jaccard similarity of word
+                shingles for two blocks to count as near-duplicates; values
+                above 1 disable near-duplicate detection
+            shingle_size: Number of words per shingle
+            num_permutations: Length of the MinHash signatures
+            bands: Number of LSH bands (must divide num_permutations)
+            seed: Seed of the MinHash permutations
+        """
+        if num_permutations % bands:
+            raise ValueError("num_permutations must be a multiple of bands")
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = num_permutations // bands
+
+        rng = np.random.default_rng(seed)
+        # Universal hash functions h(x) = (a * x + b) mod p; all values stay below 2**62
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=(num_permutations, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=(num_permutations, 1), dtype=np.uint64)
+
+        # Blocks seen so far: first block per content hash, near-duplicate
+        # matches, and the shingles and LSH buckets of representatives
+        self._first_by_fingerprint: Dict[str, int] = {}
+        self._near_matches: Dict[int, DuplicateMatch] = {}
+        self._shingle_sets: Dict[int, Set[int]] = {}
+        self._buckets: Dict[bytes, List[int]] = {}
+
+    def find_duplicates(self, blocks: List[TextBlock]) -> Dict[int, DuplicateMatch]:
+        """
+        Find blocks that repeat an earlier block.
+
+        The first occurrence of every group is its representative; it is
+        never itself marked as a duplicate, so groups have no chains.
+
+        Args:
+            blocks: Blocks in document order
+
+        Returns:
+            Mapping of duplicate block index to its match
+        """
+        duplicates: Dict[int, DuplicateMatch] = {}
+        for block in blocks:
+            match = self.match(block)
+            if match:
+                duplicates[block.block_index] = match
+
+        if duplicates:
+            exact_count = sum(1 for match in duplicates.values() if match.exact)
+            logger.info(
+                f"Deduplication: {exact_count} exact and {len(duplicates) - exact_count} "
+                f"near-duplicate blocks share the analysis of an earlier block"
+            )
+        return duplicates
+
+    def match(self, block: TextBlock) -> Optional[DuplicateMatch]:
+        """
+        Match one block against all blocks seen before it.
+
+        Blocks must be passed in document order; unmatched blocks become
+        representatives for the blocks that follow.
+
+        Args:
+            block: Next block of the document
+
+        Returns:
+            DuplicateMatch if the block repeats an earlier block, None otherwise
+        """
+        fingerprint = block_fingerprint(block.content)
+        first_index = self._first_by_fingerprint.get(fingerprint)
+        if first_index is not None:
+            near_match = self._near_matches.get(first_index)
+            if near_match:
+                # Exact copies of a near-duplicate share its representative
+                return DuplicateMatch(
+                    near_match.representative_index, exact=False, similarity=near_match.similarity
+                )
+            return DuplicateMatch(first_index, exact=True)
+
+        self._first_by_fingerprint[fingerprint] = block.block_index
+        if self.near_duplicate_threshold > 1.0:
+            return None
+
+        near_match = self._match_near_duplicate(block)
+        if near_match:
+            self._near_matches[block.block_index] = near_match
+        return near_match
+
+    def _match_near_duplicate(self, block: TextBlock) -> Optional[DuplicateMatch]:
+        """Match a block against earlier representatives using MinHash LSH."""
+        shingles = _shingles(block.content, self.shingle_size)
+        if not shingles:
+            return None
+
+        band_keys = self._band_keys(shingles)
+        candidates = {index for key in band_keys for index in self._buckets.get(key, ())}
+
+        best_index: Optional[int] = None
+        best_similarity = 0.0
+        for index in candidates:
+            other = self._shingle_sets[index]
+            similarity = len(shingles & other) / len(shingles | other)
+            if similarity > best_similarity:
+                best_index, best_similarity = index, similarity
+
+        if best_index is not None and best_similarity >= self.near_duplicate_threshold:
+            return DuplicateMatch(best_index, exact=False, similarity=round(best_similarity, 4))
+
+        # Only representatives are indexed
+        self._shingle_sets[block.block_index] = shingles
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(block.block_index)
+        return None
+
+    def _band_keys(self, shingles: Set[int]) -> List[bytes]:
+        """Compute the LSH bucket keys of a shingle set."""
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        signature = ((self._a * values + self._b) % _MERSENNE_PRIME).min(axis=1)
+        return [
+            band.to_bytes(1, 'little') + signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+
+def share_result(
+    result: AnalysisResult,
+    text_block: TextBlock,
+    match: DuplicateMatch
+) -> AnalysisResult:
+    """
+    Fan out the analysis of a representative block to one of its duplicates.
+
+    For near-duplicates only errors whose text also occurs in the duplicate
+    are kept, so findings in the differing parts are not misplaced.
+
+    Args:
+        result: Analysis result of the representative block
+        text_block: Duplicate block
+        match: How the duplicate matched the representative
+
+    Returns:
+        AnalysisResult located at the duplicate block
+    """
+    shared = result.relocated(text_block, duplicate_of=match.representative_index)
+    shared.processing_time_seconds = None
+
+    if not match.exact:
+        content = normalize_block_text(text_block.content)
+        shared.errors = [
+            error for error in shared.errors
+            if normalize_block_text(error.original_text) in content
+        ]
+    return shared
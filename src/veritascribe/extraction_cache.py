@@ -0,0 +1,137 @@
+"""On-disk cache of PDF extractions keyed by document content and extraction settings."""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CACHE_FORMAT_VERSION = 2
+
+_CACHE_SUFFIX = ".json.gz"
+
+
+def compute_extraction_key(pdf_hash: str, configuration: Dict[str, Any]) -> str:
+    """
+    Derive the cache key from the document and the extraction configuration.
+
+    Args:
+        pdf_hash: SHA-256 hash of the PDF file
+        configuration: Settings that influence the extraction output
+
+    Returns:
+        Hex digest identifying the cache entry
+    """
+    payload = json.dumps(
+        {'pdf_hash': pdf_hash, 'configuration': configuration, 'version': EXTRACTION_CACHE_FORMAT_VERSION},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Directory of gzip-compressed JSON extractions, evicted least recently used first.
+
+    Entries are written atomically, so concurrent runs never read a partial
+    file; unreadable entries count as misses. Cache errors are logged and
+    never fail an extraction.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache files (created on first store)
+            max_bytes: Total size of all entries above which the least recently
+                used ones are deleted
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_CACHE_SUFFIX}"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached extraction.
+
+        Args:
+            key: Cache key from ``compute_extraction_key``
+
+        Returns:
+            The stored data, or None if there is no usable entry
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable extraction cache entry {path.name}: {e}")
+            return None
+
+        if data.get('key') != key:
+            return None
+        # Hits count as use for the eviction order
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data['extraction']
+
+    def store(self, key: str, extraction: Dict[str, Any]) -> None:
+        """
+        Write an extraction and evict old entries beyond the size limit.
+
+        Args:
+            key: Cache key from ``compute_extraction_key``
+            extraction: JSON-serializable extraction data
+        """
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as tmp:
+                tmp_path = tmp.name
+                with gzip.GzipFile(fileobj=tmp, mode='wb', compresslevel=6, mtime=0) as f:
+                    f.write(json.dumps({'key': key, 'extraction': extraction}, separators=(',', ':')).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+            return
+
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        """Delete the least recently used entries until the cache fits its size limit."""
+        entries = []
+        for entry in self.directory.glob(f"*{_CACHE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            try:
+                entry.unlink()
+                total -= size
+                logger.debug(f"Evicted extraction cache entry {entry.name}")
+            except OSError:
+                pass
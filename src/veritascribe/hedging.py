@@ -0,0 +1,247 @@
+"""Per-call deadlines and hedged requests for LLM module calls."""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCallTimeoutError(TimeoutError):
+    """Raised when an LLM call does not finish before its deadline."""
+
+
+@dataclass
+class RequestStats:
+    """Counters of controlled LLM calls."""
+    calls: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    hedged_requests: int = 0
+    hedges_won: int = 0
+    hedges_skipped: int = 0
+
+    def since(self, earlier: "RequestStats") -> "RequestStats":
+        """Return the counts accumulated after an earlier snapshot."""
+        return RequestStats(**{
+            name: value - getattr(earlier, name) for name, value in asdict(self).items()
+        })
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the counters to a dictionary."""
+        return asdict(self)
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies."""
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of most recent latencies kept
+        """
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a completed call."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Latency below which the given fraction of recent calls finished.
+
+        Args:
+            fraction: Quantile between 0 and 1, e.g. 0.95
+
+        Returns:
+            Latency in seconds, or None if nothing was observed yet
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+
+class RequestController:
+    """Runs LLM calls with a deadline and hedges calls slower than the observed tail."""
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        hedging_enabled: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_budget: float = 0.05,
+        hedge_min_samples: int = 20,
+        max_workers: int = 16
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            timeout: Deadline per call in seconds (None or 0 disables it)
+            hedging_enabled: Send a duplicate request for calls slower than
+                the hedge percentile
+            hedge_percentile: Latency quantile after which a call is hedged
+            hedge_budget: Maximum share of calls that may be hedged
+            hedge_min_samples: Latencies observed before hedging starts
+            max_workers: Threads running controlled calls
+        """
+        self.timeout = timeout or None
+        self.hedging_enabled = hedging_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.hedge_min_samples = hedge_min_samples
+        self.latencies = LatencyTracker()
+
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = RequestStats()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Whether calls are run with a deadline or hedging."""
+        return self.timeout is not None or self.hedging_enabled
+
+    def call(
+        self,
+        func: Callable,
+        *args,
+        hedge_permit: Optional[Callable[[], bool]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Call a function under the deadline, hedging it if it runs long.
+
+        The first successful attempt wins. Attempts still running when the
+        call returns or times out are abandoned; the HTTP client timeout of
+        the LM bounds how long they keep their thread.
+
+        Args:
+            func: Function performing the LLM request
+            *args: Function arguments
+            hedge_permit: Called before sending a hedge; returning False
+                skips it (used to respect the rate limit)
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            LLMCallTimeoutError: If no attempt finished before the deadline
+        """
+        with self._lock:
+            self._stats.calls += 1
+
+        if not self.active:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.latencies.observe(time.perf_counter() - start)
+            return result
+
+        start = time.perf_counter()
+        deadline = start + self.timeout if self.timeout else None
+        primary = self._submit(func, args, kwargs)
+        attempts = [primary]
+
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is not None:
+            wait_time = hedge_delay if deadline is None else min(hedge_delay, deadline - start)
+            done, _ = wait(attempts, timeout=wait_time)
+            if not done and (deadline is None or time.perf_counter() < deadline):
+                if self._take_hedge(hedge_permit):
+                    logger.debug(f"Hedging LLM call after {hedge_delay:.2f}s")
+                    attempts.append(self._submit(func, args, kwargs))
+
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is not primary:
+                        with self._lock:
+                            self._stats.hedges_won += 1
+                    return future.result()
+                error = error or future.exception()
+
+        for future in pending:
+            future.cancel()
+
+        if error is not None and not pending:
+            with self._lock:
+                self._stats.failures += 1
+            raise error
+
+        with self._lock:
+            self._stats.timeouts += 1
+        raise LLMCallTimeoutError(f"LLM call did not finish within {self.timeout:g}s")
+
+    def _submit(self, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Future:
+        """Run one attempt on the worker pool, timing it if it succeeds."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="llm-call"
+                )
+
+        def attempt() -> Any:
+            attempt_start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.latencies.observe(time.perf_counter() - attempt_start)
+            return result
+
+        # Keep DSPy context overrides of the calling thread
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, attempt)
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Delay after which a call is hedged, or None if hedging is not possible yet."""
+        if not self.hedging_enabled or len(self.latencies) < self.hedge_min_samples:
+            return None
+        return self.latencies.percentile(self.hedge_percentile)
+
+    def _take_hedge(self, hedge_permit: Optional[Callable[[], bool]]) -> bool:
+        """Reserve a hedge within the budget and the rate limit."""
+        with self._lock:
+            if self._stats.hedged_requests >= self.hedge_budget * self._stats.calls:
+                self._stats.hedges_skipped += 1
+                return False
+            self._stats.hedged_requests += 1
+
+        if hedge_permit is not None and not hedge_permit():
+            with self._lock:
+                self._stats.hedged_requests -= 1
+                self._stats.hedges_skipped += 1
+            return False
+        return True
+
+    def get_stats(self) -> RequestStats:
+        """Get a snapshot of the call counters."""
+        with self._lock:
+            return RequestStats(**asdict(self._stats))
+
+    def shutdown(self) -> None:
+        """Stop the worker pool without waiting for abandoned attempts."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
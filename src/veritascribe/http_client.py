@@ -0,0 +1,104 @@
+"""Pooled, instrumented HTTP clients shared by all LLM calls of a provider."""
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectionStats:
+    """Counters of HTTP requests and the connections they used."""
+    requests: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests sent over an already open keep-alive connection."""
+        return max(0, self.requests - self.new_connections)
+
+    def since(self, earlier: "ConnectionStats") -> "ConnectionStats":
+        """Return the counts accumulated after an earlier snapshot."""
+        return ConnectionStats(**{
+            name: value - getattr(earlier, name) for name, value in asdict(self).items()
+        })
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the counters to a dictionary, including reused connections."""
+        return {**asdict(self), 'reused_connections': self.reused_connections}
+
+
+class PooledHTTPClient:
+    """An ``httpx.Client`` with a bounded keep-alive pool that counts new connections."""
+
+    def __init__(
+        self,
+        max_connections: int,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        timeout: Optional[float] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            max_connections: Upper bound of open connections, also kept alive
+            keepalive_expiry: Seconds an idle connection stays in the pool
+            http2: Negotiate HTTP/2 where the server supports it
+            timeout: Default request timeout in seconds (None for no timeout)
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+                http2 = False
+
+        self.max_connections = max(1, max_connections)
+        self.http2 = http2
+        self._stats = ConnectionStats()
+        self._lock = threading.Lock()
+
+        self.client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            timeout=timeout,
+            event_hooks={'request': [self._on_request]},
+        )
+
+    def _on_request(self, request: httpx.Request) -> None:
+        """Count the request and trace which connection it ends up on."""
+        with self._lock:
+            self._stats.requests += 1
+        request.extensions['trace'] = self._tracer(request.extensions.get('trace'))
+
+    def _tracer(self, inner: Optional[Callable[[str, Dict[str, Any]], None]]) -> Callable:
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            # Connection setup events are only emitted when the pool opens a new connection
+            if event_name == 'connection.connect_tcp.complete':
+                with self._lock:
+                    self._stats.new_connections += 1
+            elif event_name == 'connection.start_tls.complete':
+                with self._lock:
+                    self._stats.tls_handshakes += 1
+            if inner is not None:
+                inner(event_name, info)
+        return trace
+
+    def get_stats(self) -> ConnectionStats:
+        """Get a snapshot of the connection counters."""
+        with self._lock:
+            return ConnectionStats(**asdict(self._stats))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.client.close()
@@ -0,0 +1,161 @@
+"""Reuse of analysis results from a previous report for revised documents."""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .data_models import AnalysisResult, TextBlock, ThesisAnalysisReport
+from .report_compression import read_report_bytes
+
+logger = logging.getLogger(__name__)
+
+# Configuration keys that change what the LLM is asked to find
+ANALYSIS_CONFIGURATION_KEYS = (
+    'grammar_analysis_enabled',
+    'content_analysis_enabled',
+    'citation_analysis_enabled',
+    'citation_style',
+)
+
+
+def normalize_block_text(text: str) -> str:
+    """Normalize whitespace and case so that reflowed text compares equal."""
+    return " ".join(text.split()).casefold()
+
+
+def block_fingerprint(text: str) -> str:
+    """
+    Compute a content hash of a text block.
+
+    Args:
+        text: Block content
+
+    Returns:
+        Hex digest of the normalized content
+    """
+    return hashlib.sha256(normalize_block_text(text).encode('utf-8')).hexdigest()
+
+
+def load_baseline_report(report_path: str) -> ThesisAnalysisReport:
+    """
+    Load a previously exported JSON analysis report.
+
+    Args:
+        report_path: Path to the JSON report, optionally gzip- or zstd-compressed
+
+    Returns:
+        The parsed report
+
+    Raises:
+        FileNotFoundError: If the report does not exist
+        ValueError: If the file is not a valid analysis report
+    """
+    path = Path(report_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Baseline report not found: {path}")
+
+    try:
+        return ThesisAnalysisReport.model_validate_json(read_report_bytes(path))
+    except Exception as e:
+        raise ValueError(f"Invalid baseline report {path}: {e}")
+
+
+def is_baseline_compatible(
+    baseline: ThesisAnalysisReport,
+    configuration: Dict[str, Any]
+) -> bool:
+    """
+    Check whether baseline results were produced with the same analysis settings.
+
+    Args:
+        baseline: Previously generated report
+        configuration: Configuration of the current run
+
+    Returns:
+        True if results of the baseline can be reused
+    """
+    baseline_configuration = baseline.configuration_used or {}
+    for key in ANALYSIS_CONFIGURATION_KEYS:
+        # Older reports may not record every key; only compare what is known
+        if key in baseline_configuration and baseline_configuration[key] != configuration.get(key):
+            logger.warning(
+                f"Baseline report used {key}={baseline_configuration[key]!r}, "
+                f"current run uses {configuration.get(key)!r}; re-analyzing all blocks"
+            )
+            return False
+
+    if baseline_configuration.get('model') not in (None, configuration.get('model')):
+        logger.warning(
+            f"Baseline report was produced with model {baseline_configuration.get('model')}, "
+            f"reusing its results for unchanged blocks"
+        )
+    return True
+
+
+class BaselineMatcher:
+    """Aligns text blocks of a revised document with results of a baseline report."""
+
+    def __init__(self, baseline: ThesisAnalysisReport):
+        """
+        Index the reusable results of a baseline report.
+
+        Args:
+            baseline: Previously generated report
+        """
+        # Reports are written in completion order
+        results = sorted(baseline.analysis_results, key=lambda result: result.text_block.block_index)
+        self._baseline_count = max(len(results), 1)
+        # Fingerprint -> list of (relative position, result)
+        self._candidates: Dict[str, List[Tuple[float, AnalysisResult]]] = {}
+
+        for position, result in enumerate(results):
+            # Failed analyses have no findings worth carrying over
+            if result.analysis_failed:
+                continue
+            fingerprint = block_fingerprint(result.text_block.content)
+            self._candidates.setdefault(fingerprint, []).append(
+                (position / self._baseline_count, result)
+            )
+
+    def match(
+        self,
+        text_blocks: List[TextBlock]
+    ) -> Tuple[List[AnalysisResult], List[TextBlock]]:
+        """
+        Split blocks into those with reusable results and those to analyze.
+
+        Blocks are matched by content hash; when identical content occurs
+        several times, the baseline block closest in relative document
+        position is chosen. Every baseline result is reused at most once.
+
+        Args:
+            text_blocks: Blocks extracted from the revised document
+
+        Returns:
+            Tuple of (relocated reused results, blocks that need analysis)
+        """
+        reused: List[AnalysisResult] = []
+        to_analyze: List[TextBlock] = []
+        block_count = max(len(text_blocks), 1)
+
+        for position, text_block in enumerate(text_blocks):
+            candidates = self._candidates.get(block_fingerprint(text_block.content))
+            if not candidates:
+                to_analyze.append(text_block)
+                continue
+
+            relative_position = position / block_count
+            best = min(
+                range(len(candidates)),
+                key=lambda i: abs(candidates[i][0] - relative_position)
+            )
+            _, result = candidates.pop(best)
+            # Sharing from the baseline run does not carry over; its block indices are stale
+            reused.append(result.relocated(text_block, reused_from_baseline=True, duplicate_of=None))
+
+        logger.info(
+            f"Baseline alignment: {len(reused)} blocks reused, "
+            f"{len(to_analyze)} new or changed blocks to analyze"
+        )
+        return reused, to_analyze
@@ -3,7 +3,7 @@
 import json
 import logging
 import re
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Callable, Collection
 import dspy
 from pydantic import ValidationError
 from langdetect import detect, LangDetectException
@@ -14,11 +14,13 @@ from .data_models import (
     ContentPlausibilityError, 
     CitationFormatError,
     TextBlock,
+    BlockKind,
     LocationHint,
     ErrorSeverity,
     ErrorType
 )
-from .config import get_settings, get_rate_limiter
+from .config import get_settings, get_rate_limiter, get_request_controller
+from .hedging import LLMCallTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +220,44 @@ def extract_json_from_text(text: str) -> Optional[List[Dict[str, Any]]]:
     return None
 
 
+def call_llm_module(
+    predictor: Callable,
+    settings,
+    rate_limiter=None,
+    **kwargs
+) -> Any:
+    """
+    Call a DSPy predictor under rate limiting, the call deadline and hedging.
+    
+    Args:
+        predictor: DSPy module performing the LLM request
+        settings: Active VeritaScribe settings
+        rate_limiter: Provider rate limiter, or None if rate limiting is disabled
+        **kwargs: Predictor inputs
+        
+    Returns:
+        Predictor response
+        
+    Raises:
+        LLMCallTimeoutError: If the call did not finish before its deadline
+    """
+    controller = get_request_controller()
+    if rate_limiter is None:
+        return controller.call(predictor, **kwargs)
+    
+    # Hedges only go out if the rate limit has room for them right away
+    def hedge_permit() -> bool:
+        return rate_limiter.try_acquire(settings.llm_provider)
+    
+    return rate_limiter.rate_limited_call(
+        settings.llm_provider,
+        controller.call,
+        predictor,
+        hedge_permit=hedge_permit,
+        **kwargs
+    )
+
+
 class LinguisticAnalysisSignature(dspy.Signature):
     """DSPy signature for grammar and linguistic analysis with language awareness."""
     
@@ -304,18 +344,13 @@ class LinguisticAnalyzer(dspy.Module):
                 # For now, fall back to regular module
             
             # Call DSPy module with language context and rate limiting
-            if self.rate_limiter:
-                response = self.rate_limiter.rate_limited_call(
-                    self.settings.llm_provider,
-                    self.analyzer,
-                    text_chunk=text_block.content,
-                    language=language
-                )
-            else:
-                response = self.analyzer(
-                    text_chunk=text_block.content,
-                    language=language
-                )
+            response = call_llm_module(
+                self.analyzer,
+                self.settings,
+                self.rate_limiter,
+                text_chunk=text_block.content,
+                language=language
+            )
             
             # Parse JSON response with robust error handling
             errors_data = safe_json_parse(response.grammar_errors, ['error_type', 'severity', 'original_text'])
@@ -345,6 +380,8 @@ class LinguisticAnalyzer(dspy.Module):
             logger.debug(f"Found {len(grammar_errors)} grammar errors in block {text_block.block_index} ({language})")
             return grammar_errors
             
+        except LLMCallTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Error in linguistic analysis: {e}")
             return []
@@ -383,20 +420,14 @@ class ContentValidator(dspy.Module):
                 # Use compiled module - implementation would depend on DSPy API
             
             # Call DSPy module with language context and rate limiting
-            if self.rate_limiter:
-                response = self.rate_limiter.rate_limited_call(
-                    self.settings.llm_provider,
-                    self.validator,
-                    text_chunk=text_block.content,
-                    context=context,
-                    language=language
-                )
-            else:
-                response = self.validator(
-                    text_chunk=text_block.content,
-                    context=context,
-                    language=language
-                )
+            response = call_llm_module(
+                self.validator,
+                self.settings,
+                self.rate_limiter,
+                text_chunk=text_block.content,
+                context=context,
+                language=language
+            )
             
             # Parse JSON response with robust error handling
             errors_data = safe_json_parse(response.content_errors, ['error_type', 'severity', 'original_text'])
@@ -426,6 +457,8 @@ class ContentValidator(dspy.Module):
             logger.debug(f"Found {len(content_errors)} content errors in block {text_block.block_index} ({language})")
             return content_errors
             
+        except LLMCallTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Error in content validation: {e}")
             return []
@@ -471,22 +504,15 @@ class CitationChecker(dspy.Module):
                 # Use compiled module - implementation would depend on DSPy API
             
             # Call DSPy module with language context and rate limiting
-            if self.rate_limiter:
-                response = self.rate_limiter.rate_limited_call(
-                    self.settings.llm_provider,
-                    self.checker,
-                    text_chunk=text_block.content,
-                    bibliography=bibliography,
-                    citation_style=citation_style,
-                    language=language
-                )
-            else:
-                response = self.checker(
-                    text_chunk=text_block.content,
-                    bibliography=bibliography,
-                    citation_style=citation_style,
-                    language=language
-                )
+            response = call_llm_module(
+                self.checker,
+                self.settings,
+                self.rate_limiter,
+                text_chunk=text_block.content,
+                bibliography=bibliography,
+                citation_style=citation_style,
+                language=language
+            )
             
             # Parse JSON response with robust error handling
             errors_data = safe_json_parse(response.citation_errors, ['error_type', 'severity', 'original_text'])
@@ -520,11 +546,25 @@ class CitationChecker(dspy.Module):
             logger.debug(f"Found {len(citation_errors)} citation errors in block {text_block.block_index} ({language})")
             return citation_errors
             
+        except LLMCallTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Error in citation checking: {e}")
             return []
 
 
+# Analysis modules each kind of block is sent to; content checks of tables,
+# formulas and reference entries and any check of code listings only produce
+# noise, while grammar is still checked wherever a block may hold prose
+BLOCK_KIND_MODULES = {
+    BlockKind.PROSE: ("grammar", "content", "citation"),
+    BlockKind.TABLE: ("grammar",),
+    BlockKind.MATH: ("grammar",),
+    BlockKind.CODE: (),
+    BlockKind.REFERENCE: ("grammar", "citation"),
+}
+
+
 class AnalysisOrchestrator:
     """Orchestrates multiple analysis modules for comprehensive text evaluation."""
     
@@ -546,7 +586,9 @@ class AnalysisOrchestrator:
         text_block: TextBlock,
         bibliography: str = "",
         citation_style: str = "APA",
-        context: str = "academic thesis"
+        context: str = "academic thesis",
+        modules: Optional[Collection[str]] = None,
+        raise_on_timeout: bool = False
     ) -> List[Union[GrammarCorrectionError, ContentPlausibilityError, CitationFormatError]]:
         """
         Perform comprehensive analysis on a text block using all enabled modules.
@@ -556,11 +598,27 @@ class AnalysisOrchestrator:
             bibliography: Full bibliography section if available
             citation_style: Expected citation style
             context: Document context for content analysis
+            modules: Modules to run among "grammar", "content" and "citation"
+                (those the block's kind is routed to if None)
+            raise_on_timeout: Raise when a module timed out instead of
+                returning the errors of the modules that finished, so the
+                caller can record the block as failed
             
         Returns:
             List of all detected errors from all analysis modules
+            
+        Raises:
+            LLMCallTimeoutError: If ``raise_on_timeout`` is set and a module
+                did not finish before its deadline
         """
         all_errors = []
+        timed_out = []
+        
+        if modules is None:
+            modules = BLOCK_KIND_MODULES[text_block.kind]
+        if not modules:
+            logger.debug(f"Skipping analysis of {text_block.kind.value} block {text_block.block_index}")
+            return all_errors
         
         try:
             # Detect language for this text block
@@ -568,32 +626,52 @@ class AnalysisOrchestrator:
             logger.debug(f"Detected language for block {text_block.block_index}: {detected_language}")
             
             # Grammar analysis
-            if self.linguistic_analyzer:
+            if self.linguistic_analyzer and "grammar" in modules:
                 try:
                     grammar_errors = self.linguistic_analyzer(text_block, language=detected_language)
                     all_errors.extend(grammar_errors)
+                except LLMCallTimeoutError as e:
+                    logger.warning(f"Grammar analysis timed out for block {text_block.block_index}: {e}")
+                    timed_out.append("grammar")
                 except Exception as e:
                     logger.error(f"Grammar analysis failed for block {text_block.block_index}: {e}")
             
             # Content validation
-            if self.content_validator:
+            if self.content_validator and "content" in modules:
+                # The section a block belongs to frames its content without sending neighboring text
+                block_context = f"{context}, section: {' > '.join(text_block.section_path)}" \
+                    if text_block.section_path else context
                 try:
-                    content_errors = self.content_validator(text_block, context, language=detected_language)
+                    content_errors = self.content_validator(text_block, block_context, language=detected_language)
                     all_errors.extend(content_errors)
+                except LLMCallTimeoutError as e:
+                    logger.warning(f"Content validation timed out for block {text_block.block_index}: {e}")
+                    timed_out.append("content")
                 except Exception as e:
                     logger.error(f"Content validation failed for block {text_block.block_index}: {e}")
             
             # Citation checking
-            if self.citation_checker:
+            if self.citation_checker and "citation" in modules:
                 try:
                     citation_errors = self.citation_checker(text_block, bibliography, citation_style, language=detected_language)
                     all_errors.extend(citation_errors)
+                except LLMCallTimeoutError as e:
+                    logger.warning(f"Citation checking timed out for block {text_block.block_index}: {e}")
+                    timed_out.append("citation")
                 except Exception as e:
                     logger.error(f"Citation checking failed for block {text_block.block_index}: {e}")
             
+            # An incomplete analysis can be reported as failed so it is retried on resume
+            if timed_out and raise_on_timeout:
+                raise LLMCallTimeoutError(
+                    f"{', '.join(timed_out)} analysis of block {text_block.block_index} timed out"
+                )
+            
             logger.debug(f"Total errors found in block {text_block.block_index}: {len(all_errors)}")
             return all_errors
             
+        except LLMCallTimeoutError:
+            raise
         except Exception as e:
             logger.error(f"Analysis orchestration failed for block {text_block.block_index}: {e}")
             return []
@@ -1,20 +1,26 @@
 """Main CLI interface for VeritaScribe using Typer."""
 
+import json
 import logging
+import os
 import sys
+import threading
+from datetime import timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
 
 from .config import get_settings, initialize_system, get_dspy_config, PROVIDER_MODELS
 from .pipeline import create_analysis_pipeline, create_quick_pipeline
+from .batch import BatchAnalyzer, collect_batch_inputs, save_batch_summary
 from .report_generator import create_report_generator
-from .pdf_processor import create_test_pdf
+from .report_export import check_report_formats, error_records, export_report
+from .pdf_processor import create_test_pdf, PageSelection
 from .data_models import ErrorSeverity
 
 # Configure logging
@@ -66,6 +72,31 @@ def analyze(
         False,
         "--annotate", 
         help="Generate an annotated PDF with highlighted errors"
+    ),
+    baseline: Optional[str] = typer.Option(
+        None,
+        "--baseline", "-b",
+        help="JSON report of a previous version; only new or changed blocks are re-analyzed"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Resume an interrupted analysis of the same file and settings from its checkpoint"
+    ),
+    ndjson: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Stream detected errors to stdout as NDJSON (other output goes to stderr)"
+    ),
+    pages: Optional[str] = typer.Option(
+        None,
+        "--pages", "-p",
+        help="Only analyze these pages, e.g. '40-80' or '1-3,10'"
+    ),
+    sections: Optional[List[str]] = typer.Option(
+        None,
+        "--sections", "-s",
+        help="Only analyze sections with this title (repeatable), e.g. 'Methodology'"
     )
 ):
     """Analyze a thesis PDF document for quality issues."""
@@ -73,6 +104,9 @@ def analyze(
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # Keep stdout clean for the NDJSON stream
+    ndjson_stream = _detach_stdout() if ndjson else None
+    
     # Validate input file
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
@@ -83,9 +117,24 @@ def analyze(
         console.print(f"[red]Error: File must be a PDF: {pdf_path}[/red]")
         raise typer.Exit(1)
     
+    selection = _build_selection(pages, sections)
+    
+    if baseline and not Path(baseline).exists():
+        console.print(f"[red]Error: Baseline report not found: {baseline}[/red]")
+        raise typer.Exit(1)
+    
+    if baseline and quick:
+        console.print("[yellow]⚠ --baseline is ignored in quick mode[/yellow]")
+    
+    settings = get_settings()
+    try:
+        check_report_formats(settings.report_formats, settings.report_compression)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    
     # Set up output directory
     if output_dir is None:
-        settings = get_settings()
         output_dir = settings.output_directory
     
     output_path = Path(output_dir)
@@ -95,28 +144,32 @@ def analyze(
     console.print(f"[blue]Output directory: {output_path}[/blue]")
     
     try:
-        # Initialize system
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            
-            # Analysis phase
-            task = progress.add_task("Analyzing document...", total=None)
+        if quick:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Analyzing document...", total=None)
+                pipeline = create_quick_pipeline(str(output_path))
+                report = pipeline.quick_analyze(str(pdf_file), max_blocks=10, selection=selection)
+                progress.update(task, description="Analysis complete!")
             
-            if quick:
-                pipeline = create_quick_pipeline()
-                report = pipeline.quick_analyze(str(pdf_file), max_blocks=10)
-            else:
-                pipeline = create_analysis_pipeline()
-                report = pipeline.analyze_thesis(
-                    str(pdf_file),
-                    str(output_path),
-                    citation_style=citation_style
-                )
-            
-            progress.update(task, description="Analysis complete!")
+            if ndjson_stream:
+                for result in report.analysis_results:
+                    _emit_ndjson_errors(result, report.document_name, ndjson_stream)
+            export_paths = None
+        else:
+            # The pipeline saves the report files itself
+            report, export_paths = _run_streaming_analysis(
+                pdf_file,
+                output_path,
+                citation_style=citation_style,
+                baseline=baseline,
+                resume=resume,
+                selection=selection,
+                ndjson_stream=ndjson_stream
+            )
         
         # Display results summary
         _display_analysis_summary(report)
@@ -139,9 +192,15 @@ def analyze(
             #text_report_path = output_path / f"{report_name}_report.md"
             #report_generator.generate_text_report(report, str(text_report_path))
             
-            # Generate JSON export
-            json_report_path = output_path / f"{report_name}_data.json"
-            report_generator.export_json_report(report, str(json_report_path))
+            # Save the report files of quick analyses
+            if export_paths is None:
+                export_paths = export_report(
+                    report,
+                    output_path / report_name,
+                    settings.report_formats,
+                    settings.report_compression,
+                    settings.compact_reports
+                )
             
             # Generate visualizations
             if not no_visualizations and report.total_errors > 0:
@@ -172,7 +231,8 @@ def analyze(
         console.print("\n[green]✓ Analysis completed successfully![/green]")
         console.print(f"\n[bold]Generated files:[/bold]")
         #console.print(f"  📄 Text report: {text_report_path}")
-        console.print(f"  📊 JSON data: {json_report_path}")
+        for report_format, path in export_paths.items():
+            console.print(f"  📊 {report_format.upper()} data: {path}")
         
         if not no_visualizations and report.total_errors > 0:
             console.print(f"  📈 Visualizations: {viz_dir}/")
@@ -184,6 +244,11 @@ def analyze(
         summary = report_generator.create_summary_report(report)
         console.print(f"\n[bold]Recommendation:[/bold] {summary['recommendation']}")
         
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Analysis interrupted by user[/yellow]")
+        if not quick and get_settings().checkpoint_enabled:
+            console.print("Completed blocks were checkpointed; continue with [bold]--resume[/bold]")
+        raise typer.Exit(130)
     except Exception as e:
         console.print(f"[red]Analysis failed: {str(e)}[/red]")
         if verbose:
@@ -191,10 +256,140 @@ def analyze(
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    source: str = typer.Argument(..., help="Directory of PDF files or glob pattern, e.g. 'theses/**/*.pdf'"),
+    output_dir: Optional[str] = typer.Option(
+        None,
+        "--output", "-o",
+        help="Output directory for per-document reports and the batch summary"
+    ),
+    citation_style: str = typer.Option(
+        "APA",
+        "--citation-style", "-c",
+        help="Expected citation style (APA, MLA, Chicago, etc.)"
+    ),
+    max_documents: Optional[int] = typer.Option(
+        None,
+        "--max-documents", "-m",
+        help="Documents analyzed concurrently (defaults to BATCH_MAX_DOCUMENTS)"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Resume documents from the checkpoints of an interrupted batch"
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose", "-v",
+        help="Enable verbose logging"
+    )
+):
+    """Analyze many thesis PDFs with one scheduler sharing the rate-limit budget."""
+    
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    pdf_files = collect_batch_inputs(source)
+    if not pdf_files:
+        console.print(f"[red]Error: No PDF files found for: {source}[/red]")
+        raise typer.Exit(1)
+    
+    if output_dir is None:
+        output_dir = get_settings().output_directory
+    
+    console.print(f"[blue]Starting batch analysis of {len(pdf_files)} documents[/blue]")
+    console.print(f"[blue]Output directory: {output_dir}[/blue]")
+    
+    analyzer = BatchAnalyzer(
+        output_dir,
+        citation_style=citation_style,
+        max_active_documents=max_documents,
+        resume=resume
+    )
+    
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console
+        ) as progress_bar:
+            documents_task = progress_bar.add_task("Documents", total=len(pdf_files))
+            blocks_task = progress_bar.add_task("Blocks", total=0)
+            
+            # Block counts of pipelined documents grow while they are extracted
+            known_totals: Dict[Path, int] = {}
+            totals_lock = threading.Lock()
+            
+            def on_progress(pdf_path, progress):
+                if progress.is_complete:
+                    return
+                with totals_lock:
+                    added = progress.total_blocks - known_totals.get(pdf_path, 0)
+                    if added:
+                        known_totals[pdf_path] = progress.total_blocks
+                        total = progress_bar.tasks[blocks_task].total or 0
+                        progress_bar.update(blocks_task, total=total + added)
+                if progress.result is not None:
+                    progress_bar.advance(blocks_task)
+            
+            def on_document_complete(document):
+                progress_bar.advance(documents_task)
+                if document.status == "completed":
+                    progress_bar.console.print(
+                        f"[green]✓[/green] {document.document_name}: {document.total_errors} errors "
+                        f"in {document.total_text_blocks} blocks ({document.processing_time_seconds:.1f}s)"
+                    )
+                else:
+                    progress_bar.console.print(
+                        f"[red]✗ {document.document_name}: {document.error_message}[/red]"
+                    )
+            
+            summary = analyzer.run(pdf_files, on_progress, on_document_complete)
+        
+        summary_path = save_batch_summary(summary, output_dir)
+        
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Batch interrupted by user[/yellow]")
+        if get_settings().checkpoint_enabled:
+            console.print("Completed blocks were checkpointed; continue with [bold]--resume[/bold]")
+        raise typer.Exit(130)
+    except Exception as e:
+        console.print(f"[red]Batch analysis failed: {str(e)}[/red]")
+        if verbose:
+            console.print_exception()
+        raise typer.Exit(1)
+    
+    throughput = summary.throughput()
+    summary_text = [
+        f"📚 Documents: {summary.documents_completed} completed, {summary.documents_failed} failed",
+        f"📄 Pages: {summary.total_pages} | 🔍 Blocks: {summary.total_text_blocks}",
+        f"⚠️  Total errors: {summary.total_errors}",
+        f"⏱️  Wall time: {timedelta(seconds=int(summary.wall_time_seconds))}",
+        f"🚀 Throughput: {throughput['documents_per_hour']:.1f} documents/h, "
+        f"{throughput['pages_per_minute']:.1f} pages/min, {throughput['blocks_per_second']:.2f} blocks/s",
+    ]
+    if summary.estimated_cost:
+        summary_text.append(f"💰 Estimated cost: ${summary.estimated_cost:.4f}")
+    console.print(Panel("\n".join(summary_text), title="Batch Results", border_style="blue"))
+    console.print(f"\n[bold]Batch summary:[/bold] {summary_path}")
+    
+    if summary.documents_failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def quick(
     pdf_path: str = typer.Argument(..., help="Path to the PDF thesis file to analyze"),
-    blocks: int = typer.Option(5, "--blocks", "-b", help="Number of text blocks to analyze")
+    blocks: int = typer.Option(5, "--blocks", "-b", help="Number of text blocks to analyze"),
+    pages: Optional[str] = typer.Option(
+        None, "--pages", "-p", help="Only analyze these pages, e.g. '40-80' or '1-3,10'"
+    ),
+    sections: Optional[List[str]] = typer.Option(
+        None, "--sections", "-s", help="Only analyze sections with this title (repeatable)"
+    )
 ):
     """Perform quick analysis on a subset of the document."""
     
@@ -203,12 +398,14 @@ def quick(
         console.print(f"[red]Error: PDF file not found: {pdf_path}[/red]")
         raise typer.Exit(1)
     
+    selection = _build_selection(pages, sections)
+    
     console.print(f"[blue]Quick analysis of: {pdf_file.name} (first {blocks} blocks)[/blue]")
     
     try:
         with console.status("[bold green]Analyzing...") as status:
             pipeline = create_quick_pipeline()
-            report = pipeline.quick_analyze(str(pdf_file), max_blocks=blocks)
+            report = pipeline.quick_analyze(str(pdf_file), max_blocks=blocks, selection=selection)
         
         _display_analysis_summary(report, quick=True)
         
@@ -536,6 +733,99 @@ def test():
         raise typer.Exit(1)
 
 
+def _build_selection(pages: Optional[str], sections: Optional[List[str]]) -> Optional[PageSelection]:
+    """Create the page selection from CLI options, exiting on invalid input."""
+    if not pages and not sections:
+        return None
+    try:
+        return PageSelection(pages=pages, sections=sections)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _run_streaming_analysis(
+    pdf_file: Path,
+    output_path: Path,
+    citation_style: str,
+    baseline: Optional[str],
+    resume: bool,
+    selection: Optional[PageSelection] = None,
+    ndjson_stream=None
+):
+    """Run the full analysis with a live progress bar and return the report and its saved files."""
+    pipeline = create_analysis_pipeline()
+    report = None
+    export_paths: Dict[str, str] = {}
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[rate]:.2f} blocks/s"),
+        TextColumn("ETA {task.fields[eta]}"),
+        TextColumn("[red]{task.fields[errors]} errors[/red]"),
+        console=console
+    ) as progress_bar:
+        task = progress_bar.add_task("Preparing document...", total=None, rate=0.0, eta="-:--:--", errors=0)
+        
+        for progress in pipeline.stream_analysis(
+            str(pdf_file),
+            str(output_path),
+            citation_style=citation_style,
+            baseline_report=baseline,
+            resume=resume,
+            selection=selection
+        ):
+            if progress.is_complete:
+                report = progress.report
+                export_paths = progress.export_paths
+                progress_bar.update(task, description="Analysis complete!")
+                continue
+            
+            if progress.result is None:
+                progress_bar.update(task, total=progress.total_blocks, description="Analyzing blocks")
+                continue
+            
+            eta = progress.eta_seconds
+            progress_bar.update(
+                task,
+                total=progress.total_blocks,
+                completed=progress.completed_blocks,
+                rate=progress.blocks_per_second,
+                eta=str(timedelta(seconds=int(eta))) if eta is not None else "-:--:--",
+                errors=progress.errors_found
+            )
+            if ndjson_stream:
+                _emit_ndjson_errors(progress.result, pdf_file.name, ndjson_stream)
+    
+    return report, export_paths
+
+
+def _detach_stdout():
+    """
+    Reserve stdout for machine-readable output.
+    
+    Everything else written to stdout, including output of third-party
+    libraries, is sent to stderr from now on.
+    
+    Returns:
+        Text stream writing to the original stdout
+    """
+    sys.stdout.flush()
+    stream = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8', buffering=1)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    console.stderr = True
+    return stream
+
+
+def _emit_ndjson_errors(result, document_name: str, stream):
+    """Write each error of an analysis result as one JSON line."""
+    for record in error_records(result, document_name):
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
 def _display_analysis_summary(report, quick: bool = False):
     """Display a summary of analysis results."""
     
@@ -549,6 +839,25 @@ def _display_analysis_summary(report, quick: bool = False):
     summary_text.append(f"📄 Pages: {report.total_pages}")
     summary_text.append(f"📝 Words: {report.total_words:,}")
     summary_text.append(f"🔍 Text blocks analyzed: {report.total_text_blocks}")
+    if report.baseline_report:
+        summary_text.append(
+            f"♻️  Reused from baseline: {report.reused_blocks} | Re-analyzed: {report.reanalyzed_blocks}"
+        )
+    if report.resumed_blocks:
+        summary_text.append(f"⏯️  Restored from checkpoint: {report.resumed_blocks}")
+    if report.deduplicated_blocks:
+        summary_text.append(f"🧬 Duplicate blocks sharing an analysis: {report.deduplicated_blocks}")
+    request_stats = report.request_stats or {}
+    if request_stats.get('timeouts') or request_stats.get('hedged_requests'):
+        summary_text.append(
+            f"⏱️  LLM calls timed out: {request_stats.get('timeouts', 0)} | "
+            f"Hedged: {request_stats.get('hedged_requests', 0)} ({request_stats.get('hedges_won', 0)} won)"
+        )
+    if request_stats.get('requests'):
+        summary_text.append(
+            f"🔌 HTTP connections: {request_stats.get('new_connections', 0)} new, "
+            f"{request_stats.get('reused_connections', 0)} reused"
+        )
     summary_text.append(f"⚠️  Total errors: {report.total_errors}")
     
     if report.total_words > 0:
@@ -605,7 +914,7 @@ def _display_analysis_summary(report, quick: bool = False):
                 console.print(f"\n[bold]Severity Breakdown:[/bold] {' | '.join(severity_info)}")
         
         # High priority issues
-        high_severity_errors = report.get_high_severity_errors()
+        high_severity_errors = report.index.high_severity_errors
         if high_severity_errors:
             console.print(f"\n[red]🚨 {len(high_severity_errors)} high-priority issues require immediate attention![/red]")
     
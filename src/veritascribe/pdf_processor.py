@@ -1,31 +1,387 @@
 """PDF processing module using PyMuPDF for text extraction with layout preservation."""
 
 import fitz  # PyMuPDF
-from typing import List, Optional, Tuple, Dict, Any
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple, Dict, Any, Iterator, Sequence
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import itertools
 import logging
+import multiprocessing
+import os
 import re
 
-from .data_models import TextBlock, LocationHint
-from .config import get_settings
+from .data_models import BlockKind, TextBlock, LocationHint
+from .config import get_settings, VeritaScribeSettings
+from .boilerplate import RepeatedMarginDetector
+from .block_classifier import BlockClassifier
+from .bibliography import BibliographyLocation, bibliography_text, locate_bibliography
+from .chunking import BlockChunker, RawBlock
+from .extraction_cache import ExtractionCache, compute_extraction_key
+from .sections import NUMBERED_HEADING_PATTERN, BlockFont, SectionNode, SectionTracker, block_font, build_section_tree
+from .text_cleaning import CLEANING_VERSION, clean_extracted_text, fix_german_umlauts, remove_line_break_hyphens
 
 logger = logging.getLogger(__name__)
 
 
+def parse_page_ranges(spec: str) -> List[Tuple[int, Optional[int]]]:
+    """
+    Parse a page range specification like ``"40-80"`` or ``"1-3,10,50-"``.
+    
+    Args:
+        spec: Comma-separated 1-indexed pages or inclusive ranges; a range
+            without end runs to the last page
+        
+    Returns:
+        List of (first, last) tuples with last None for open ranges
+        
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        match = re.fullmatch(r'(\d+)\s*(?:-\s*(\d*))?', part)
+        if not match:
+            raise ValueError(f"Invalid page range: '{part}'")
+        first = int(match.group(1))
+        if match.group(2) is None:
+            last = first
+        else:
+            last = int(match.group(2)) if match.group(2) else None
+        if first < 1 or (last is not None and last < first):
+            raise ValueError(f"Invalid page range: '{part}'")
+        ranges.append((first, last))
+    
+    if not ranges:
+        raise ValueError(f"Empty page range: '{spec}'")
+    return ranges
+
+
+def _title_matches(section: str, title: str, exact: bool) -> bool:
+    """Compare a requested section name with a heading, ignoring case and numbering."""
+    section = section.casefold()
+    title = re.sub(r'^\d+(?:\.\d+)*\.?\s+', '', title.strip()).casefold()
+    return title == section if exact else section in title
+
+
+class PageSelection:
+    """Selects pages of a document by page ranges and/or section titles."""
+    
+    def __init__(self, pages: Optional[str] = None, sections: Optional[Sequence[str]] = None):
+        """
+        Initialize the selection.
+        
+        Args:
+            pages: Page range specification, e.g. ``"40-80"``
+            sections: Section titles, matched case-insensitively against the
+                document outline (or heading lines if there is no outline)
+            
+        Raises:
+            ValueError: If the page specification is malformed
+        """
+        self.pages = pages
+        self.page_ranges = parse_page_ranges(pages) if pages else []
+        self.sections = [section.strip() for section in (sections or []) if section.strip()]
+    
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing was selected, i.e. the whole document applies."""
+        return not self.page_ranges and not self.sections
+    
+    def describe(self) -> Dict[str, Any]:
+        """Selection as recorded in report configurations and checkpoint keys."""
+        return {'pages': self.pages, 'sections': list(self.sections)}
+    
+    def resolve(self, doc: fitz.Document) -> List[int]:
+        """
+        Resolve the selection to 0-indexed page numbers.
+        
+        Sections are selected at page granularity: from the page of the
+        section heading up to and including the page where the next heading
+        of the same or a higher level starts.
+        
+        Args:
+            doc: Open PyMuPDF document
+            
+        Returns:
+            Sorted list of 0-indexed page numbers
+            
+        Raises:
+            ValueError: If pages are out of range or a section is not found
+        """
+        page_count = len(doc)
+        if self.is_empty:
+            return list(range(page_count))
+        
+        selected = set()
+        for first, last in self.page_ranges:
+            if first > page_count:
+                raise ValueError(f"Page {first} is out of range (document has {page_count} pages)")
+            last = page_count if last is None else min(last, page_count)
+            selected.update(range(first - 1, last))
+        
+        if self.sections:
+            for first, last in self._resolve_sections(doc):
+                selected.update(range(first - 1, last))
+        
+        return sorted(selected)
+    
+    def _resolve_sections(self, doc: fitz.Document) -> List[Tuple[int, int]]:
+        """Find 1-indexed inclusive page ranges of the requested sections."""
+        toc = doc.get_toc()
+        ranges = self._sections_from_outline(toc, len(doc)) if toc else self._sections_from_headings(doc)
+        
+        missing = [section for section in self.sections if section not in ranges]
+        if missing:
+            source = "outline" if toc else "headings"
+            raise ValueError(f"Section(s) not found in document {source}: {', '.join(missing)}")
+        return list(ranges.values())
+    
+    def _sections_from_outline(self, toc: List[list], page_count: int) -> Dict[str, Tuple[int, int]]:
+        """Resolve sections using the PDF outline (table of contents)."""
+        ranges: Dict[str, Tuple[int, int]] = {}
+        for section in self.sections:
+            # Prefer an exact title match over a partial one
+            matches = [
+                index for exact in (True, False)
+                for index, (_, title, page) in enumerate(toc)
+                if page >= 1 and _title_matches(section, title, exact)
+            ]
+            if not matches:
+                continue
+            index = matches[0]
+            level, _, page = toc[index]
+            end = page_count
+            for next_level, _, next_page in toc[index + 1:]:
+                if next_level <= level and next_page >= 1:
+                    end = max(page, next_page)
+                    break
+            ranges[section] = (page, end)
+        return ranges
+    
+    def _sections_from_headings(self, doc: fitz.Document) -> Dict[str, Tuple[int, int]]:
+        """
+        Resolve sections by scanning heading lines when there is no outline.
+        
+        Pages are read in order only until every requested section has ended.
+        """
+        logger.info("Document has no outline; locating sections by heading lines")
+        ranges: Dict[str, Tuple[int, int]] = {}
+        # Section -> (start page, heading depth, heading line) for sections not yet ended
+        open_sections: Dict[str, Tuple[int, int, str]] = {}
+        
+        for page_num in range(len(doc)):
+            for line in doc[page_num].get_text("text").splitlines():
+                line = line.strip()
+                if not line or len(line) > 100:
+                    continue
+                match = NUMBERED_HEADING_PATTERN.match(line)
+                depth = match.group(1).count('.') + 1 if match else None
+                
+                # A different heading of the same or a higher level ends an open
+                # section; repeats of its own heading are running headers
+                if depth is not None:
+                    for section, (start, section_depth, heading) in list(open_sections.items()):
+                        if depth <= section_depth and line.casefold() != heading:
+                            ranges[section] = (start, page_num + 1)
+                            del open_sections[section]
+                
+                for section in self.sections:
+                    if section in ranges or section in open_sections:
+                        continue
+                    # Without an outline only exact heading titles are reliable
+                    if _title_matches(section, line, exact=True):
+                        open_sections[section] = (page_num + 1, depth or 1, line.casefold())
+            
+            if len(ranges) == len(self.sections):
+                break
+        
+        for section, (start, _, _) in open_sections.items():
+            ranges[section] = (start, len(doc))
+        return ranges
+
+
+def _layout_from_text_blocks(text_blocks: List[tuple]) -> Dict[str, Any]:
+    """
+    Shape a page's ``get_text("blocks")`` extraction like its ``"dict"`` extraction.
+    
+    Every line becomes one span holding only its text; image blocks are dropped.
+    """
+    return {
+        "blocks": [
+            {
+                "bbox": (x0, y0, x1, y1),
+                "lines": [{"spans": [{"text": line}]} for line in text.removesuffix("\n").split("\n")],
+            }
+            for x0, y0, x1, y1, text, _, block_type in text_blocks
+            if block_type == 0
+        ]
+    }
+
+
+def _plain_text_from_dict(text_dict: Dict[str, Any]) -> str:
+    """Rebuild the output of ``page.get_text()`` from a page's ``"dict"`` extraction."""
+    return "".join(
+        "".join(span.get("text", "") for span in line.get("spans", [])) + "\n"
+        for block in text_dict.get("blocks", [])
+        for line in block.get("lines", [])
+    )
+
+
+@dataclass
+class _ExtractedPage:
+    """Raw blocks and plain text of one page."""
+    page_num: int
+    # Blocks before filtering and chunking
+    blocks: List[RawBlock]
+    height: float
+    text: Optional[str]
+    # Font metrics by raw block index, if sections are detected
+    fonts: Optional[Dict[int, BlockFont]] = None
+
+
+def _extraction_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for extraction workers.
+    
+    Forking a process that already runs LLM and HTTP threads is unsafe, and
+    spawned workers would each import the whole package. A fork server
+    imports this module once and forks workers from that clean process.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _extract_page_batch(
+    settings: VeritaScribeSettings,
+    pdf_path: str,
+    pages: List[int],
+    with_text: bool,
+    font_information: bool
+) -> List[_ExtractedPage]:
+    """Extract consecutive pages in a worker process with its own open document."""
+    processor = PDFProcessor(settings, font_information=font_information)
+    with fitz.open(pdf_path) as doc:
+        return [processor._extract_page(doc, page_num, with_text) for page_num in pages]
+
+
+@dataclass
+class DocumentExtraction:
+    """Everything the analysis needs from a PDF, extracted in one pass over its pages."""
+    text_blocks: List[TextBlock]
+    # Plain text as returned by ``page.get_text()`` of the extracted pages and
+    # the pages read to locate the bibliography, by 1-indexed page number
+    page_texts: Dict[int, str]
+    # Pages the bibliography spans
+    bibliography_pages: List[int]
+    # Cleaned text of the bibliography, from its heading to the next section
+    bibliography: Optional[str]
+    bibliography_location: Optional[BibliographyLocation]
+    # Document outline as returned by ``fitz.Document.get_toc()``
+    outline: List[list]
+    metadata: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the extraction to JSON-serializable data."""
+        return {
+            'text_blocks': [text_block.model_dump(mode='json') for text_block in self.text_blocks],
+            # JSON object keys are strings
+            'page_texts': [[page, text] for page, text in self.page_texts.items()],
+            'bibliography_pages': self.bibliography_pages,
+            'bibliography': self.bibliography,
+            'bibliography_location': asdict(self.bibliography_location) if self.bibliography_location else None,
+            'outline': self.outline,
+            'metadata': self.metadata,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentExtraction":
+        """Rebuild an extraction from the data of ``to_dict``."""
+        return cls(
+            text_blocks=[TextBlock(**text_block) for text_block in data['text_blocks']],
+            page_texts={page: text for page, text in data['page_texts']},
+            bibliography_pages=data['bibliography_pages'],
+            bibliography=data['bibliography'],
+            bibliography_location=BibliographyLocation(**data['bibliography_location'])
+            if data['bibliography_location'] else None,
+            outline=data['outline'],
+            metadata=data['metadata']
+        )
+    
+    def section_tree(self) -> SectionNode:
+        """Tree of the chapters and sections the text blocks are tagged with."""
+        return build_section_tree(self.text_blocks)
+
+
 class PDFProcessor:
     """Handles PDF document processing and text extraction."""
     
-    def __init__(self):
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[VeritaScribeSettings] = None, font_information: bool = False):
+        """
+        Initialize the processor.
+        
+        Args:
+            settings: Settings to use (the global settings if None)
+            font_information: Read full span dictionaries with font names,
+                sizes and flags even in the lighter "blocks" extraction mode;
+                always on when sections are detected
+        """
+        self.settings = settings or get_settings()
+        self.detect_sections = self.settings.detect_sections
+        self.font_information = font_information or self.detect_sections
+        # Block classification does not switch to "dict" mode: without font
+        # data it recognizes code by its symbols and keywords alone
+        self.extraction_mode = "dict" if self.font_information else self.settings.text_extraction_mode
         self.min_block_size = self.settings.min_text_block_size
         self.max_block_size = self.settings.max_text_block_size
+        self.chunker = BlockChunker(
+            target_tokens=self.settings.target_block_tokens,
+            max_chars=self.max_block_size,
+            coalesce=self.settings.coalesce_small_blocks
+        )
+        self.block_classifier = BlockClassifier(
+            detect_table_regions=self.settings.detect_table_regions
+        ) if self.settings.classify_blocks else None
+        self.margin_detector = RepeatedMarginDetector(
+            margin_fraction=self.settings.margin_band_fraction,
+            min_pages=self.settings.repeated_margin_min_pages
+        ) if self.settings.remove_repeated_margin_text else None
+        self.extraction_cache = ExtractionCache(
+            self.settings.extraction_cache_directory_for(),
+            max_bytes=int(self.settings.extraction_cache_max_mb * 1024 * 1024)
+        ) if self.settings.extraction_cache_enabled else None
+    
+    def use_output_directory(self, output_directory: str) -> None:
+        """
+        Cache extractions under the output directory of a run.
+        
+        An explicitly configured cache directory is kept.
+        
+        Args:
+            output_directory: Directory the run writes its reports to
+        """
+        if self.extraction_cache:
+            self.extraction_cache.directory = Path(self.settings.extraction_cache_directory_for(output_directory))
     
-    def extract_text_blocks_from_pdf(self, pdf_path: str) -> List[TextBlock]:
+    def extract_text_blocks_from_pdf(
+        self,
+        pdf_path: str,
+        selection: Optional["PageSelection"] = None
+    ) -> List[TextBlock]:
         """
         Extract text blocks from a PDF document with layout preservation.
         
         Args:
             pdf_path: Path to the PDF file
+            selection: Pages or sections to extract (all pages if None)
             
         Returns:
             List of TextBlock objects with content and location information
@@ -34,55 +390,429 @@ class PDFProcessor:
             FileNotFoundError: If PDF file doesn't exist
             fitz.FileDataError: If PDF file is corrupted or invalid
             PermissionError: If PDF is password protected
+            ValueError: If the selection does not match the document
+        """
+        if not Path(pdf_path).exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        # Page counts of large documents decide between in-process and parallel extraction
+        try:
+            with fitz.open(pdf_path) as doc:
+                page_count = len(selection.resolve(doc)) if selection else len(doc)
+        except fitz.FileDataError as e:
+            raise fitz.FileDataError(f"Invalid or corrupted PDF file: {e}")
+        
+        if self._extraction_workers(page_count) > 1:
+            return self.extract_document(pdf_path, selection, include_bibliography=False).text_blocks
+        
+        text_blocks = list(self.iter_text_blocks(pdf_path, selection))
+        
+        logger.info(f"Extracted {len(text_blocks)} valid text blocks from {Path(pdf_path).name}")
+        return text_blocks
+    
+    def extract_document(
+        self,
+        pdf_path: str,
+        selection: Optional["PageSelection"] = None,
+        include_bibliography: bool = True
+    ) -> DocumentExtraction:
+        """
+        Extract blocks, page texts, bibliography, outline and metadata in one pass.
+        
+        The document is opened once and every selected page is laid out once;
+        its plain text is rebuilt from the same extraction instead of a second
+        ``get_text()`` call. Pages outside the selection are only read as far
+        as locating the bibliography needs them. Large documents are extracted by a pool of worker
+        processes in page batches. Extractions are cached on disk by the
+        PDF's content hash and the extraction settings, so extracting an
+        unchanged document again skips parsing it.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            selection: Pages or sections to extract blocks from (all pages if None)
+            include_bibliography: Locate the bibliography and extract its text
+            
+        Returns:
+            DocumentExtraction of the document
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            fitz.FileDataError: If PDF file is corrupted or invalid
+            ValueError: If the selection does not match the document
         """
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        text_blocks = []
+        cache_key = None
+        if self.extraction_cache:
+            cache_key = self._extraction_cache_key(compute_pdf_hash(str(pdf_path)), selection, include_bibliography)
+            cached = self._load_cached_extraction(cache_key)
+            if cached:
+                logger.info(f"Loaded {len(cached.text_blocks)} text blocks of {pdf_path.name} from the extraction cache")
+                return cached
         
         try:
-            # Open PDF document
-            with fitz.open(pdf_path) as doc:
-                logger.info(f"Processing PDF: {pdf_path.name} ({len(doc)} pages)")
-                
-                for page_num in range(len(doc)):
-                    page = doc[page_num]
-                    page_blocks = self._extract_page_blocks(page, page_num + 1)
-                    text_blocks.extend(page_blocks)
-                    
-                    logger.debug(f"Extracted {len(page_blocks)} blocks from page {page_num + 1}")
+            doc = fitz.open(pdf_path)
+        except fitz.FileDataError as e:
+            raise fitz.FileDataError(f"Invalid or corrupted PDF file: {e}")
+        
+        with doc:
+            page_numbers = selection.resolve(doc) if selection else range(len(doc))
+            logger.info(f"Processing PDF: {pdf_path.name} ({len(page_numbers)} of {len(doc)} pages)")
+            
+            extracted = self._extract_pages(doc, pdf_path, list(page_numbers), include_bibliography)
+            page_texts = {page.page_num + 1: page.text for page in extracted if page.text is not None}
+            
+            outline = doc.get_toc()
+            bibliography_location, bibliography = self._locate_bibliography(doc, outline, page_texts) \
+                if include_bibliography else (None, None)
+            metadata = self._metadata_from_document(doc, pdf_path)
+        
+        raw_blocks = [text_block for page in extracted for text_block in page.blocks]
+        if self.margin_detector:
+            raw_blocks = self.margin_detector.remove_repeated(
+                raw_blocks, {page.page_num + 1: page.height for page in extracted}
+            )
         
+        # Merging never crosses pages, so every page is chunked on its own
+        section_tracker = SectionTracker() if self.detect_sections else None
+        fonts = {index: font for page in extracted for index, font in (page.fonts or {}).items()}
+        text_blocks: List[TextBlock] = []
+        for _, page_blocks in itertools.groupby(raw_blocks, key=lambda text_block: text_block.page_number):
+            page_blocks = list(page_blocks)
+            if section_tracker:
+                section_tracker.tag_page(page_blocks, fonts)
+            text_blocks.extend(self._filter_and_clean_blocks(page_blocks, first_index=len(text_blocks)))
+        
+        logger.info(f"Extracted {len(text_blocks)} valid text blocks from {pdf_path.name}")
+        extraction = DocumentExtraction(
+            text_blocks=text_blocks,
+            page_texts=page_texts,
+            bibliography_pages=bibliography_location.pages if bibliography_location else [],
+            bibliography=bibliography,
+            bibliography_location=bibliography_location,
+            outline=outline,
+            metadata=metadata
+        )
+        if cache_key:
+            self.extraction_cache.store(cache_key, extraction.to_dict())
+        return extraction
+    
+    def _extraction_cache_key(
+        self,
+        pdf_hash: str,
+        selection: Optional["PageSelection"],
+        include_bibliography: bool
+    ) -> str:
+        """Cache key of an extraction: the document and every setting that shapes the result."""
+        return compute_extraction_key(pdf_hash, {
+            'page_selection': selection.describe() if selection else None,
+            'include_bibliography': include_bibliography,
+            'min_text_block_size': self.min_block_size,
+            'max_text_block_size': self.max_block_size,
+            'target_block_tokens': self.settings.target_block_tokens,
+            'coalesce_small_blocks': self.settings.coalesce_small_blocks,
+            'remove_repeated_margin_text': self.settings.remove_repeated_margin_text,
+            'margin_band_fraction': self.settings.margin_band_fraction,
+            'repeated_margin_min_pages': self.settings.repeated_margin_min_pages,
+            'text_extraction_mode': self.extraction_mode,
+            'font_information': self.font_information,
+            'detect_sections': self.detect_sections,
+            'classify_blocks': self.settings.classify_blocks,
+            'detect_table_regions': self.settings.detect_table_regions,
+            'cleaning_version': CLEANING_VERSION,
+        })
+    
+    def _load_cached_extraction(self, cache_key: str) -> Optional[DocumentExtraction]:
+        """Load an extraction from the cache, or None if it is not cached."""
+        data = self.extraction_cache.load(cache_key)
+        if data is None:
+            return None
+        try:
+            return DocumentExtraction.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid extraction cache entry: {e}")
+            return None
+    
+    def _find_cached_extraction(
+        self,
+        pdf_path: Path,
+        selection: Optional["PageSelection"]
+    ) -> Optional[DocumentExtraction]:
+        """Find a cached extraction of the document with or without its bibliography."""
+        if not self.extraction_cache:
+            return None
+        pdf_hash = compute_pdf_hash(str(pdf_path))
+        for include_bibliography in (True, False):
+            cached = self._load_cached_extraction(self._extraction_cache_key(pdf_hash, selection, include_bibliography))
+            if cached:
+                return cached
+        return None
+    
+    def _extraction_workers(self, page_count: int) -> int:
+        """Number of worker processes for extracting this many pages (1 for in-process)."""
+        if page_count < self.settings.parallel_extraction_min_pages:
+            return 1
+        workers = self.settings.extraction_processes or os.cpu_count() or 1
+        # Every worker should get a few pages worth the process start
+        return max(1, min(workers, page_count // 16))
+    
+    def _extract_pages(
+        self,
+        doc: fitz.Document,
+        pdf_path: Path,
+        pages: List[int],
+        with_text: bool
+    ) -> List[_ExtractedPage]:
+        """
+        Extract the raw blocks of pages in page order with document-wide block indices.
+        
+        Args:
+            doc: Open document, used when extracting in-process
+            pdf_path: Path of the document, opened again by worker processes
+            pages: 0-indexed page numbers
+            with_text: Also return the plain text of every page
+            
+        Returns:
+            Extracted pages in the given order
+        """
+        workers = self._extraction_workers(len(pages))
+        if workers > 1:
+            try:
+                return self._extract_pages_parallel(pdf_path, pages, with_text, workers)
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel page extraction failed ({e}); extracting in-process")
+        
+        extracted: List[_ExtractedPage] = []
+        raw_count = 0
+        for page_num in pages:
+            page = self._extract_page(doc, page_num, with_text, raw_count)
+            raw_count += len(page.blocks)
+            extracted.append(page)
+        return extracted
+    
+    def _extract_pages_parallel(
+        self,
+        pdf_path: Path,
+        pages: List[int],
+        with_text: bool,
+        workers: int
+    ) -> List[_ExtractedPage]:
+        """Extract page batches in worker processes and number their blocks in page order."""
+        # Several batches per worker even out pages of different cost
+        batch_size = max(1, -(-len(pages) // (workers * 4)))
+        batches = [pages[start:start + batch_size] for start in range(0, len(pages), batch_size)]
+        logger.info(f"Extracting {len(pages)} pages in {workers} processes ({len(batches)} batches)")
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_extraction_context()) as pool:
+            results = pool.map(
+                _extract_page_batch,
+                itertools.repeat(self.settings),
+                itertools.repeat(str(pdf_path)),
+                batches,
+                itertools.repeat(with_text),
+                itertools.repeat(self.font_information)
+            )
+            extracted = [page for batch in results for page in batch]
+        
+        # Workers number blocks from zero on every page
+        raw_count = 0
+        for page in extracted:
+            for text_block in page.blocks:
+                text_block.block_index += raw_count
+            if page.fonts:
+                page.fonts = {index + raw_count: font for index, font in page.fonts.items()}
+            raw_count += len(page.blocks)
+        return extracted
+    
+    def _extract_page(
+        self,
+        doc: fitz.Document,
+        page_num: int,
+        with_text: bool,
+        first_raw_index: int = 0
+    ) -> _ExtractedPage:
+        """
+        Extract the raw blocks and plain text of one page.
+        
+        Args:
+            doc: Open document
+            page_num: 0-indexed page number
+            with_text: Return the page's plain text
+            first_raw_index: Index of the page's first raw block in the document
+            
+        Returns:
+            _ExtractedPage of the page
+        """
+        page = doc[page_num]
+        text_dict = self._read_page_layout(page, page_num + 1)
+        fonts = {} if self.detect_sections else None
+        return _ExtractedPage(
+            page_num,
+            self._blocks_from_text_dict(
+                text_dict,
+                page_num + 1,
+                first_block_index=first_raw_index,
+                fonts=fonts,
+                table_regions=self._table_regions(page, text_dict)
+            ),
+            page.rect.height,
+            _plain_text_from_dict(text_dict) if with_text else None,
+            fonts
+        )
+    
+    def iter_text_blocks(
+        self,
+        pdf_path: str,
+        selection: Optional["PageSelection"] = None
+    ) -> Iterator[TextBlock]:
+        """
+        Lazily extract cleaned text blocks page by page.
+        
+        Only the selected pages are read, and reading stops as soon as the
+        consumer stops iterating, so taking the first few blocks of a large
+        document is cheap. Recognizing repeated margin blocks reads up to
+        ``NEIGHBOR_PAGES`` pages ahead. Cached extractions are used, but
+        partial reads are not cached.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            selection: Pages or sections to extract (all pages if None)
+            
+        Yields:
+            TextBlock objects in reading order with sequential block indices
+            
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            fitz.FileDataError: If PDF file is corrupted or invalid
+            ValueError: If the selection does not match the document
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        cached = self._find_cached_extraction(pdf_path, selection)
+        if cached:
+            logger.info(f"Loaded {len(cached.text_blocks)} text blocks of {pdf_path.name} from the extraction cache")
+            yield from cached.text_blocks
+            return
+        
+        try:
+            doc = fitz.open(pdf_path)
         except fitz.FileDataError as e:
             raise fitz.FileDataError(f"Invalid or corrupted PDF file: {e}")
-        except Exception as e:
-            logger.error(f"Error processing PDF {pdf_path}: {e}")
-            raise
         
-        # Filter and clean text blocks
-        cleaned_blocks = self._filter_and_clean_blocks(text_blocks)
+        with doc:
+            page_numbers = selection.resolve(doc) if selection else range(len(doc))
+            logger.info(f"Processing PDF: {pdf_path.name} ({len(page_numbers)} of {len(doc)} pages)")
+            
+            section_tracker = SectionTracker() if self.detect_sections else None
+            fonts: Dict[int, BlockFont] = {}
+            
+            def raw_pages() -> Iterator[Tuple[int, float, List[RawBlock]]]:
+                extracted_count = 0
+                for page_num in page_numbers:
+                    page = doc[page_num]
+                    page_blocks = self._extract_page_blocks(
+                        page,
+                        page_num + 1,
+                        first_block_index=extracted_count,
+                        fonts=fonts if section_tracker else None
+                    )
+                    extracted_count += len(page_blocks)
+                    logger.debug(f"Extracted {len(page_blocks)} blocks from page {page_num + 1}")
+                    yield page_num + 1, page.rect.height, page_blocks
+            
+            # Repeated margin blocks are recognized a few pages ahead
+            pages = self.margin_detector.iter_pages(raw_pages()) if self.margin_detector \
+                else ((page_number, page_blocks) for page_number, _, page_blocks in raw_pages())
+            
+            block_count = 0
+            for _, page_blocks in pages:
+                if section_tracker:
+                    section_tracker.tag_page(page_blocks, fonts)
+                # Merging never crosses pages, so pages can be chunked one at a time
+                for text_block in self._filter_and_clean_blocks(page_blocks, first_index=block_count):
+                    block_count += 1
+                    yield text_block
+    
+    def _extract_page_blocks(
+        self,
+        page: fitz.Page,
+        page_number: int,
+        first_block_index: int = 0,
+        fonts: Optional[Dict[int, BlockFont]] = None
+    ) -> List[RawBlock]:
+        """
+        Extract the raw blocks of a single page.
         
-        logger.info(f"Extracted {len(cleaned_blocks)} valid text blocks from {pdf_path.name}")
-        return cleaned_blocks
+        Args:
+            page: PyMuPDF page object
+            page_number: 1-indexed page number
+            first_block_index: Document-wide index assigned to the first block of this page
+            fonts: If given, receives the font metrics of the blocks by block index
+            
+        Returns:
+            List of RawBlock objects for this page
+        """
+        text_dict = self._read_page_layout(page, page_number)
+        return self._blocks_from_text_dict(
+            text_dict, page_number, first_block_index, fonts, self._table_regions(page, text_dict)
+        )
+    
+    def _table_regions(self, page: fitz.Page, text_dict: Dict[str, Any]) -> List[Tuple[float, float, float, float]]:
+        """Bounding boxes of the page's tables if table regions are detected."""
+        return self.block_classifier.table_regions(page, text_dict) if self.block_classifier else []
     
-    def _extract_page_blocks(self, page: fitz.Page, page_number: int) -> List[TextBlock]:
+    def _read_page_layout(self, page: fitz.Page, page_number: int) -> Dict[str, Any]:
         """
-        Extract text blocks from a single page.
+        Read a page's text blocks with their positions in the configured extraction mode.
+        
+        The "blocks" mode skips images and span attributes (fonts, colors,
+        origins) and returns one span per line holding only its text.
         
         Args:
             page: PyMuPDF page object
             page_number: 1-indexed page number
             
         Returns:
-            List of TextBlock objects for this page
+            Layout shaped like ``page.get_text("dict")`` (empty if extraction failed)
+        """
+        try:
+            if self.extraction_mode == "blocks":
+                return _layout_from_text_blocks(page.get_text("blocks"))
+            return page.get_text("dict")
+        except Exception as e:
+            logger.warning(f"Error extracting blocks from page {page_number}: {e}")
+            return {}
+    
+    def _blocks_from_text_dict(
+        self,
+        text_dict: Dict[str, Any],
+        page_number: int,
+        first_block_index: int = 0,
+        fonts: Optional[Dict[int, BlockFont]] = None,
+        table_regions: Sequence[Tuple[float, float, float, float]] = ()
+    ) -> List[RawBlock]:
+        """
+        Build raw blocks from a page's ``"dict"``-shaped layout and classify them.
+        
+        Args:
+            text_dict: Result of ``_read_page_layout`` or ``page.get_text("dict")``
+            page_number: 1-indexed page number
+            first_block_index: Document-wide index assigned to the first block of this page
+            fonts: If given, receives the font metrics of the blocks by block index,
+                and blocks below the minimum size are kept
+            table_regions: Bounding boxes of the page's tables
+            
+        Returns:
+            List of RawBlock objects for this page
         """
         blocks = []
         
         try:
-            # Get text blocks with positioning information
-            text_dict = page.get_text("dict")
-            
-            block_index = 0
+            block_index = first_block_index
             for block in text_dict.get("blocks", []):
                 if "lines" not in block:  # Skip image blocks
                     continue
@@ -90,22 +820,29 @@ class PDFProcessor:
                 # Extract text from all lines in the block
                 block_text = self._extract_text_from_block(block)
                 
-                if not block_text or len(block_text.strip()) < self.min_block_size:
+                # Short headings are kept for section detection; filtering drops them later
+                if not block_text or (fonts is None and len(block_text.strip()) < self.min_block_size):
                     continue
                 
                 # Get bounding box coordinates
                 bbox = block.get("bbox")
                 bounding_box = tuple(bbox) if bbox else None
                 
-                # Create TextBlock object
-                text_block = TextBlock(
+                # Raw blocks only become TextBlock models once chunked
+                text_block = RawBlock(
                     content=block_text,
                     page_number=page_number,
                     bounding_box=bounding_box,
-                    block_index=block_index
+                    block_index=block_index,
+                    kind=self.block_classifier.classify(block_text, block, table_regions)
+                    if self.block_classifier else BlockKind.PROSE
                 )
                 
                 blocks.append(text_block)
+                if fonts is not None:
+                    font = block_font(block)
+                    if font:
+                        fonts[block_index] = font
                 block_index += 1
         
         except Exception as e:
@@ -144,132 +881,27 @@ class PDFProcessor:
         return text
     
     def _fix_german_umlauts(self, text: str) -> str:
-        """
-        Fix corrupted German umlauts that appear as space + base letter.
-        
-        Args:
-            text: Text with potentially corrupted umlauts
-            
-        Returns:
-            Text with restored German umlauts
-        """
-        if not text:
-            return ""
-        
-        
-       # Replace '"a' with 'ä' and '"A' with 'Ä'
-        #text = re.sub(r'"a', 'ä', text)
-        text = re.sub(r'¨a', 'ä', text)
-        text = re.sub(r'“a', 'ä', text)
-        #text = re.sub(r'"A', 'Ä', text)
-        text = re.sub(r'¨A', 'Ä', text)
-        text = re.sub(r'“A', 'Ä', text)
-
-        # Replace '"o' with 'ö' and '"O' with 'Ö'
-        text = re.sub(r'"o', 'ö', text)
-        text = re.sub(r'¨o', 'ö', text)
-        text = re.sub(r'“o', 'ö', text)
-        #text = re.sub(r'"O', 'Ö', text)
-        text = re.sub(r'¨O', 'Ö', text)
-        text = re.sub(r'“O', 'Ö', text)
-
-        # Replace '"u' with 'ü' and '"U' with 'Ü'
-        text = re.sub(r'"u', 'ü', text)
-        text = re.sub(r'¨u', 'ü', text)
-        text = re.sub(r'“u', 'ü', text)
-        #text = re.sub(r'"U', 'Ü', text)
-        text = re.sub(r'¨U', 'Ü', text)
-        text = re.sub(r'“U', 'Ü', text)
-
-        return text
+        """Fix corrupted German umlauts that appear as a mark before the base letter."""
+        return fix_german_umlauts(text)
     
     def _remove_line_break_hyphens(self, text: str) -> str:
-        """
-        Remove hyphens that were inserted at line breaks in German text.
-        
-        Args:
-            text: Text with potential line-break hyphens
-            
-        Returns:
-            Text with line-break hyphens removed
-        """
-        if not text:
-            return ""
-        
-        # replace hyphens at the end of a line
-        text = re.sub(r'-\n(?![ ,])', '', text)
-
-        
-        return text
+        """Remove hyphens that were inserted at line breaks in German text."""
+        return remove_line_break_hyphens(text)
     
     def _clean_extracted_text(self, text: str) -> str:
-        """
-        Clean and normalize extracted text.
-        
-        Args:
-            text: Raw extracted text
-            
-        Returns:
-            Cleaned text
-        """
-        if not text:
-            return ""
-        
-        # Step 1: Fix German umlaut corruption
-        text = self._fix_german_umlauts(text)
-        
-        # Step 2: Remove line-break hyphens
-        text = self._remove_line_break_hyphens(text)
-        
-        # Step 3: Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Step 4: Remove common PDF artifacts
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)  # Control characters
-        
-        # Step 5: Keep German characters and common punctuation
-        # Updated regex to preserve German characters: äöüßÄÖÜ
-        #text = re.sub(r'[^\w\s\.,;:!?()[\]{}"\'-äöüßÄÖÜ]', ' ', text)
-        
-        # Step 6: Fix common spacing issues
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)  # Remove space before punctuation
-
-        # Protect URLs and email addresses to avoid inserting spaces within them
-        protected = []
-        def _mask(match):
-            protected.append(match.group(0))
-            return f"__PROTECTED_{len(protected)-1}__"
-        url_email_pattern = r'\b(?:https?://\S+|www\.\S+|[\w\.-]+@[\w\.-]+\.\w+)\b'
-        text = re.sub(url_email_pattern, _mask, text)
-
-        # Ensure proper spacing after punctuation, but not between numbers (e.g., decimals or version numbers)
-        def _ensure_space_after_punct(match):
-            punct = match.group(1)
-            start = match.start(1)
-            end = match.end(1)
-            prev_char = text[start-1] if start > 0 else ''
-            next_char = text[end] if end < len(text) else ''
-            # if punctuation is between two digits, leave it as-is
-            if prev_char.isdigit() and next_char.isdigit():
-                return punct
-            return punct + ' '
-        text = re.sub(r'([.,;:!?])\s*', _ensure_space_after_punct, text)
-
-        # Restore protected URLs and emails
-        for i, original in enumerate(protected):
-            text = text.replace(f"__PROTECTED_{i}__", original)
-
-        return text.strip()
+        """Clean and normalize extracted text (see ``text_cleaning.clean_extracted_text``)."""
+        return clean_extracted_text(text)
     
-    def _filter_and_clean_blocks(self, text_blocks: List[TextBlock]) -> List[TextBlock]:
+    def _filter_and_clean_blocks(self, text_blocks: List[RawBlock], first_index: int = 0) -> List[TextBlock]:
         """
-        Filter out irrelevant blocks and clean the remaining ones.
+        Filter out irrelevant blocks and size the remaining ones for analysis.
         
         Args:
-            text_blocks: List of extracted text blocks
+            text_blocks: Raw blocks of one page
+            first_index: Block index assigned to the first resulting block
             
         Returns:
-            Filtered and cleaned text blocks
+            Filtered blocks, coalesced and split to the token target
         """
         filtered_blocks = []
         
@@ -282,14 +914,10 @@ class PDFProcessor:
             if self._is_header_footer_or_page_number(block.content):
                 continue
             
-            # Split large blocks if necessary
-            if len(block.content) > self.max_block_size:
-                split_blocks = self._split_large_block(block)
-                filtered_blocks.extend(split_blocks)
-            else:
-                filtered_blocks.append(block)
+            filtered_blocks.append(block)
         
-        return filtered_blocks
+        # Merge small neighbours and split large blocks to the token target
+        return self.chunker.chunk(filtered_blocks, first_index=first_index)
     
     def _is_header_footer_or_page_number(self, text: str) -> bool:
         """
@@ -331,58 +959,12 @@ class PDFProcessor:
         
         return False
     
-    def _split_large_block(self, block: TextBlock) -> List[TextBlock]:
-        """
-        Split a large text block into smaller chunks.
-        
-        Args:
-            block: TextBlock to split
-            
-        Returns:
-            List of smaller TextBlock objects
-        """
-        text = block.content
-        chunks = []
-        
-        # Try to split at sentence boundaries first
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        current_chunk = ""
-        chunk_index = 0
-        
-        for sentence in sentences:
-            if len(current_chunk + sentence) <= self.max_block_size:
-                current_chunk += sentence + " "
-            else:
-                if current_chunk.strip():
-                    # Create new TextBlock for this chunk
-                    chunk_block = TextBlock(
-                        content=current_chunk.strip(),
-                        page_number=block.page_number,
-                        bounding_box=block.bounding_box,
-                        block_index=f"{block.block_index}_{chunk_index}"
-                    )
-                    chunks.append(chunk_block)
-                    chunk_index += 1
-                
-                current_chunk = sentence + " "
-        
-        # Add the remaining chunk
-        if current_chunk.strip():
-            chunk_block = TextBlock(
-                content=current_chunk.strip(),
-                page_number=block.page_number,
-                bounding_box=block.bounding_box,
-                block_index=f"{block.block_index}_{chunk_index}"
-            )
-            chunks.append(chunk_block)
-        
-        return chunks if chunks else [block]
-    
     def extract_bibliography_section(self, pdf_path: str) -> Optional[str]:
         """
         Attempt to extract the bibliography/references section from the PDF.
         
+        Only the pages needed to locate the bibliography are read.
+        
         Args:
             pdf_path: Path to the PDF file
             
@@ -390,39 +972,46 @@ class PDFProcessor:
             Bibliography text if found, None otherwise
         """
         try:
+            cached = self._find_cached_extraction(Path(pdf_path), None)
+            if cached and cached.page_texts:
+                return cached.bibliography
+            
             with fitz.open(pdf_path) as doc:
-                bibliography_text = ""
-                found_bib_section = False
-                
-                for page_num in range(len(doc)):
-                    page = doc[page_num]
-                    page_text = page.get_text()
-                    page_text = self._clean_extracted_text(page_text)
-                    
-                    # Look for bibliography section headers
-                    bib_headers = [
-                        r'\b(?:references|bibliography|works\s+cited|sources)\b',
-                        r'\b(?:literatur|literaturverzeichnis)\b',  # German
-                        r'\b(?:références|bibliographie)\b',  # French
-                    ]
-                    
-                    for header_pattern in bib_headers:
-                        if re.search(header_pattern, page_text, re.IGNORECASE):
-                            found_bib_section = True
-                            bibliography_text += page_text + "\n"
-                            break
-                    
-                    # If we found the bibliography section, continue collecting
-                    if found_bib_section:
-                        if not any(re.search(pattern, page_text, re.IGNORECASE) for pattern in bib_headers):
-                            bibliography_text += page_text + "\n"
-                
-                return bibliography_text.strip() if bibliography_text else None
+                return self._locate_bibliography(doc, doc.get_toc(), {})[1]
         
         except Exception as e:
             logger.warning(f"Error extracting bibliography section: {e}")
             return None
     
+    def _locate_bibliography(
+        self,
+        doc: fitz.Document,
+        outline: List[list],
+        page_texts: Dict[int, str]
+    ) -> Tuple[Optional[BibliographyLocation], Optional[str]]:
+        """
+        Locate the bibliography by the outline or its heading line and extract its text.
+        
+        Args:
+            doc: Open document
+            outline: Outline of the document
+            page_texts: Plain texts of pages already read, by 1-indexed page
+                number; pages read to locate the bibliography are added
+            
+        Returns:
+            Tuple of (bibliography location, its cleaned text), both None if
+            the document has no bibliography heading
+        """
+        def page_text(page_number: int) -> str:
+            if page_number not in page_texts:
+                page_texts[page_number] = doc[page_number - 1].get_text()
+            return page_texts[page_number]
+        
+        location = locate_bibliography(outline, len(doc), page_text)
+        if location is None:
+            return None, None
+        return location, bibliography_text(location, page_text) or None
+    
     def get_document_metadata(self, pdf_path: str) -> Dict[str, Any]:
         """
         Extract metadata from the PDF document.
@@ -435,22 +1024,43 @@ class PDFProcessor:
         """
         try:
             with fitz.open(pdf_path) as doc:
-                metadata = {
-                    'title': doc.metadata.get('title', ''),
-                    'author': doc.metadata.get('author', ''),
-                    'subject': doc.metadata.get('subject', ''),
-                    'creator': doc.metadata.get('creator', ''),
-                    'producer': doc.metadata.get('producer', ''),
-                    'creation_date': doc.metadata.get('creationDate', ''),
-                    'modification_date': doc.metadata.get('modDate', ''),
-                    'page_count': len(doc),
-                    'file_size': Path(pdf_path).stat().st_size,
-                }
-                return metadata
+                return self._metadata_from_document(doc, Path(pdf_path))
         
         except Exception as e:
             logger.warning(f"Error extracting PDF metadata: {e}")
             return {'page_count': 0, 'file_size': 0}
+    
+    def _metadata_from_document(self, doc: fitz.Document, pdf_path: Path) -> Dict[str, Any]:
+        """Collect the metadata of an open document."""
+        return {
+            'title': doc.metadata.get('title', ''),
+            'author': doc.metadata.get('author', ''),
+            'subject': doc.metadata.get('subject', ''),
+            'creator': doc.metadata.get('creator', ''),
+            'producer': doc.metadata.get('producer', ''),
+            'creation_date': doc.metadata.get('creationDate', ''),
+            'modification_date': doc.metadata.get('modDate', ''),
+            'page_count': len(doc),
+            'file_size': pdf_path.stat().st_size,
+        }
+
+
+def compute_pdf_hash(pdf_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hash of a PDF file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        chunk_size: Number of bytes read at a time
+        
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def create_test_pdf(output_path: str) -> str:
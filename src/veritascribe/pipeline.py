@@ -1,17 +1,34 @@
 """Main analysis pipeline orchestrating PDF processing and LLM analysis."""
 
+import glob
 import time
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 import asyncio
 import concurrent.futures
+import functools
+import itertools
+import queue
+import threading
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor
 
-from .config import get_settings, get_dspy_config, initialize_system, PROVIDER_MODELS
-from .pdf_processor import PDFProcessor
+from .config import (
+    get_settings, get_dspy_config, get_request_controller, initialize_system, PROVIDER_MODELS,
+    VeritaScribeSettings
+)
+from .pdf_processor import PDFProcessor, PageSelection
 from .llm_modules import AnalysisOrchestrator
+from .hedging import LLMCallTimeoutError
+from .incremental import BaselineMatcher, is_baseline_compatible, load_baseline_report
+from .checkpoint import AnalysisCheckpoint
+from .report_writer import StreamingReportWriter
+from .report_export import check_report_formats, export_report, report_file_path
+from .dedup import BlockDeduplicator, DuplicateMatch, share_result
+from .scheduler import FairScheduler
 from .data_models import (
     TextBlock, 
     AnalysisResult, 
@@ -22,146 +39,330 @@ import dspy
 
 logger = logging.getLogger(__name__)
 
+# Report base paths handed out in this process. Documents of a batch may
+# share a file name and start within the same second, before any of their
+# report files exist.
+_reserved_report_paths: Set[Path] = set()
+_reserved_report_paths_lock = threading.Lock()
+
+
+def calculate_llm_usage(settings: Optional[VeritaScribeSettings] = None) -> tuple[Dict[str, int], float]:
+    """
+    Calculate token usage and estimated cost from DSPy LLM history.
+
+    The history is cleared, so every call counts the LLM calls made since
+    the previous one.
+
+    Args:
+        settings: Settings naming the provider and model (default: current settings)
+
+    Returns:
+        Tuple of (token_usage_dict, estimated_cost)
+    """
+    try:
+        # Get the current DSPy LM instance
+        if not hasattr(dspy.settings, 'lm') or not dspy.settings.lm:
+            return {}, 0.0
+
+        lm = dspy.settings.lm
+
+        # Initialize counters
+        total_prompt_tokens = 0
+        total_completion_tokens = 0
+
+        # Check if the LM has a history attribute
+        if hasattr(lm, 'history') and lm.history:
+            for call in lm.history:
+                # Extract token counts from call metadata
+                if hasattr(call, 'usage') and call.usage:
+                    total_prompt_tokens += getattr(call.usage, 'prompt_tokens', 0)
+                    total_completion_tokens += getattr(call.usage, 'completion_tokens', 0)
+                elif hasattr(call, 'response') and hasattr(call.response, 'usage'):
+                    usage = call.response.usage
+                    total_prompt_tokens += getattr(usage, 'prompt_tokens', 0)
+                    total_completion_tokens += getattr(usage, 'completion_tokens', 0)
+
+        total_tokens = total_prompt_tokens + total_completion_tokens
+
+        # Calculate cost based on current provider and model
+        estimated_cost = _estimate_cost(
+            settings or get_settings(),
+            total_prompt_tokens, 
+            total_completion_tokens
+        )
+
+        # Prepare usage dictionary
+        token_usage = {
+            'prompt_tokens': total_prompt_tokens,
+            'completion_tokens': total_completion_tokens,
+            'total_tokens': total_tokens
+        }
+
+        # Clear history to avoid double counting on subsequent runs
+        if hasattr(lm, 'history'):
+            lm.history.clear()
+
+        return token_usage, estimated_cost
+
+    except Exception as e:
+        logger.warning(f"Failed to calculate LLM usage: {e}")
+        return {}, 0.0
+
+
+def _estimate_cost(settings: VeritaScribeSettings, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Calculate estimated cost based on the configured provider and model.
+
+    Args:
+        settings: Settings naming the provider and model
+        prompt_tokens: Number of prompt tokens used
+        completion_tokens: Number of completion tokens used
+
+    Returns:
+        Estimated cost in USD
+    """
+    try:
+        provider = settings.llm_provider
+        model = settings.default_model
+
+        # Get provider pricing information
+        if provider not in PROVIDER_MODELS:
+            return 0.0
+
+        provider_config = PROVIDER_MODELS[provider]
+        pricing = provider_config.get('pricing', {})
+
+        # Find pricing for the specific model
+        model_pricing = None
+        if model in pricing:
+            model_pricing = pricing[model]
+        elif provider == 'custom':
+            # Use default pricing for custom providers
+            model_pricing = pricing.get('default', {'prompt': 0.0, 'completion': 0.0})
+
+        if not model_pricing:
+            logger.warning(f"No pricing information found for {provider}/{model}")
+            return 0.0
+
+        # Calculate cost (pricing is per 1K tokens)
+        prompt_cost = (prompt_tokens / 1000.0) * model_pricing['prompt']
+        completion_cost = (completion_tokens / 1000.0) * model_pricing['completion']
+
+        total_cost = prompt_cost + completion_cost
+
+        return round(total_cost, 6)  # Round to 6 decimal places for precision
+
+    except Exception as e:
+        logger.warning(f"Failed to calculate cost: {e}")
+        return 0.0
+
+
+
+@dataclass
+class AnalysisProgress:
+    """Running statistics of a streamed analysis, updated with every finished block."""
+    total_blocks: int
+    started_at: float = field(default_factory=time.time)
+    completed_blocks: int = 0
+    analyzed_blocks: int = 0
+    errors_found: int = 0
+    errors_by_type: Dict[str, int] = field(default_factory=dict)
+    failed_blocks: int = 0
+    result: Optional[AnalysisResult] = None
+    report: Optional[ThesisAnalysisReport] = None
+    report_path: Optional[str] = None
+    # Saved report file of each format in ``report_formats``
+    export_paths: Dict[str, str] = field(default_factory=dict)
+    # Receives every finished result as soon as it is recorded
+    report_writer: Optional[StreamingReportWriter] = field(default=None, repr=False)
+    
+    def record(self, result: AnalysisResult, analyzed: bool = True) -> "AnalysisProgress":
+        """
+        Account for a finished block.
+        
+        Args:
+            result: Result of the block
+            analyzed: False for results restored from a checkpoint or baseline
+            
+        Returns:
+            This progress object, now pointing at the given result
+        """
+        self.result = result
+        if self.report_writer:
+            self.report_writer.append(result)
+        self.completed_blocks += 1
+        if analyzed:
+            self.analyzed_blocks += 1
+        if result.analysis_failed:
+            self.failed_blocks += 1
+        self.errors_found += result.error_count
+        for error in result.errors:
+            self.errors_by_type[error.error_type] = self.errors_by_type.get(error.error_type, 0) + 1
+        return self
+    
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the analysis of blocks started."""
+        return time.time() - self.started_at
+    
+    @property
+    def blocks_per_second(self) -> float:
+        """Throughput of blocks analyzed by the LLM in this run."""
+        elapsed = self.elapsed_seconds
+        return self.analyzed_blocks / elapsed if elapsed > 0 else 0.0
+    
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until all blocks are done, if a rate is known."""
+        rate = self.blocks_per_second
+        if rate <= 0:
+            return None
+        return (self.total_blocks - self.completed_blocks) / rate
+    
+    @property
+    def is_complete(self) -> bool:
+        """Whether this is the final event carrying the report."""
+        return self.report is not None
+
 
 class ThesisAnalysisPipeline:
     """Main pipeline for comprehensive thesis analysis."""
     
-    def __init__(self):
-        """Initialize the analysis pipeline with all necessary components."""
+    def __init__(
+        self,
+        block_scheduler: Optional[FairScheduler] = None,
+        report_usage: bool = True
+    ):
+        """
+        Initialize the analysis pipeline with all necessary components.
+        
+        Args:
+            block_scheduler: Shared scheduler running the block analyses of
+                several documents; by default each run uses its own pool
+            report_usage: Record token usage, cost and request statistics in
+                the report. These counters are process-wide, so they are only
+                meaningful when one document is analyzed at a time.
+        """
         self.settings = get_settings()
         self.dspy_config = get_dspy_config()
+        self.block_scheduler = block_scheduler
+        self.report_usage = report_usage
         
         # Initialize components
         self.pdf_processor = PDFProcessor()
         self.analysis_orchestrator = AnalysisOrchestrator()
         
+        # Wall-clock timing of the stages of the current analysis run
+        self._run_start_time: float = time.time()
+        self._stage_timings: Dict[str, Dict[str, float]] = {}
+        
         logger.info("Thesis analysis pipeline initialized")
     
-    def _calculate_llm_usage(self) -> tuple[Dict[str, int], float]:
+    @contextmanager
+    def _timed_stage(self, stage: str) -> Iterator[None]:
         """
-        Calculate token usage and estimated cost from DSPy LLM history.
+        Record start, end and duration of a pipeline stage.
         
-        Returns:
-            Tuple of (token_usage_dict, estimated_cost)
+        Offsets are relative to the start of the current analysis run so that
+        overlapping stages remain visible in the recorded timings.
+        
+        Args:
+            stage: Name of the stage being timed
         """
+        stage_start = time.time()
         try:
-            # Get the current DSPy LM instance
-            if not hasattr(dspy.settings, 'lm') or not dspy.settings.lm:
-                return {}, 0.0
-            
-            lm = dspy.settings.lm
-            
-            # Initialize counters
-            total_prompt_tokens = 0
-            total_completion_tokens = 0
-            
-            # Check if the LM has a history attribute
-            if hasattr(lm, 'history') and lm.history:
-                for call in lm.history:
-                    # Extract token counts from call metadata
-                    if hasattr(call, 'usage') and call.usage:
-                        total_prompt_tokens += getattr(call.usage, 'prompt_tokens', 0)
-                        total_completion_tokens += getattr(call.usage, 'completion_tokens', 0)
-                    elif hasattr(call, 'response') and hasattr(call.response, 'usage'):
-                        usage = call.response.usage
-                        total_prompt_tokens += getattr(usage, 'prompt_tokens', 0)
-                        total_completion_tokens += getattr(usage, 'completion_tokens', 0)
-            
-            total_tokens = total_prompt_tokens + total_completion_tokens
-            
-            # Calculate cost based on current provider and model
-            estimated_cost = self._calculate_cost(
-                total_prompt_tokens, 
-                total_completion_tokens
-            )
-            
-            # Prepare usage dictionary
-            token_usage = {
-                'prompt_tokens': total_prompt_tokens,
-                'completion_tokens': total_completion_tokens,
-                'total_tokens': total_tokens
+            yield
+        finally:
+            stage_end = time.time()
+            self._stage_timings[stage] = {
+                'start': round(stage_start - self._run_start_time, 6),
+                'end': round(stage_end - self._run_start_time, 6),
+                'duration': round(stage_end - stage_start, 6),
             }
-            
-            # Clear history to avoid double counting on subsequent runs
-            if hasattr(lm, 'history'):
-                lm.history.clear()
-            
-            return token_usage, estimated_cost
-            
-        except Exception as e:
-            logger.warning(f"Failed to calculate LLM usage: {e}")
-            return {}, 0.0
     
-    def _calculate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+    def analyze_thesis(
+        self, 
+        pdf_path: str,
+        output_directory: Optional[str] = None,
+        citation_style: str = "APA",
+        context: str = "academic thesis",
+        baseline_report: Optional[str] = None,
+        resume: bool = False,
+        selection: Optional[PageSelection] = None
+    ) -> ThesisAnalysisReport:
         """
-        Calculate estimated cost based on current provider and model.
+        Perform complete analysis of a thesis PDF document.
         
         Args:
-            prompt_tokens: Number of prompt tokens used
-            completion_tokens: Number of completion tokens used
+            pdf_path: Path to the PDF file to analyze
+            output_directory: Directory to save analysis results (optional)
+            citation_style: Expected citation style (APA, MLA, Chicago, etc.)
+            context: Document context for analysis
+            baseline_report: JSON report of a previous version of the document;
+                results of unchanged blocks are reused instead of re-analyzed
+            resume: Skip blocks already completed in the checkpoint of an
+                interrupted run of the same document and configuration
+            selection: Restrict the analysis to these pages or sections
             
         Returns:
-            Estimated cost in USD
-        """
-        try:
-            provider = self.settings.llm_provider
-            model = self.settings.default_model
-            
-            # Get provider pricing information
-            if provider not in PROVIDER_MODELS:
-                return 0.0
-            
-            provider_config = PROVIDER_MODELS[provider]
-            pricing = provider_config.get('pricing', {})
-            
-            # Find pricing for the specific model
-            model_pricing = None
-            if model in pricing:
-                model_pricing = pricing[model]
-            elif provider == 'custom':
-                # Use default pricing for custom providers
-                model_pricing = pricing.get('default', {'prompt': 0.0, 'completion': 0.0})
-            
-            if not model_pricing:
-                logger.warning(f"No pricing information found for {provider}/{model}")
-                return 0.0
-            
-            # Calculate cost (pricing is per 1K tokens)
-            prompt_cost = (prompt_tokens / 1000.0) * model_pricing['prompt']
-            completion_cost = (completion_tokens / 1000.0) * model_pricing['completion']
-            
-            total_cost = prompt_cost + completion_cost
-            
-            return round(total_cost, 6)  # Round to 6 decimal places for precision
+            ThesisAnalysisReport containing complete analysis results
             
-        except Exception as e:
-            logger.warning(f"Failed to calculate cost: {e}")
-            return 0.0
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            RuntimeError: If analysis fails
+        """
+        report = None
+        for progress in self.stream_analysis(
+            pdf_path,
+            output_directory,
+            citation_style=citation_style,
+            context=context,
+            baseline_report=baseline_report,
+            resume=resume,
+            selection=selection
+        ):
+            report = progress.report
+        return report
     
-    def analyze_thesis(
+    def stream_analysis(
         self, 
         pdf_path: str,
         output_directory: Optional[str] = None,
         citation_style: str = "APA",
-        context: str = "academic thesis"
-    ) -> ThesisAnalysisReport:
+        context: str = "academic thesis",
+        baseline_report: Optional[str] = None,
+        resume: bool = False,
+        selection: Optional[PageSelection] = None
+    ) -> Iterator[AnalysisProgress]:
         """
-        Perform complete analysis of a thesis PDF document.
+        Analyze a thesis PDF and yield results as soon as each block is done.
+        
+        A first event without result announces the number of blocks, then one
+        event follows per block in completion order (restored and reused
+        blocks first). The last event carries the finished report. In
+        pipelined mode the number of blocks grows while pages are extracted.
         
         Args:
             pdf_path: Path to the PDF file to analyze
             output_directory: Directory to save analysis results (optional)
             citation_style: Expected citation style (APA, MLA, Chicago, etc.)
             context: Document context for analysis
+            baseline_report: JSON report of a previous version of the document
+            resume: Resume from the checkpoint of an interrupted run
+            selection: Restrict the analysis to these pages or sections
             
-        Returns:
-            ThesisAnalysisReport containing complete analysis results
+        Yields:
+            AnalysisProgress events with running statistics
             
         Raises:
             FileNotFoundError: If PDF file doesn't exist
             RuntimeError: If analysis fails
         """
         start_time = time.time()
+        self._run_start_time = start_time
+        self._stage_timings = {}
+        request_stats_before = get_request_controller().get_stats()
+        connection_stats_before = self.dspy_config.get_connection_stats()
         pdf_path = Path(pdf_path)
         
         if not pdf_path.exists():
@@ -169,179 +370,520 @@ class ThesisAnalysisPipeline:
         
         logger.info(f"Starting thesis analysis: {pdf_path.name}")
         
+        checkpoint: Optional[AnalysisCheckpoint] = None
+        report_writer: Optional[StreamingReportWriter] = None
+        report_base: Optional[Path] = None
+        report_formats = self.settings.report_formats
+        compression = self.settings.report_compression
+        
         try:
             # Step 1: Initialize system and LLM
             logger.info("Initializing system configuration...")
-            initialize_system()
-            
-            # Step 2: Extract text blocks from PDF
-            logger.info("Extracting text blocks from PDF...")
-            text_blocks = self.pdf_processor.extract_text_blocks_from_pdf(str(pdf_path))
+            with self._timed_stage("initialization"):
+                initialize_system()
+                if output_directory:
+                    self.pdf_processor.use_output_directory(output_directory)
             
-            if not text_blocks:
-                logger.warning("No text blocks extracted from PDF")
-                return self._create_empty_report(pdf_path)
+            # Step 2: Load blocks completed by an interrupted run
+            completed: Dict[int, AnalysisResult] = {}
+            if self.settings.checkpoint_enabled:
+                with self._timed_stage("checkpoint"):
+                    checkpoint = AnalysisCheckpoint.for_document(
+                        str(pdf_path),
+                        self._checkpoint_configuration(citation_style, context, selection),
+                        self.settings.checkpoint_directory_for(output_directory)
+                    )
+                    if resume:
+                        completed = checkpoint.load()
+                    checkpoint.open(resume=resume)
+            elif resume:
+                logger.warning("Checkpointing is disabled; analyzing all blocks")
             
-            logger.info(f"Extracted {len(text_blocks)} text blocks")
+            # Results are written to the JSON report as they arrive; missing
+            # export packages fail the run before any block is analyzed
+            if output_directory:
+                check_report_formats(report_formats, compression)
+                report_base = self._report_base_path(pdf_path, output_directory)
+                if 'json' in report_formats:
+                    report_writer = StreamingReportWriter(
+                        str(report_file_path(report_base, 'json', compression)),
+                        compact=self.settings.compact_reports,
+                        compression=compression
+                    ).open()
             
-            # Step 3: Extract bibliography section
-            logger.info("Extracting bibliography section...")
-            bibliography = self.pdf_processor.extract_bibliography_section(str(pdf_path)) or ""
+            # Steps 3-8: Extract and analyze text blocks; the baseline is
+            # aligned against the complete block list, so it needs the staged flow
+            if self.settings.pipelined_analysis and not baseline_report:
+                run = yield from self._stream_pipelined(
+                    pdf_path, citation_style, context, selection, checkpoint, completed, report_writer
+                )
+            else:
+                run = yield from self._stream_staged(
+                    pdf_path, citation_style, context, selection, checkpoint, completed, baseline_report,
+                    report_writer
+                )
             
-            # Step 4: Get document metadata
-            metadata = self.pdf_processor.get_document_metadata(str(pdf_path))
+            if run is None:
+                logger.warning("No text blocks extracted from PDF")
+                if checkpoint:
+                    checkpoint.remove()
+                progress = AnalysisProgress(total_blocks=0, started_at=start_time)
+                progress.report = self._create_empty_report(pdf_path)
+                yield progress
+                return
             
-            # Step 5: Analyze text blocks
-            logger.info("Starting LLM analysis of text blocks...")
-            analysis_results = self._analyze_text_blocks(
-                text_blocks, 
-                bibliography, 
-                citation_style, 
-                context
-            )
+            text_blocks, analysis_results, metadata, resumed_count, progress = run
+            analysis_results.sort(key=lambda result: result.text_block.block_index)
             
-            # Step 6: Create comprehensive report
-            processing_time = time.time() - start_time
-            report = self._create_analysis_report(
-                pdf_path,
-                text_blocks,
-                analysis_results,
-                processing_time,
-                metadata
-            )
+            # Step 9: Create comprehensive report
+            with self._timed_stage("report"):
+                processing_time = time.time() - start_time
+                report = self._create_analysis_report(
+                    pdf_path,
+                    text_blocks,
+                    analysis_results,
+                    processing_time,
+                    metadata,
+                    citation_style,
+                    baseline_report,
+                    selection
+                )
+            report.stage_timings = dict(self._stage_timings)
+            report.resumed_blocks = resumed_count
+            if self.report_usage:
+                report.request_stats = {
+                    **get_request_controller().get_stats().since(request_stats_before).to_dict(),
+                    **self.dspy_config.get_connection_stats().since(connection_stats_before).to_dict(),
+                }
             
             logger.info(f"Analysis completed in {processing_time:.2f} seconds")
             logger.info(f"Found {report.total_errors} total errors across {report.total_pages} pages")
             
-            # Step 7: Save results if output directory specified
-            if output_directory:
-                self._save_analysis_results(report, output_directory)
+            # Step 10: Complete the saved report with its summary and write
+            # the formats that need the complete report
+            if report_writer:
+                progress.report_path = str(report_writer.close(report.model_dump(exclude={'analysis_results'})))
+                progress.export_paths['json'] = progress.report_path
+                report_writer = None
+            if report_base:
+                other_formats = [report_format for report_format in report_formats if report_format != 'json']
+                for report_format, path in export_report(report, report_base, other_formats, compression).items():
+                    progress.export_paths[report_format] = str(path)
             
-            return report
+            # The run is complete, so its checkpoint is no longer needed
+            if checkpoint:
+                checkpoint.remove()
+            
+            progress.report = report
+            yield progress
             
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             raise RuntimeError(f"Thesis analysis failed: {e}")
+        finally:
+            if checkpoint:
+                checkpoint.close()
+            if report_writer:
+                report_writer.discard()
     
-    def _analyze_text_blocks(
+    def _stream_staged(
         self,
-        text_blocks: List[TextBlock],
-        bibliography: str,
+        pdf_path: Path,
         citation_style: str,
-        context: str
-    ) -> List[AnalysisResult]:
+        context: str,
+        selection: Optional[PageSelection],
+        checkpoint: Optional[AnalysisCheckpoint],
+        completed: Dict[int, AnalysisResult],
+        baseline_report: Optional[str],
+        report_writer: Optional[StreamingReportWriter] = None
+    ) -> Iterator[AnalysisProgress]:
+        """
+        Extract the whole document first, then analyze its blocks.
+        
+        Yields the progress events of the analysis and returns a tuple of
+        (text blocks, results, metadata, resumed block count, progress), or
+        None if no text blocks were extracted.
         """
-        Analyze all text blocks using the configured analysis approach.
+        # Steps 3-4: Extract text blocks, bibliography and metadata in one pass
+        logger.info("Extracting text blocks and bibliography from PDF...")
+        with self._timed_stage("extraction"):
+            document = self.pdf_processor.extract_document(
+                str(pdf_path),
+                selection,
+                include_bibliography=self.analysis_orchestrator.citation_checker is not None
+            )
+        
+        text_blocks = document.text_blocks
+        if not text_blocks:
+            return None
+        
+        logger.info(f"Extracted {len(text_blocks)} text blocks")
+        bibliography = document.bibliography or ""
+        metadata = document.metadata
+        
+        # Step 5: Restore blocks completed by an interrupted run
+        reused_results: List[AnalysisResult] = []
+        blocks_to_analyze = text_blocks
+        if completed:
+            reused_results, blocks_to_analyze = self._restore_from_checkpoint(completed, text_blocks)
+        resumed_count = len(reused_results)
+        
+        # Step 6: Reuse results of unchanged blocks from the baseline report
+        if baseline_report and blocks_to_analyze:
+            logger.info(f"Aligning text blocks with baseline report: {baseline_report}")
+            with self._timed_stage("baseline_alignment"):
+                baseline = load_baseline_report(baseline_report)
+                if is_baseline_compatible(baseline, self._configuration_used(citation_style, selection)):
+                    baseline_results, blocks_to_analyze = BaselineMatcher(baseline).match(blocks_to_analyze)
+                    reused_results.extend(baseline_results)
+                    if checkpoint:
+                        for result in baseline_results:
+                            checkpoint.append(result)
+        
+        # Step 7: Analyze repeated blocks only once
+        duplicates_by_representative: Dict[int, List[Tuple[TextBlock, DuplicateMatch]]] = {}
+        if self.settings.deduplicate_blocks and len(blocks_to_analyze) > 1:
+            with self._timed_stage("deduplication"):
+                duplicates = BlockDeduplicator(
+                    self.settings.near_duplicate_threshold
+                ).find_duplicates(blocks_to_analyze)
+                for block in blocks_to_analyze:
+                    match = duplicates.get(block.block_index)
+                    if match:
+                        duplicates_by_representative.setdefault(
+                            match.representative_index, []
+                        ).append((block, match))
+                blocks_to_analyze = [
+                    block for block in blocks_to_analyze if block.block_index not in duplicates
+                ]
+        
+        progress = AnalysisProgress(
+            total_blocks=len(text_blocks), started_at=time.time(), report_writer=report_writer
+        )
+        yield progress
+        for result in reused_results:
+            yield progress.record(result, analyzed=False)
+        
+        # Step 8: Analyze text blocks
+        logger.info(f"Starting LLM analysis of {len(blocks_to_analyze)} text blocks...")
+        analysis_results = list(reused_results)
+        with self._timed_stage("analysis"):
+            for result in self._iter_analysis_results(
+                blocks_to_analyze, 
+                bibliography, 
+                citation_style, 
+                context
+            ):
+                if checkpoint:
+                    checkpoint.append(result)
+                analysis_results.append(result)
+                yield progress.record(result)
+                
+                for block, match in duplicates_by_representative.get(result.text_block.block_index, ()):
+                    shared = share_result(result, block, match)
+                    if checkpoint:
+                        checkpoint.append(shared)
+                    analysis_results.append(shared)
+                    yield progress.record(shared, analyzed=False)
+        
+        return text_blocks, analysis_results, metadata, resumed_count, progress
+    
+    def _stream_pipelined(
+        self,
+        pdf_path: Path,
+        citation_style: str,
+        context: str,
+        selection: Optional[PageSelection],
+        checkpoint: Optional[AnalysisCheckpoint],
+        completed: Dict[int, AnalysisResult],
+        report_writer: Optional[StreamingReportWriter] = None
+    ) -> Iterator[AnalysisProgress]:
+        """
+        Analyze blocks while later pages are still being extracted.
+        
+        A producer thread extracts the metadata and, if citations are
+        checked, the bibliography, then streams the blocks page by page into
+        a bounded queue; PyMuPDF is not thread-safe, so all document access
+        stays on that one thread. Each block is submitted for analysis as
+        soon as it arrives. Extraction pauses while ``pipeline_queue_size``
+        blocks wait for their analysis.
+        
+        Yields the progress events of the analysis and returns a tuple of
+        (text blocks, results, metadata, resumed block count, progress), or
+        None if no text blocks were extracted.
+        """
+        events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        read_ahead = threading.Semaphore(max(1, self.settings.pipeline_queue_size))
+        stop = threading.Event()
+        
+        def extract() -> None:
+            try:
+                with self._timed_stage("metadata"):
+                    metadata = self.pdf_processor.get_document_metadata(str(pdf_path))
+                # Citation checks need the bibliography, so it is located before any block
+                bibliography = ""
+                if self.analysis_orchestrator.citation_checker is not None:
+                    with self._timed_stage("bibliography"):
+                        bibliography = self.pdf_processor.extract_bibliography_section(str(pdf_path)) or ""
+                events.put(('document_info', (bibliography, metadata)))
+                
+                with self._timed_stage("extraction"):
+                    for block in self.pdf_processor.iter_text_blocks(str(pdf_path), selection):
+                        # Pause while enough blocks wait for analysis
+                        while not read_ahead.acquire(timeout=0.1):
+                            if stop.is_set():
+                                return
+                        if stop.is_set():
+                            return
+                        events.put(('block', block))
+                events.put(('extracted', None))
+            except BaseException as e:
+                events.put(('error', e))
+        
+        # The document's blocks run on the shared scheduler or on their own pool
+        executor: Optional[ThreadPoolExecutor] = None
+        if self.block_scheduler:
+            queue_key = id(self)
+            submit = functools.partial(self.block_scheduler.submit, queue_key)
+        else:
+            max_workers = self.settings.max_concurrent_requests if self.settings.parallel_processing else 1
+            executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+            submit = executor.submit
+        
+        text_blocks: List[TextBlock] = []
+        analysis_results: List[AnalysisResult] = []
+        resumed_count = 0
+        progress = AnalysisProgress(total_blocks=0, started_at=time.time(), report_writer=report_writer)
+        deduplicator = BlockDeduplicator(self.settings.near_duplicate_threshold) \
+            if self.settings.deduplicate_blocks else None
+        duplicates_by_representative: Dict[int, List[Tuple[TextBlock, DuplicateMatch]]] = {}
+        finished: Dict[int, AnalysisResult] = {}
+        unfinished: Set[int] = set()
+        bibliography = ""
+        metadata: Dict[str, Any] = {}
+        extracted = False
+        analysis_start: Optional[float] = None
+        
+        def record(result: AnalysisResult, analyzed: bool = True, persist: bool = True) -> AnalysisProgress:
+            unfinished.discard(result.text_block.block_index)
+            # Results restored from the checkpoint are already in it
+            if checkpoint and persist:
+                checkpoint.append(result)
+            analysis_results.append(result)
+            return progress.record(result, analyzed=analyzed)
+        
+        producer = threading.Thread(target=extract, name="pipeline-extraction", daemon=True)
+        logger.info("Starting pipelined extraction and analysis...")
+        producer.start()
+        try:
+            while not (extracted and not unfinished):
+                kind, payload = events.get()
+                
+                if kind == 'error':
+                    raise payload
+                
+                elif kind == 'document_info':
+                    bibliography, metadata = payload
+                
+                elif kind == 'extracted':
+                    extracted = True
+                    logger.info(f"Extracted {len(text_blocks)} text blocks")
+                    if not text_blocks:
+                        return None
+                
+                elif kind == 'block':
+                    block = payload
+                    text_blocks.append(block)
+                    progress.total_blocks += 1
+                    if len(text_blocks) == 1:
+                        yield progress
+                    
+                    restored = completed.get(block.block_index)
+                    # Guard against extraction differences between runs
+                    if restored and restored.text_block.content == block.content:
+                        read_ahead.release()
+                        resumed_count += 1
+                        yield record(restored, analyzed=False, persist=False)
+                        continue
+                    
+                    unfinished.add(block.block_index)
+                    match = deduplicator.match(block) if deduplicator else None
+                    if match:
+                        read_ahead.release()
+                        representative = finished.get(match.representative_index)
+                        if representative:
+                            yield record(share_result(representative, block, match), analyzed=False)
+                        else:
+                            duplicates_by_representative.setdefault(
+                                match.representative_index, []
+                            ).append((block, match))
+                        continue
+                    
+                    if analysis_start is None:
+                        analysis_start = time.time()
+                    future = submit(self._analyze_single_block, block, bibliography, citation_style, context)
+                    future.add_done_callback(lambda done: events.put(('analyzed', done)))
+                
+                elif kind == 'analyzed':
+                    read_ahead.release()
+                    result = payload.result()
+                    finished[result.text_block.block_index] = result
+                    yield record(result)
+                    
+                    for block, match in duplicates_by_representative.pop(result.text_block.block_index, ()):
+                        yield record(share_result(result, block, match), analyzed=False)
+            
+            if analysis_start is not None:
+                analysis_end = time.time()
+                self._stage_timings['analysis'] = {
+                    'start': round(analysis_start - self._run_start_time, 6),
+                    'end': round(analysis_end - self._run_start_time, 6),
+                    'duration': round(analysis_end - analysis_start, 6),
+                }
+        except BaseException:
+            # Do not wait for queued blocks on Ctrl-C, a crash or an abandoned
+            # stream; finished blocks are already checkpointed
+            if self.block_scheduler:
+                self.block_scheduler.cancel(queue_key)
+            elif executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            stop.set()
+            producer.join()
+            if executor:
+                executor.shutdown(wait=True)
+        
+        return text_blocks, analysis_results, metadata, resumed_count, progress
+    
+    def _restore_from_checkpoint(
+        self,
+        completed: Dict[int, AnalysisResult],
+        text_blocks: List[TextBlock]
+    ) -> tuple[List[AnalysisResult], List[TextBlock]]:
+        """
+        Split blocks into those completed in the checkpoint and those still to analyze.
         
         Args:
-            text_blocks: List of text blocks to analyze
-            bibliography: Bibliography section content
-            citation_style: Expected citation style
-            context: Document context
+            completed: Results loaded from the checkpoint by block index
+            text_blocks: Blocks extracted from the document
             
         Returns:
-            List of AnalysisResult objects
+            Tuple of (restored results, blocks that need analysis)
         """
-        if self.settings.parallel_processing:
-            return self._analyze_blocks_parallel(
+        restored: List[AnalysisResult] = []
+        remaining: List[TextBlock] = []
+        
+        for text_block in text_blocks:
+            result = completed.get(text_block.block_index)
+            # Guard against extraction differences between runs
+            if result and result.text_block.content == text_block.content:
+                restored.append(result)
+            else:
+                remaining.append(text_block)
+        
+        logger.info(f"Resuming analysis: {len(restored)} blocks restored from checkpoint, "
+                    f"{len(remaining)} remaining")
+        return restored, remaining
+    
+    def _iter_analysis_results(
+        self,
+        text_blocks: List[TextBlock],
+        bibliography: str,
+        citation_style: str,
+        context: str
+    ) -> Iterator[AnalysisResult]:
+        """Yield analysis results in completion order using the configured approach."""
+        if not text_blocks:
+            return iter(())
+        
+        if self.block_scheduler:
+            return self._iter_blocks_scheduled(
+                text_blocks, bibliography, citation_style, context
+            )
+        elif self.settings.parallel_processing:
+            return self._iter_blocks_parallel(
                 text_blocks, bibliography, citation_style, context
             )
         else:
-            return self._analyze_blocks_sequential(
+            return self._iter_blocks_sequential(
                 text_blocks, bibliography, citation_style, context
             )
     
-    def _analyze_blocks_sequential(
+    def _analyze_single_block(
+        self,
+        text_block: TextBlock,
+        bibliography: str,
+        citation_style: str,
+        context: str
+    ) -> AnalysisResult:
+        """Analyze a single text block, turning failures into an empty result."""
+        block_start_time = time.time()
+        
+        try:
+            errors = self.analysis_orchestrator.analyze_text_block(
+                text_block, bibliography, citation_style, context, raise_on_timeout=True
+            )
+            
+            processing_time = time.time() - block_start_time
+            return AnalysisResult(
+                text_block=text_block,
+                errors=errors,
+                processing_time_seconds=processing_time
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze block {text_block.block_index}: {e}")
+            return AnalysisResult(
+                text_block=text_block,
+                errors=[],
+                processing_time_seconds=0.0,
+                analysis_failed=True
+            )
+    
+    def _iter_blocks_sequential(
         self,
         text_blocks: List[TextBlock],
         bibliography: str,
         citation_style: str,
         context: str
-    ) -> List[AnalysisResult]:
+    ) -> Iterator[AnalysisResult]:
         """Analyze text blocks sequentially."""
-        analysis_results = []
+        total_errors = 0
         
         for i, text_block in enumerate(text_blocks):
             logger.debug(f"Analyzing block {i+1}/{len(text_blocks)} (page {text_block.page_number})")
             
-            block_start_time = time.time()
+            result = self._analyze_single_block(text_block, bibliography, citation_style, context)
+            total_errors += result.error_count
             
-            try:
-                # Analyze the text block
-                errors = self.analysis_orchestrator.analyze_text_block(
-                    text_block, bibliography, citation_style, context
-                )
-                
-                # Create analysis result
-                processing_time = time.time() - block_start_time
-                result = AnalysisResult(
-                    text_block=text_block,
-                    errors=errors,
-                    processing_time_seconds=processing_time
-                )
-                
-                analysis_results.append(result)
-                
-                # Log progress every 10 blocks
-                if (i + 1) % 10 == 0:
-                    total_errors = sum(len(r.errors) for r in analysis_results)
-                    logger.info(f"Progress: {i+1}/{len(text_blocks)} blocks analyzed, "
-                              f"{total_errors} errors found so far")
-                
-            except Exception as e:
-                logger.error(f"Failed to analyze block {i}: {e}")
-                # Create empty result for failed analysis
-                result = AnalysisResult(
-                    text_block=text_block,
-                    errors=[],
-                    processing_time_seconds=0.0
-                )
-                analysis_results.append(result)
-        
-        return analysis_results
+            # Log progress every 10 blocks
+            if (i + 1) % 10 == 0:
+                logger.info(f"Progress: {i+1}/{len(text_blocks)} blocks analyzed, "
+                          f"{total_errors} errors found so far")
+            
+            yield result
     
-    def _analyze_blocks_parallel(
+    def _iter_blocks_parallel(
         self,
         text_blocks: List[TextBlock],
         bibliography: str,
         citation_style: str,
         context: str
-    ) -> List[AnalysisResult]:
+    ) -> Iterator[AnalysisResult]:
         """Analyze text blocks in parallel using ThreadPoolExecutor."""
-        analysis_results = []
         max_workers = min(self.settings.max_concurrent_requests, len(text_blocks))
         
         logger.info(f"Starting parallel analysis with {max_workers} workers")
         
-        def analyze_single_block(text_block: TextBlock) -> AnalysisResult:
-            """Analyze a single text block."""
-            block_start_time = time.time()
-            
-            try:
-                errors = self.analysis_orchestrator.analyze_text_block(
-                    text_block, bibliography, citation_style, context
-                )
-                
-                processing_time = time.time() - block_start_time
-                return AnalysisResult(
-                    text_block=text_block,
-                    errors=errors,
-                    processing_time_seconds=processing_time
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to analyze block {text_block.block_index}: {e}")
-                return AnalysisResult(
-                    text_block=text_block,
-                    errors=[],
-                    processing_time_seconds=0.0
-                )
-        
         # Use ThreadPoolExecutor for parallel processing
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
             # Submit all tasks
             future_to_block = {
-                executor.submit(analyze_single_block, block): block 
+                executor.submit(
+                    self._analyze_single_block, block, bibliography, citation_style, context
+                ): block 
                 for block in text_blocks
             }
             
@@ -349,20 +891,46 @@ class ThesisAnalysisPipeline:
             for i, future in enumerate(concurrent.futures.as_completed(future_to_block)):
                 try:
                     result = future.result()
-                    analysis_results.append(result)
-                    
-                    # Log progress
-                    if (i + 1) % 10 == 0:
-                        logger.info(f"Completed {i+1}/{len(text_blocks)} blocks")
-                        
                 except Exception as e:
                     block = future_to_block[future]
                     logger.error(f"Analysis failed for block {block.block_index}: {e}")
+                    continue
+                
+                # Log progress
+                if (i + 1) % 10 == 0:
+                    logger.info(f"Completed {i+1}/{len(text_blocks)} blocks")
+                
+                yield result
+        except BaseException:
+            # Do not wait for queued blocks on Ctrl-C, a crash or an abandoned
+            # stream; finished blocks are already checkpointed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown(wait=True)
+    
+    def _iter_blocks_scheduled(
+        self,
+        text_blocks: List[TextBlock],
+        bibliography: str,
+        citation_style: str,
+        context: str
+    ) -> Iterator[AnalysisResult]:
+        """Analyze text blocks on the shared scheduler, interleaved with other documents."""
+        queue_key = id(self)
+        futures = [
+            self.block_scheduler.submit(
+                queue_key, self._analyze_single_block, block, bibliography, citation_style, context
+            )
+            for block in text_blocks
+        ]
         
-        # Sort results by block index to maintain order
-        analysis_results.sort(key=lambda x: x.text_block.block_index)
-        
-        return analysis_results
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        except BaseException:
+            self.block_scheduler.cancel(queue_key)
+            raise
     
     def _create_analysis_report(
         self,
@@ -370,15 +938,20 @@ class ThesisAnalysisPipeline:
         text_blocks: List[TextBlock],
         analysis_results: List[AnalysisResult],
         processing_time: float,
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        citation_style: str = "APA",
+        baseline_report: Optional[str] = None,
+        selection: Optional[PageSelection] = None
     ) -> ThesisAnalysisReport:
         """Create comprehensive analysis report."""
         
         # Calculate token usage and cost
-        token_usage, estimated_cost = self._calculate_llm_usage()
+        token_usage, estimated_cost = calculate_llm_usage(self.settings) if self.report_usage else ({}, 0.0)
         
-        # Calculate total pages (get max page number from text blocks)
-        total_pages = max(block.page_number for block in text_blocks) if text_blocks else 0
+        # Total pages of the document; only part of it may have been selected
+        total_pages = metadata.get('page_count') or (
+            max(block.page_number for block in text_blocks) if text_blocks else 0
+        )
         
         # Create report
         report = ThesisAnalysisReport(
@@ -390,18 +963,56 @@ class ThesisAnalysisPipeline:
             total_processing_time_seconds=processing_time,
             token_usage=token_usage if token_usage else None,
             estimated_cost=estimated_cost if estimated_cost > 0 else None,
-            configuration_used={
-                'grammar_analysis_enabled': self.settings.grammar_analysis_enabled,
-                'content_analysis_enabled': self.settings.content_analysis_enabled,
-                'citation_analysis_enabled': self.settings.citation_analysis_enabled,
-                'model': self.settings.default_model,
-                'parallel_processing': self.settings.parallel_processing,
-                'max_concurrent_requests': self.settings.max_concurrent_requests,
-            }
+            stage_timings=dict(self._stage_timings),
+            baseline_report=str(baseline_report) if baseline_report else None,
+            configuration_used=self._configuration_used(citation_style, selection)
         )
         
         return report
     
+    def _checkpoint_configuration(
+        self,
+        citation_style: str,
+        context: str,
+        selection: Optional[PageSelection] = None
+    ) -> Dict[str, Any]:
+        """Settings that change block extraction or analysis results."""
+        return {
+            'page_selection': selection.describe() if selection else None,
+            'grammar_analysis_enabled': self.settings.grammar_analysis_enabled,
+            'content_analysis_enabled': self.settings.content_analysis_enabled,
+            'citation_analysis_enabled': self.settings.citation_analysis_enabled,
+            'citation_style': citation_style,
+            'context': context,
+            'llm_provider': self.settings.llm_provider,
+            'model': self.settings.default_model,
+            'max_text_block_size': self.settings.max_text_block_size,
+            'min_text_block_size': self.settings.min_text_block_size,
+            'target_block_tokens': self.settings.target_block_tokens,
+            'coalesce_small_blocks': self.settings.coalesce_small_blocks,
+            'deduplicate_blocks': self.settings.deduplicate_blocks,
+            'near_duplicate_threshold': self.settings.near_duplicate_threshold,
+        }
+    
+    def _configuration_used(
+        self,
+        citation_style: str,
+        selection: Optional[PageSelection] = None
+    ) -> Dict[str, Any]:
+        """Configuration settings recorded in the report."""
+        configuration = {
+            'grammar_analysis_enabled': self.settings.grammar_analysis_enabled,
+            'content_analysis_enabled': self.settings.content_analysis_enabled,
+            'citation_analysis_enabled': self.settings.citation_analysis_enabled,
+            'citation_style': citation_style,
+            'model': self.settings.default_model,
+            'parallel_processing': self.settings.parallel_processing,
+            'max_concurrent_requests': self.settings.max_concurrent_requests,
+        }
+        if selection:
+            configuration['page_selection'] = selection.describe()
+        return configuration
+    
     def _create_empty_report(self, pdf_path: Path) -> ThesisAnalysisReport:
         """Create an empty report for cases where no analysis could be performed."""
         return ThesisAnalysisReport(
@@ -413,38 +1024,50 @@ class ThesisAnalysisPipeline:
             total_processing_time_seconds=0.0
         )
     
-    def _save_analysis_results(self, report: ThesisAnalysisReport, output_directory: str):
-        """Save analysis results to files."""
-        output_path = Path(output_directory)
-        output_path.mkdir(parents=True, exist_ok=True)
+    def _report_base_path(self, pdf_path: Path, output_directory: str) -> Path:
+        """
+        Timestamped directory and name prefix of the report files of a run.
         
-        # Generate timestamp for unique filenames
+        A ``_1``, ``_2``, ... suffix is added while the prefix is taken by
+        existing report files or by another run of this process.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = f"{report.document_name}_{timestamp}"
-        
-        # Save JSON report
-        json_path = output_path / f"{base_name}_report.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            f.write(report.model_dump_json(indent=2))
-        
-        logger.info(f"Analysis report saved to: {json_path}")
+        base_path = Path(output_directory) / f"{pdf_path.name}_{timestamp}"
+        with _reserved_report_paths_lock:
+            candidate = base_path
+            suffix = 0
+            while candidate in _reserved_report_paths or glob.glob(f"{glob.escape(str(candidate))}_*"):
+                suffix += 1
+                candidate = base_path.with_name(f"{base_path.name}_{suffix}")
+            _reserved_report_paths.add(candidate)
+        return candidate
 
 
 class QuickAnalysisPipeline:
     """Simplified pipeline for quick analysis of small documents or testing."""
     
-    def __init__(self):
+    def __init__(self, output_directory: Optional[str] = None):
         self.settings = get_settings()
         self.pdf_processor = PDFProcessor()
+        if output_directory:
+            self.pdf_processor.use_output_directory(output_directory)
         self.analysis_orchestrator = AnalysisOrchestrator()
     
-    def quick_analyze(self, pdf_path: str, max_blocks: int = 10) -> ThesisAnalysisReport:
+    def quick_analyze(
+        self,
+        pdf_path: str,
+        max_blocks: int = 10,
+        selection: Optional[PageSelection] = None
+    ) -> ThesisAnalysisReport:
         """
         Perform quick analysis on first N blocks of a document.
         
+        Only as many pages are read as are needed to collect the blocks.
+        
         Args:
             pdf_path: Path to PDF file
             max_blocks: Maximum number of blocks to analyze
+            selection: Restrict the analysis to these pages or sections
             
         Returns:
             ThesisAnalysisReport with limited analysis
@@ -457,9 +1080,10 @@ class QuickAnalysisPipeline:
             # Initialize system
             initialize_system()
             
-            # Extract limited text blocks
-            all_blocks = self.pdf_processor.extract_text_blocks_from_pdf(pdf_path)
-            text_blocks = all_blocks[:max_blocks]
+            # Extract only the pages needed for the first blocks
+            text_blocks = list(itertools.islice(
+                self.pdf_processor.iter_text_blocks(pdf_path, selection), max_blocks
+            ))
             
             if not text_blocks:
                 return ThesisAnalysisReport(
@@ -473,13 +1097,19 @@ class QuickAnalysisPipeline:
             # Quick analysis (sequential only)
             analysis_results = []
             for text_block in text_blocks:
-                errors = self.analysis_orchestrator.analyze_text_block(text_block)
-                result = AnalysisResult(text_block=text_block, errors=errors)
+                try:
+                    errors = self.analysis_orchestrator.analyze_text_block(text_block, raise_on_timeout=True)
+                    result = AnalysisResult(text_block=text_block, errors=errors)
+                except LLMCallTimeoutError as e:
+                    logger.warning(f"Quick analysis of block {text_block.block_index} failed: {e}")
+                    result = AnalysisResult(text_block=text_block, errors=[], analysis_failed=True)
                 analysis_results.append(result)
             
             # Create report
             processing_time = time.time() - start_time
-            total_pages = max(block.page_number for block in all_blocks) if all_blocks else 0
+            total_pages = self.pdf_processor.get_document_metadata(pdf_path).get('page_count') or (
+                max(block.page_number for block in text_blocks)
+            )
             
             # Calculate token usage and cost
             token_usage, estimated_cost = self._calculate_llm_usage()
@@ -488,7 +1118,7 @@ class QuickAnalysisPipeline:
                 document_name=Path(pdf_path).name,
                 document_path=pdf_path,
                 total_pages=total_pages,
-                total_text_blocks=len(all_blocks),
+                total_text_blocks=len(text_blocks),
                 analysis_results=analysis_results,
                 total_processing_time_seconds=processing_time,
                 token_usage=token_usage if token_usage else None,
@@ -603,14 +1233,17 @@ class QuickAnalysisPipeline:
             return 0.0
 
 
-def create_analysis_pipeline() -> ThesisAnalysisPipeline:
+def create_analysis_pipeline(
+    block_scheduler: Optional[FairScheduler] = None,
+    report_usage: bool = True
+) -> ThesisAnalysisPipeline:
     """Factory function to create a configured analysis pipeline."""
-    return ThesisAnalysisPipeline()
+    return ThesisAnalysisPipeline(block_scheduler, report_usage)
 
 
-def create_quick_pipeline() -> QuickAnalysisPipeline:
+def create_quick_pipeline(output_directory: Optional[str] = None) -> QuickAnalysisPipeline:
     """Factory function to create a quick analysis pipeline."""
-    return QuickAnalysisPipeline()
+    return QuickAnalysisPipeline(output_directory)
 
 
 def run_pipeline_test():
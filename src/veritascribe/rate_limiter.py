@@ -103,6 +103,26 @@ class TokenBucketRateLimiter:
             self._refill_tokens()
             return self.tokens >= tokens_needed
     
+    def try_acquire(self, tokens_needed: int = 1) -> bool:
+        """
+        Acquire tokens only if they are available right away.
+        
+        Args:
+            tokens_needed: Number of tokens required
+            
+        Returns:
+            True if tokens acquired, False otherwise (nothing is queued)
+        """
+        with self.lock:
+            self._refill_tokens()
+            if self.tokens < tokens_needed:
+                return False
+            self.tokens -= tokens_needed
+            self.stats.total_requests += 1
+            self.stats.requests_allowed += 1
+            self.stats.current_tokens = self.tokens
+            return True
+    
     def acquire(self, tokens_needed: int = 1, timeout: Optional[float] = None) -> bool:
         """
         Acquire tokens, blocking until available or timeout.
@@ -289,6 +309,19 @@ class ProviderRateLimiter:
         
         return self.limiters[provider]
     
+    def try_acquire(self, provider: str, tokens_needed: int = 1) -> bool:
+        """
+        Acquire tokens for an optional extra request without waiting.
+        
+        Args:
+            provider: LLM provider name
+            tokens_needed: Number of tokens needed
+            
+        Returns:
+            True if the request may be sent now
+        """
+        return self.get_limiter(provider).try_acquire(tokens_needed)
+    
     def rate_limited_call(
         self,
         provider: str,
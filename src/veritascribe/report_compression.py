@@ -0,0 +1,98 @@
+"""Gzip and zstd compression of report files, chosen by setting on write and by suffix on read."""
+
+import gzip
+from pathlib import Path
+from typing import BinaryIO, Dict
+
+# File suffix of each report compression
+COMPRESSION_SUFFIXES: Dict[str, str] = {
+    'none': '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+# Fast levels: reports are written once per run, while the analysis is waiting
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def check_compression(compression: str) -> None:
+    """
+    Make sure reports can be written with a compression.
+
+    Args:
+        compression: 'none', 'gzip' or 'zstd'
+
+    Raises:
+        ValueError: If the compression is unknown or its package is not installed
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Unknown report compression '{compression}', expected one of {', '.join(COMPRESSION_SUFFIXES)}"
+        )
+    if compression == 'zstd':
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                "zstd report compression needs the 'zstandard' package "
+                "(install it with the 'export' extra: pip install 'veritascribe[export]')"
+            )
+
+
+def compressed_path(path: Path, compression: str) -> Path:
+    """
+    Location of a report file written with a compression.
+
+    Args:
+        path: Location of the uncompressed file
+        compression: 'none', 'gzip' or 'zstd'
+
+    Returns:
+        The path with the suffix of the compression appended
+    """
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return path.with_name(path.name + suffix) if suffix else path
+
+
+def open_compressed(file: BinaryIO, compression: str) -> BinaryIO:
+    """
+    Wrap a binary file so that everything written to it is compressed.
+
+    Closing the returned stream finishes the compressed data but leaves
+    ``file`` open.
+
+    Args:
+        file: Binary file opened for writing
+        compression: 'none', 'gzip' or 'zstd'
+
+    Returns:
+        Binary stream to write to
+    """
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=file, mode='wb', compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(file, closefd=False)
+    return file
+
+
+def read_report_bytes(path: Path) -> bytes:
+    """
+    Read a report file, decompressing it according to its suffix.
+
+    Args:
+        path: Report file, plain or ending in ``.gz`` or ``.zst``
+
+    Returns:
+        The uncompressed content
+    """
+    if path.suffix == COMPRESSION_SUFFIXES['gzip']:
+        with gzip.open(path, 'rb') as f:
+            return f.read()
+    if path.suffix == COMPRESSION_SUFFIXES['zstd']:
+        check_compression('zstd')
+        import zstandard
+        with open(path, 'rb') as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+    return path.read_bytes()
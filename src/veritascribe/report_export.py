@@ -0,0 +1,213 @@
+"""Export of analysis reports as JSON, NDJSON of errors and Parquet tables of errors."""
+
+import contextlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from pydantic_core import to_json
+
+from .data_models import AnalysisResult, ThesisAnalysisReport
+from .report_compression import check_compression, compressed_path, open_compressed
+from .report_writer import StreamingReportWriter
+
+logger = logging.getLogger(__name__)
+
+REPORT_FORMATS = ('json', 'ndjson', 'parquet')
+
+# File name ending of each format, before any compression suffix
+_FORMAT_SUFFIXES: Dict[str, str] = {
+    'json': '_report.json',
+    'ndjson': '_errors.ndjson',
+    'parquet': '_errors.parquet',
+}
+
+
+def check_report_formats(formats: Sequence[str], compression: str = 'none') -> None:
+    """
+    Make sure reports can be written in the given formats before analyzing.
+
+    Args:
+        formats: Report formats, any of ``REPORT_FORMATS``
+        compression: Compression of the JSON and NDJSON files
+
+    Raises:
+        ValueError: If a format is unknown or a package it needs is not installed
+    """
+    unknown = [report_format for report_format in formats if report_format not in REPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown report format(s) {', '.join(unknown)}, expected any of {', '.join(REPORT_FORMATS)}")
+    check_compression(compression)
+    if 'parquet' in formats:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                "Parquet reports need the 'pyarrow' package "
+                "(install it with the 'export' extra: pip install 'veritascribe[export]')"
+            )
+
+
+def report_file_path(base_path: Path, report_format: str, compression: str = 'none') -> Path:
+    """
+    Location of a report file of the given format.
+
+    Args:
+        base_path: Directory and name prefix shared by the files of one report
+        report_format: One of ``REPORT_FORMATS``
+        compression: Compression of the JSON and NDJSON files
+
+    Returns:
+        Path of the file
+    """
+    path = base_path.with_name(base_path.name + _FORMAT_SUFFIXES[report_format])
+    # Parquet compresses its columns itself
+    return path if report_format == 'parquet' else compressed_path(path, compression)
+
+
+def error_records(result: AnalysisResult, document_name: str) -> Iterator[Dict[str, Any]]:
+    """
+    One JSON-ready record per error of a result.
+
+    Args:
+        result: Result of one block
+        document_name: Name of the analyzed document
+
+    Yields:
+        The error's fields, preceded by the document and block index
+    """
+    for error in result.errors:
+        yield {
+            'document': document_name,
+            'block_index': result.text_block.block_index,
+            **error.model_dump(mode='json')
+        }
+
+
+@contextlib.contextmanager
+def _replace_on_success(path: Path) -> Iterator[str]:
+    """Yield a temporary path next to ``path`` that is moved onto it if no error occurs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    os.close(descriptor)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_error_ndjson(report: ThesisAnalysisReport, path: Path, compression: str = 'none') -> Path:
+    """
+    Write the errors of a report as newline-delimited JSON, one error per line.
+
+    The records are the ones ``analyze --ndjson`` streams to stdout.
+
+    Args:
+        report: Report to export
+        path: Location of the file, including any compression suffix
+        compression: 'none', 'gzip' or 'zstd'
+
+    Returns:
+        Path of the written file
+    """
+    with (
+        _replace_on_success(path) as tmp_path,
+        open(tmp_path, 'wb') as raw_file,
+        open_compressed(raw_file, compression) as stream
+    ):
+        for result in report.analysis_results:
+            for record in error_records(result, report.document_name):
+                stream.write(to_json(record) + b'\n')
+
+    logger.info(f"Error NDJSON saved to: {path}")
+    return path
+
+
+def _error_columns(records: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Turn error records into columns, with the location flattened.
+
+    Fields only some error types have are None in the rows of the others.
+    """
+    columns: Dict[str, List[Any]] = {'document': [], 'block_index': []}
+    rows = 0
+    for record in records:
+        location = record.pop('location')
+        record.update(location)
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * rows
+            column.append(value)
+        rows += 1
+        for column in columns.values():
+            if len(column) < rows:
+                column.append(None)
+    return columns
+
+
+def write_error_table(report: ThesisAnalysisReport, path: Path) -> Path:
+    """
+    Write the errors of a report as a zstd-compressed Parquet table, one row per error.
+
+    Columns are the fields of the NDJSON records, with the location's page
+    number, bounding box and paragraph index as columns of their own.
+
+    Args:
+        report: Report to export
+        path: Location of the file
+
+    Returns:
+        Path of the written file
+    """
+    check_report_formats(['parquet'])
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = _error_columns(
+        record for result in report.analysis_results for record in error_records(result, report.document_name)
+    )
+    table = pa.table(columns)
+    with _replace_on_success(path) as tmp_path:
+        pq.write_table(table, tmp_path, compression='zstd')
+
+    logger.info(f"Error table saved to: {path}")
+    return path
+
+
+def export_report(
+    report: ThesisAnalysisReport,
+    base_path: Path,
+    formats: Sequence[str],
+    compression: str = 'none',
+    compact: bool = False
+) -> Dict[str, Path]:
+    """
+    Write a complete report in each of the given formats.
+
+    Args:
+        report: Report to export
+        base_path: Directory and name prefix shared by the files
+        formats: Report formats, any of ``REPORT_FORMATS``
+        compression: Compression of the JSON and NDJSON files
+        compact: Omit block text from the JSON report
+
+    Returns:
+        Path of the written file of each format
+    """
+    check_report_formats(formats, compression)
+    paths: Dict[str, Path] = {}
+    for report_format in formats:
+        path = report_file_path(base_path, report_format, compression)
+        if report_format == 'json':
+            paths[report_format] = StreamingReportWriter.write_report(report, str(path), compact, compression)
+        elif report_format == 'ndjson':
+            paths[report_format] = write_error_ndjson(report, path, compression)
+        else:
+            paths[report_format] = write_error_table(report, path)
+    return paths
@@ -17,6 +17,8 @@ from .data_models import (
     ErrorType,
     BaseError
 )
+from .report_writer import StreamingReportWriter
+from .word_index import DocumentWordIndex
 
 logger = logging.getLogger(__name__)
 
@@ -209,6 +211,24 @@ class ReportGenerator:
         content.append("")
         content.append(f"- **Total Pages:** {report.total_pages}")
         content.append(f"- **Text Blocks Analyzed:** {report.total_text_blocks}")
+        if report.baseline_report:
+            content.append(f"- **Baseline Report:** {Path(report.baseline_report).name}")
+            content.append(f"- **Blocks Reused from Baseline:** {report.reused_blocks}")
+            content.append(f"- **Blocks Re-analyzed:** {report.reanalyzed_blocks}")
+        if report.deduplicated_blocks:
+            content.append(f"- **Duplicate Blocks Sharing an Analysis:** {report.deduplicated_blocks}")
+        if report.request_stats:
+            content.append(
+                f"- **LLM Calls:** {report.request_stats.get('calls', 0)} "
+                f"({report.request_stats.get('timeouts', 0)} timed out, "
+                f"{report.request_stats.get('hedged_requests', 0)} hedged, "
+                f"{report.request_stats.get('hedges_won', 0)} won by the hedge)"
+            )
+            if report.request_stats.get('requests'):
+                content.append(
+                    f"- **HTTP Connections:** {report.request_stats.get('new_connections', 0)} new, "
+                    f"{report.request_stats.get('reused_connections', 0)} reused"
+                )
         content.append(f"- **Total Words:** {report.total_words:,}")
         content.append(f"- **Total Errors Found:** {report.total_errors}")
         content.append(f"- **Error Rate:** {report.error_rate:.2f} errors per 1,000 words")
@@ -256,7 +276,7 @@ class ReportGenerator:
             content.append("")
         
         # High Priority Issues
-        high_severity_errors = report.get_high_severity_errors()
+        high_severity_errors = report.index.high_severity_errors
         if high_severity_errors:
             content.append("## High Priority Issues")
             content.append("")
@@ -305,9 +325,7 @@ class ReportGenerator:
             content.append("")
             
             # Group errors by type for better organization
-            errors_by_type = self._group_errors_by_type(report.analysis_results)
-            
-            for error_type, errors in errors_by_type.items():
+            for error_type, errors in report.index.errors_by_type.items():
                 if not errors:
                     continue
                     
@@ -333,19 +351,6 @@ class ReportGenerator:
         
         return "\n".join(content)
     
-    def _group_errors_by_type(self, analysis_results: List[AnalysisResult]) -> Dict[str, List[BaseError]]:
-        """Group all errors by type across all analysis results."""
-        errors_by_type = {}
-        
-        for result in analysis_results:
-            for error in result.errors:
-                error_type = error.error_type
-                if error_type not in errors_by_type:
-                    errors_by_type[error_type] = []
-                errors_by_type[error_type].append(error)
-        
-        return errors_by_type
-    
     def visualize_errors(
         self, 
         report: ThesisAnalysisReport, 
@@ -573,20 +578,24 @@ class ReportGenerator:
         
         return str(output_path)
     
-    def export_json_report(self, report: ThesisAnalysisReport, output_path: str) -> str:
-        """Export the complete report as a JSON file."""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report.model_dump_json(indent=2))
+    def export_json_report(
+        self,
+        report: ThesisAnalysisReport,
+        output_path: str,
+        compact: bool = False,
+        compression: str = 'none'
+    ) -> str:
+        """Export the complete report as a JSON file, written result by result and optionally compressed."""
+        output_path = StreamingReportWriter.write_report(
+            report, output_path, compact=compact, compression=compression
+        )
         
         logger.info(f"JSON report exported: {output_path}")
         return str(output_path)
     
     def create_summary_report(self, report: ThesisAnalysisReport) -> Dict[str, Any]:
         """Create a concise summary of the analysis results."""
-        high_severity_errors = report.get_high_severity_errors()
+        high_severity_errors = report.index.high_severity_errors
         
         summary = {
             'document_name': report.document_name,
@@ -613,7 +622,7 @@ class ReportGenerator:
             return "Excellent! No errors detected. The document appears to be well-written."
         
         error_rate = report.error_rate
-        high_severity_count = len(report.get_high_severity_errors())
+        high_severity_count = len(report.index.high_severity_errors)
         
         if high_severity_count > 0:
             return f"Immediate attention required: {high_severity_count} high-severity issues found. Focus on addressing these critical errors first."
@@ -633,6 +642,10 @@ class ReportGenerator:
         """
         Generate an annotated PDF with errors highlighted and explained directly on the page.
         
+        Each error's original text is highlighted word by word, found through
+        a word index built once per page with errors; errors whose text cannot
+        be found there fall back to highlighting their block's bounding box.
+        
         Args:
             report: ThesisAnalysisReport containing the analysis results
             original_pdf_path: Path to the original PDF file
@@ -661,10 +674,11 @@ class ReportGenerator:
             
             # Track annotations per page to avoid overlaps
             page_annotations = {}
+            word_index = DocumentWordIndex(doc)
             
-            # Process each analysis result
-            for result in report.analysis_results:
-                for error in result.errors:
+            # Process the errors page by page
+            for errors in report.index.errors_by_page.values():
+                for error in errors:
                     page_num = error.location.page_number - 1  # Convert to 0-based indexing
                     
                     # Skip if page number is invalid
@@ -681,13 +695,20 @@ class ReportGenerator:
                     # Get highlight color based on severity
                     highlight_color = severity_colors.get(error.severity, (0.8, 0.8, 0.8))
                     
-                    # Add highlight annotation if bounding box is available
-                    if error.location.bounding_box:
+                    # Highlight the erroneous words, or the whole block if they are not found
+                    word_boxes = word_index.locate(
+                        error.location.page_number,
+                        error.original_text,
+                        within=error.location.bounding_box
+                    )
+                    highlight = None
+                    if word_boxes:
+                        highlight = page.add_highlight_annot(quads=[fitz.Rect(box).quad for box in word_boxes])
+                    elif error.location.bounding_box:
                         x0, y0, x1, y1 = error.location.bounding_box
-                        rect = fitz.Rect(x0, y0, x1, y1)
-                        
-                        # Add highlight annotation
-                        highlight = page.add_highlight_annot(rect)
+                        highlight = page.add_highlight_annot(fitz.Rect(x0, y0, x1, y1))
+                    
+                    if highlight:
                         highlight.set_colors(stroke=highlight_color)
                         highlight.update()
                     
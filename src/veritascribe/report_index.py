@@ -0,0 +1,88 @@
+"""Incrementally maintained counts and error lists of an analysis report."""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from .data_models import AnalysisResult, BaseError
+
+
+class ReportIndex:
+    """
+    Counts and error lists by type, severity and page, updated result by result.
+
+    Reports, report writers and the report generator read summary
+    statistics and error lists from the index instead of scanning all
+    results again. Adding a result costs time proportional to its errors.
+    Error lists keep the order in which results were added.
+    """
+
+    def __init__(self, results: Iterable["AnalysisResult"] = ()):
+        """
+        Initialize the index.
+
+        Args:
+            results: Results to index right away
+        """
+        self.total_text_blocks = 0
+        self.total_words = 0
+        self.total_errors = 0
+        self.reused_blocks = 0
+        self.deduplicated_blocks = 0
+        self.reanalyzed_blocks = 0
+        self.errors_by_type: Dict[str, List["BaseError"]] = {}
+        self.errors_by_severity: Dict[str, List["BaseError"]] = {}
+        # Keyed by the page of each error's location
+        self.errors_by_page: Dict[int, List["BaseError"]] = {}
+        # Keyed by the page of each result's block, including blocks without errors
+        self.error_counts_by_page: Dict[int, int] = {}
+        for result in results:
+            self.add(result)
+
+    def add(self, result: "AnalysisResult") -> None:
+        """
+        Account for the result of one block.
+
+        Args:
+            result: Result to add
+        """
+        self.total_text_blocks += 1
+        self.total_words += result.text_block.word_count
+        self.total_errors += len(result.errors)
+        if result.reused_from_baseline:
+            self.reused_blocks += 1
+        if result.duplicate_of is not None:
+            self.deduplicated_blocks += 1
+        if not result.reused_from_baseline and result.duplicate_of is None:
+            self.reanalyzed_blocks += 1
+
+        page = result.text_block.page_number
+        self.error_counts_by_page[page] = self.error_counts_by_page.get(page, 0) + len(result.errors)
+        for error in result.errors:
+            self.errors_by_type.setdefault(error.error_type, []).append(error)
+            self.errors_by_severity.setdefault(error.severity, []).append(error)
+            self.errors_by_page.setdefault(error.location.page_number, []).append(error)
+
+    @property
+    def high_severity_errors(self) -> List["BaseError"]:
+        """Errors of high severity, in the order their results were added."""
+        return self.errors_by_severity.get("high", [])
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Summary statistics in the shape of the ``ThesisAnalysisReport`` fields.
+
+        Returns:
+            Block, word and error totals, provenance counts and error counts
+            by type, severity and page
+        """
+        return {
+            'total_text_blocks': self.total_text_blocks,
+            'total_words': self.total_words,
+            'total_errors': self.total_errors,
+            'reused_blocks': self.reused_blocks,
+            'deduplicated_blocks': self.deduplicated_blocks,
+            'reanalyzed_blocks': self.reanalyzed_blocks,
+            'errors_by_type': {error_type: len(errors) for error_type, errors in self.errors_by_type.items()},
+            'errors_by_severity': {severity: len(errors) for severity, errors in self.errors_by_severity.items()},
+            'errors_by_page': dict(self.error_counts_by_page),
+        }
@@ -0,0 +1,164 @@
+"""Incremental writing of JSON analysis reports as block results arrive."""
+
+import contextlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pydantic_core import to_json
+
+from .data_models import AnalysisResult, ThesisAnalysisReport
+from .incremental import block_fingerprint
+from .report_compression import check_compression, open_compressed
+from .report_index import ReportIndex
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingReportWriter:
+    """
+    Writes a JSON report result by result instead of serializing it at once.
+
+    The file has the shape of an exported ``ThesisAnalysisReport``: each
+    result is serialized on its own line as soon as it is appended, in
+    completion order, and counted into a ``ReportIndex``; the summary
+    statistics and run metadata follow the results when the writer is
+    closed. Only one result is held in serialized form at a time, so memory
+    does not grow with the report.
+    The report is written to a temporary file and only appears under its
+    name once complete. Results are encoded by pydantic-core's serializer
+    straight to bytes, optionally through a gzip or zstd compressor.
+
+    In compact mode the text of each block is left out; blocks are
+    referenced by page, bounding box, block indices and the SHA-256 of
+    their normalized text (``content_sha256``). Compact reports cannot be
+    loaded back as ``ThesisAnalysisReport`` or used as a baseline.
+    """
+
+    def __init__(self, path: str, compact: bool = False, compression: str = 'none'):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Location of the finished report, including any compression suffix
+            compact: Omit block text, keeping only its hash and location
+            compression: 'none', 'gzip' or 'zstd'
+        """
+        check_compression(compression)
+        self.path = Path(path)
+        self.compact = compact
+        self.compression = compression
+        self.index = ReportIndex()
+        self._raw_file = None
+        self._file = None
+        self._tmp_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def open(self) -> "StreamingReportWriter":
+        """Create the temporary report file and start the list of results."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, self._tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp'
+        )
+        self._raw_file = os.fdopen(descriptor, 'wb')
+        self._file = open_compressed(self._raw_file, self.compression)
+        self._file.write(b'{\n  "analysis_results": [')
+        return self
+
+    def append(self, result: AnalysisResult) -> None:
+        """
+        Write the result of a finished block.
+
+        Args:
+            result: Result of one block
+        """
+        if self.compact:
+            line = to_json(result, exclude={'text_block': {'content'}})
+            # Quotes inside JSON strings are escaped, so the first match is the key
+            fingerprint = block_fingerprint(result.text_block.content).encode('ascii')
+            line = line.replace(b'"text_block":{', b'"text_block":{"content_sha256":"' + fingerprint + b'",', 1)
+        else:
+            line = to_json(result)
+
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(b',\n    ' if self.index.total_text_blocks else b'\n    ')
+            self._file.write(line)
+            self.index.add(result)
+
+    def close(self, fields: Dict[str, Any]) -> Path:
+        """
+        Write the summary and move the report into place.
+
+        Args:
+            fields: Report fields other than the results and the statistics
+                computed from them, e.g. document name, page count, timings
+
+        Returns:
+            Path of the finished report
+        """
+        summary = {**fields, **self.index.statistics()}
+        summary.pop('analysis_results', None)
+        with self._lock:
+            self._file.write(b'\n  ]')
+            for key, value in summary.items():
+                self._file.write(b',\n  ' + to_json(key) + b': ' + to_json(value))
+            self._file.write(b'\n}\n')
+            self._close_files()
+            os.replace(self._tmp_path, self.path)
+            self._tmp_path = None
+
+        logger.info(f"Analysis report saved to: {self.path}")
+        return self.path
+
+    def discard(self) -> None:
+        """Close and delete an unfinished report."""
+        with self._lock:
+            with contextlib.suppress(OSError, ValueError):
+                self._close_files()
+            if self._tmp_path:
+                with contextlib.suppress(OSError):
+                    os.unlink(self._tmp_path)
+                self._tmp_path = None
+
+    def _close_files(self) -> None:
+        """Finish the compressed stream and close the temporary file."""
+        if self._file is not None and self._file is not self._raw_file:
+            self._file.close()
+        if self._raw_file is not None:
+            self._raw_file.close()
+        self._file = None
+        self._raw_file = None
+
+    @classmethod
+    def write_report(
+        cls,
+        report: ThesisAnalysisReport,
+        path: str,
+        compact: bool = False,
+        compression: str = 'none'
+    ) -> Path:
+        """
+        Write a complete report without serializing it into one string.
+
+        Args:
+            report: Report to write
+            path: Location of the report file, including any compression suffix
+            compact: Omit block text, keeping only its hash and location
+            compression: 'none', 'gzip' or 'zstd'
+
+        Returns:
+            Path of the written report
+        """
+        writer = cls(path, compact, compression).open()
+        try:
+            for result in report.analysis_results:
+                writer.append(result)
+            return writer.close(report.model_dump(exclude={'analysis_results'}))
+        except BaseException:
+            writer.discard()
+            raise
@@ -0,0 +1,147 @@
+"""Fair scheduling of block analyses from several documents on one worker pool."""
+
+import contextvars
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Hashable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_Task = Tuple[Future, Callable, tuple, dict]
+
+
+class FairScheduler:
+    """
+    Worker pool that serves one task queue per document in round-robin order.
+
+    A plain executor runs tasks first-in first-out, so a long document that
+    submitted all of its blocks would hold back every document after it.
+    Here each worker takes the next task of the next document in turn, so
+    blocks of all active documents are interleaved and short documents
+    finish early.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Number of worker threads, i.e. concurrent block analyses
+        """
+        self.max_workers = max(1, max_workers)
+        self._queues: "OrderedDict[Hashable, Deque[_Task]]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._workers: List[threading.Thread] = []
+
+    def submit(self, queue_key: Hashable, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a task for a document.
+
+        Args:
+            queue_key: Identifies the document the task belongs to
+            fn: Function to run
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Future of the task's result
+        """
+        future: Future = Future()
+        # Keep DSPy context overrides of the submitting thread
+        context = contextvars.copy_context()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a scheduler that was shut down")
+            self._queues.setdefault(queue_key, deque()).append((future, context.run, (fn, *args), kwargs))
+            self._start_worker()
+            self._condition.notify()
+        return future
+
+    def cancel(self, queue_key: Hashable) -> int:
+        """
+        Cancel all queued tasks of a document; running tasks finish normally.
+
+        Args:
+            queue_key: Identifies the document
+
+        Returns:
+            Number of cancelled tasks
+        """
+        with self._condition:
+            tasks = self._queues.pop(queue_key, ())
+        for future, _, _, _ in tasks:
+            future.cancel()
+        return len(tasks)
+
+    def _start_worker(self) -> None:
+        """Start another worker while below the limit (called with the lock held)."""
+        if len(self._workers) >= self.max_workers:
+            return
+        worker = threading.Thread(
+            target=self._work, name=f"block-worker-{len(self._workers)}", daemon=True
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _next_task(self):
+        """Take the next task in round-robin order, or None once shut down."""
+        with self._condition:
+            while not self._queues:
+                if self._shutdown:
+                    return None
+                self._condition.wait()
+            queue_key, tasks = self._queues.popitem(last=False)
+            task = tasks.popleft()
+            if tasks:
+                # The document goes to the back of the line
+                self._queues[queue_key] = tasks
+            return task
+
+    def _work(self) -> None:
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Stop the workers once the queues are drained.
+
+        Args:
+            wait: Block until all workers have exited
+            cancel_futures: Cancel queued tasks instead of running them
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                queues = list(self._queues.values())
+                self._queues.clear()
+            else:
+                queues = []
+            self._condition.notify_all()
+            workers = list(self._workers)
+
+        for tasks in queues:
+            for future, _, _, _ in tasks:
+                future.cancel()
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def __enter__(self) -> "FairScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(wait=True)
@@ -0,0 +1,186 @@
+"""Chapter and section structure of a document from the font metrics of its blocks."""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .chunking import RawBlock
+from .data_models import TextBlock
+
+logger = logging.getLogger(__name__)
+
+# Numbered heading line such as "3 Methodology" or "3.2. Sampling"; lines
+# ending in a period (numbered footnotes, list items) are not headings
+NUMBERED_HEADING_PATTERN = re.compile(r'^(\d+(?:\.\d+)*)\.?\s+([A-ZÄÖÜ].{0,80}[^.])$')
+
+# PyMuPDF span flag of bold text
+_BOLD_FLAG = 16
+
+# Headings are short and do not end like sentences
+_MAX_HEADING_CHARS = 150
+_SENTENCE_ENDINGS = ('.', ',', ';')
+
+
+@dataclass
+class BlockFont:
+    """Font metrics of an extracted block."""
+    # Font size (rounded to half points) that most of the block's characters have
+    size: float
+    # Whether every span of the block is bold
+    bold: bool
+    # Number of non-whitespace characters
+    characters: int
+
+
+def block_font(block: Dict[str, Any]) -> Optional[BlockFont]:
+    """
+    Collect the font metrics of a block of ``page.get_text("dict")``.
+
+    Args:
+        block: PyMuPDF block dictionary
+
+    Returns:
+        BlockFont of the block, or None if its spans carry no font sizes
+        (as in the "blocks" extraction mode)
+    """
+    characters_by_size: Counter = Counter()
+    bold = True
+    for line in block.get("lines", []):
+        for span in line.get("spans", []):
+            characters = len("".join(span.get("text", "").split()))
+            if not characters or "size" not in span:
+                continue
+            characters_by_size[round(span["size"] * 2) / 2] += characters
+            bold = bold and bool(span.get("flags", 0) & _BOLD_FLAG)
+    if not characters_by_size:
+        return None
+    return BlockFont(
+        size=characters_by_size.most_common(1)[0][0],
+        bold=bold,
+        characters=sum(characters_by_size.values())
+    )
+
+
+@dataclass
+class _OpenSection:
+    title: str
+    size: float
+    # Depth of a numbered heading ("3.2" is 2), None if unnumbered
+    depth: Optional[int]
+
+
+class SectionTracker:
+    """
+    Tags blocks with the path of chapter and section titles they belong to.
+
+    Blocks are fed page by page in document order. The body text size is
+    the size most characters read so far have; a short block that is at
+    least ``min_size_increase`` points larger, or bold and numbered like
+    "3.2 Sampling", is a heading. Numbered headings nest by their
+    numbering, others by size: a heading closes every open section whose
+    heading is not larger than its own.
+    """
+
+    def __init__(self, min_size_increase: float = 1.0, size_tolerance: float = 0.5):
+        """
+        Initialize the tracker.
+
+        Args:
+            min_size_increase: Points by which headings exceed the body text size
+            size_tolerance: Size difference up to which headings count as the same level
+        """
+        self.min_size_increase = min_size_increase
+        self.size_tolerance = size_tolerance
+        self._characters_by_size: Counter = Counter()
+        self._open: List[_OpenSection] = []
+
+    @property
+    def body_size(self) -> Optional[float]:
+        """Font size of the body text read so far."""
+        if not self._characters_by_size:
+            return None
+        return self._characters_by_size.most_common(1)[0][0]
+
+    def tag_page(self, blocks: List[RawBlock], fonts: Dict[int, BlockFont]) -> None:
+        """
+        Set the section path of the blocks of the next page.
+
+        Args:
+            blocks: Raw blocks of one page in reading order
+            fonts: Font metrics by raw block index; blocks without are body text
+        """
+        for block in blocks:
+            font = fonts.get(block.block_index)
+            if font:
+                self._characters_by_size[font.size] += font.characters
+
+        body_size = self.body_size
+        for block in blocks:
+            font = fonts.get(block.block_index)
+            if font and body_size is not None:
+                title = " ".join(block.content.split())
+                numbering = NUMBERED_HEADING_PATTERN.match(title)
+                if self._is_heading(title, font, body_size, numbering is not None):
+                    depth = numbering.group(1).count('.') + 1 if numbering else None
+                    self._open_section(_OpenSection(title, font.size, depth))
+            block.section_path = [section.title for section in self._open]
+
+    def _is_heading(self, title: str, font: BlockFont, body_size: float, numbered: bool) -> bool:
+        if len(title) > _MAX_HEADING_CHARS or title.endswith(_SENTENCE_ENDINGS):
+            return False
+        if not any(char.isalpha() for char in title):
+            return False
+        if font.size >= body_size + self.min_size_increase:
+            return True
+        return font.bold and numbered and font.size >= body_size - self.size_tolerance
+
+    def _open_section(self, section: _OpenSection) -> None:
+        """Close the sections the new heading ends and open its section."""
+        while self._open:
+            current = self._open[-1]
+            if section.depth is not None and current.depth is not None:
+                ends = current.depth >= section.depth
+            else:
+                ends = current.size <= section.size + self.size_tolerance
+            if not ends:
+                break
+            self._open.pop()
+        self._open.append(section)
+
+
+@dataclass
+class SectionNode:
+    """A chapter or section with the blocks directly in it and its subsections."""
+    title: str
+    # 1 for chapters, 0 for the document root
+    level: int
+    # Page of the first block in the section
+    page_number: Optional[int] = None
+    block_indices: List[int] = field(default_factory=list)
+    children: List["SectionNode"] = field(default_factory=list)
+
+
+def build_section_tree(text_blocks: List[TextBlock]) -> SectionNode:
+    """
+    Build the tree of chapters, sections and their blocks from tagged blocks.
+
+    Args:
+        text_blocks: Blocks in document order with section paths
+
+    Returns:
+        Root node of the document; blocks before the first heading belong to it
+    """
+    root = SectionNode(title="", level=0)
+    for text_block in text_blocks:
+        node = root
+        for level, title in enumerate(text_block.section_path, start=1):
+            # A section continues until a different heading follows it
+            if not node.children or node.children[-1].title != title:
+                node.children.append(SectionNode(title=title, level=level, page_number=text_block.page_number))
+            node = node.children[-1]
+        if node.page_number is None:
+            node.page_number = text_block.page_number
+        node.block_indices.append(text_block.block_index)
+    return root
@@ -0,0 +1,122 @@
+"""Cleaning of text extracted from PDFs with precompiled, combined patterns."""
+
+import re
+
+# Bump whenever cleaning can produce different output, so cached
+# extractions made with older rules are not reused
+CLEANING_VERSION = 1
+
+# Umlauts that PDF text layers store as a diaeresis or quote before the base letter
+_UMLAUT_REPAIRS = {
+    **{f"{mark}{letter}": umlaut for mark in "¨“" for letter, umlaut in zip("aAoOuU", "äÄöÖüÜ")},
+    '"o': 'ö',
+    '"u': 'ü',
+}
+_UMLAUT_PATTERN = re.compile(r'[¨“][aAoOuU]|"[ou]')
+
+_LINE_BREAK_HYPHEN_PATTERN = re.compile(r'-\n(?![ ,])')
+
+# Control characters left after whitespace is collapsed
+_CONTROL_PATTERN = re.compile(r'[\x00-\x08\x0E-\x1B\x7F]')
+
+# Whitespace is already collapsed to single spaces when this applies
+_SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r' +([.,;:!?])')
+
+# URLs and e-mail addresses are never spaced out
+_URL_EMAIL_PATTERN = re.compile(r'(\b(?:https?://\S+|www\.\S+|[\w\.-]+@[\w\.-]+\.\w+)\b)')
+
+
+# Character class of everything str.isdigit() accepts, including "²" and "①":
+# the decimal digits plus superscripts, subscripts, circled and parenthesized
+# digits (Unicode 14). Listed rather than derived from all code points at
+# import, which every extraction worker process would repeat.
+_DIGIT = (
+    r'\d\u00B2\u00B3\u00B9\u1369-\u1371\u19DA\u2070\u2074-\u2079\u2080-\u2089'
+    r'\u2460-\u2468\u2474-\u247C\u2488-\u2490\u24EA\u24F5-\u24FD\u24FF'
+    r'\u2776-\u277E\u2780-\u2788\u278A-\u2792'
+    r'\U00010A40-\U00010A43\U00010E60-\U00010E68\U00011052-\U0001105A\U0001F100-\U0001F10A'
+)
+
+# Punctuation gets exactly one following space unless it sits between two
+# digits (decimals, version numbers); the punctuation is matched first so
+# the digit checks only run where there is punctuation
+_PUNCTUATION_SPACING_PATTERN = re.compile(
+    rf'([.,;:!?])(?:(?<![{_DIGIT}].)|(?![{_DIGIT}]))\s*'
+)
+
+
+def fix_german_umlauts(text: str) -> str:
+    """
+    Fix corrupted German umlauts that appear as a mark before the base letter.
+
+    All repairs are made in one pass of a combined pattern; no repair can
+    create the input of another, so the result equals applying them one by one.
+
+    Args:
+        text: Text with potentially corrupted umlauts
+
+    Returns:
+        Text with restored German umlauts
+    """
+    if not text:
+        return ""
+    if '¨' not in text and '“' not in text and '"' not in text:
+        return text
+    return _UMLAUT_PATTERN.sub(lambda match: _UMLAUT_REPAIRS[match.group()], text)
+
+
+def remove_line_break_hyphens(text: str) -> str:
+    """
+    Remove hyphens that were inserted at line breaks in German text.
+
+    Args:
+        text: Text with potential line-break hyphens
+
+    Returns:
+        Text with line-break hyphens removed
+    """
+    if not text or '-\n' not in text:
+        return text or ""
+    return _LINE_BREAK_HYPHEN_PATTERN.sub('', text)
+
+
+def clean_extracted_text(text: str) -> str:
+    """
+    Clean and normalize extracted text.
+
+    Umlauts are repaired, hyphenated line breaks joined, whitespace collapsed
+    and control characters dropped. Spaces before punctuation are removed
+    and exactly one space is put after it, except between digits and inside
+    URLs and e-mail addresses. Every step is a single C-level pass, and steps
+    with nothing to do are skipped by a substring check.
+
+    Args:
+        text: Raw extracted text
+
+    Returns:
+        Cleaned text
+    """
+    if not text:
+        return ""
+
+    text = remove_line_break_hyphens(fix_german_umlauts(text))
+
+    # Whitespace runs become one space; runs at either end are dropped, which
+    # the final strip() would do anyway
+    text = ' '.join(text.split())
+    if not text.isprintable():
+        text = _CONTROL_PATTERN.sub('', text)
+
+    if _SPACE_BEFORE_PUNCTUATION_PATTERN.search(text):
+        text = _SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r'\1', text)
+
+    if '@' in text or '://' in text or 'www.' in text:
+        # Odd parts are URLs and e-mail addresses, even parts the text between them
+        parts = _URL_EMAIL_PATTERN.split(text)
+        for i in range(0, len(parts), 2):
+            parts[i] = _PUNCTUATION_SPACING_PATTERN.sub(r'\1 ', parts[i])
+        text = ''.join(parts)
+    else:
+        text = _PUNCTUATION_SPACING_PATTERN.sub(r'\1 ', text)
+
+    return text.strip()
@@ -0,0 +1,180 @@
+"""Word-level index of PDF pages for locating error text to the exact words."""
+
+import bisect
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import fitz  # PyMuPDF
+
+from .text_cleaning import fix_german_umlauts
+
+Box = Tuple[float, float, float, float]
+
+# Word centers may lie this far outside a block's bounding box and still count as inside
+_BOX_TOLERANCE = 2.0
+
+
+def match_key(text: str) -> str:
+    """
+    Reduce text to its case-folded letters and digits.
+
+    Extraction cleaning joins hyphenated line breaks, repairs umlauts and
+    respaces punctuation, so cleaned block text and the raw words of a page
+    only compare equal on their letters and digits.
+
+    Args:
+        text: Raw or cleaned text
+
+    Returns:
+        Comparison key of the text
+    """
+    return ''.join(char for char in fix_german_umlauts(text).casefold() if char.isalnum())
+
+
+def _center_inside(box: Box, area: Box) -> bool:
+    x = (box[0] + box[2]) / 2
+    y = (box[1] + box[3]) / 2
+    return (
+        area[0] - _BOX_TOLERANCE <= x <= area[2] + _BOX_TOLERANCE
+        and area[1] - _BOX_TOLERANCE <= y <= area[3] + _BOX_TOLERANCE
+    )
+
+
+class PageWordIndex:
+    """
+    The words of one page, searchable by substring.
+
+    The match keys of all words are concatenated into one string with the
+    offset where every word starts, so finding text is a single substring
+    search and a binary search for the words it covers.
+    """
+
+    def __init__(self, words: Sequence[tuple]):
+        """
+        Build the index.
+
+        Args:
+            words: Words as returned by ``page.get_text("words")``:
+                (x0, y0, x1, y1, word, block number, line number, word number)
+        """
+        self.boxes: List[Box] = []
+        self.lines: List[Tuple[int, int]] = []
+        self.starts: List[int] = []
+        keys = []
+        offset = 0
+        for x0, y0, x1, y1, word, block_number, line_number, *_ in words:
+            key = match_key(word)
+            if not key:
+                continue
+            self.starts.append(offset)
+            self.boxes.append((x0, y0, x1, y1))
+            self.lines.append((block_number, line_number))
+            keys.append(key)
+            offset += len(key)
+        self.text = ''.join(keys)
+
+    @classmethod
+    def from_page(cls, page: fitz.Page) -> "PageWordIndex":
+        """Index the words of a page."""
+        return cls(page.get_text("words"))
+
+    def find(self, text: str, within: Optional[Box] = None) -> List[Box]:
+        """
+        Find the words of a text on the page.
+
+        Text that spans blocks which are not adjacent in the page's word
+        order, such as two paragraphs merged around a heading, is found
+        piece by piece; it only counts as found if every word is.
+
+        Args:
+            text: Text to find, e.g. the original text of an error
+            within: Only accept occurrences that start inside this box,
+                typically the bounding box of the error's text block
+
+        Returns:
+            One box per line the matching words cover, or an empty list if
+            the text does not occur
+        """
+        boxes = self._find_key(match_key(text), within)
+        if boxes is not None:
+            return boxes
+
+        words = text.split()
+        boxes = []
+        start = 0
+        while start < len(words):
+            # Longest run of words from start that occurs in one piece
+            for end in range(len(words), start, -1):
+                piece_boxes = self._find_key(match_key(' '.join(words[start:end])), within)
+                if piece_boxes is not None:
+                    break
+            else:
+                if match_key(words[start]):
+                    return []
+                # Words without letters or digits have nothing to find
+                start += 1
+                continue
+            boxes.extend(piece_boxes)
+            start = end
+        return boxes
+
+    def _find_key(self, key: str, within: Optional[Box]) -> Optional[List[Box]]:
+        """Line boxes of the first occurrence of a match key, or None if it does not occur."""
+        if not key:
+            return None
+        position = self.text.find(key)
+        while position != -1:
+            first = bisect.bisect_right(self.starts, position) - 1
+            if within is None or _center_inside(self.boxes[first], within):
+                last = bisect.bisect_right(self.starts, position + len(key) - 1) - 1
+                return self._line_boxes(first, last)
+            position = self.text.find(key, position + 1)
+        return None
+
+    def _line_boxes(self, first: int, last: int) -> List[Box]:
+        """Union of the boxes of consecutive words on each line."""
+        boxes: List[Box] = []
+        current_line = None
+        for index in range(first, last + 1):
+            x0, y0, x1, y1 = self.boxes[index]
+            if self.lines[index] == current_line:
+                bx0, by0, bx1, by1 = boxes[-1]
+                boxes[-1] = (min(bx0, x0), min(by0, y0), max(bx1, x1), max(by1, y1))
+            else:
+                boxes.append((x0, y0, x1, y1))
+                current_line = self.lines[index]
+        return boxes
+
+
+class DocumentWordIndex:
+    """Word indices of the pages of an open document, built once per page on first use."""
+
+    def __init__(self, doc: fitz.Document):
+        """
+        Initialize the index.
+
+        Args:
+            doc: Open document whose pages are indexed
+        """
+        self.doc = doc
+        self._pages: Dict[int, PageWordIndex] = {}
+
+    def page(self, page_number: int) -> PageWordIndex:
+        """Word index of a 1-indexed page."""
+        index = self._pages.get(page_number)
+        if index is None:
+            index = self._pages[page_number] = PageWordIndex.from_page(self.doc[page_number - 1])
+        return index
+
+    def locate(self, page_number: int, text: str, within: Optional[Box] = None) -> List[Box]:
+        """
+        Find the words of a text on a page.
+
+        Args:
+            page_number: 1-indexed page number
+            text: Text to find
+            within: Only accept an occurrence that starts inside this box
+
+        Returns:
+            One box per covered line, or an empty list if the text was not found
+        """
+        return self.page(page_number).find(text, within)
@@ -0,0 +1,11 @@
+"""Shared setup of the VeritaScribe test suite."""
+
+import os
+import sys
+from pathlib import Path
+
+# Run against the source tree without installing the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Keep LiteLLM from fetching its model price list on import
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
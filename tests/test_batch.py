@@ -0,0 +1,40 @@
+"""Tests for batch analysis of many documents."""
+
+import json
+import shutil
+from pathlib import Path
+
+from veritascribe import batch as batch_module
+from veritascribe import pipeline as pipeline_module
+from veritascribe.batch import BatchAnalyzer, collect_batch_inputs
+from veritascribe.llm_modules import AnalysisOrchestrator
+from veritascribe.pdf_processor import create_test_pdf
+
+
+class TestBatchReports:
+    """Test the reports a batch saves."""
+
+    def test_same_named_documents_get_separate_reports(self, monkeypatch, tmp_path):
+        # No LLM: every block is analyzed without findings
+        monkeypatch.setattr(batch_module, "initialize_system", lambda: None)
+        monkeypatch.setattr(pipeline_module, "initialize_system", lambda: None)
+        monkeypatch.setattr(AnalysisOrchestrator, "analyze_text_block", lambda self, *args, **kwargs: [])
+
+        template = create_test_pdf(str(tmp_path / "template.pdf"))
+        for folder in ("a", "b"):
+            (tmp_path / "in" / folder).mkdir(parents=True)
+            shutil.copy(template, tmp_path / "in" / folder / "thesis.pdf")
+        pdf_paths = collect_batch_inputs(str(tmp_path / "in" / "**" / "*.pdf"))
+        assert len(pdf_paths) == 2
+
+        output_directory = tmp_path / "out"
+        summary = BatchAnalyzer(str(output_directory), max_active_documents=2).run(pdf_paths)
+
+        assert summary.documents_completed == 2
+        report_paths = {document.report_path for document in summary.documents}
+        assert len(report_paths) == 2
+        assert sorted(path.name for path in output_directory.glob("*_report.json")) == sorted(
+            Path(path).name for path in report_paths
+        )
+        documents = {json.loads(Path(path).read_text())["document_path"] for path in report_paths}
+        assert documents == {str(path) for path in pdf_paths}
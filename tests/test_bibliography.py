@@ -0,0 +1,72 @@
+"""Tests for locating the bibliography section."""
+
+from veritascribe.bibliography import bibliography_text, locate_bibliography
+
+ENTRY = "Smith, J. (2020). Feedback timing and retention. Journal of Learning, 12(3), 45-67."
+
+
+def make_pages(*pages: str):
+    """Page count and page text reader of a document with these 1-indexed pages."""
+    texts = dict(enumerate(pages, start=1))
+    return len(texts), texts.__getitem__
+
+
+class TestLocateBibliography:
+    """Test locating the bibliography by outline and by heading line."""
+
+    def test_outline_entry_ends_at_the_next_chapter(self):
+        page_count, page_text = make_pages(
+            "1 Introduction\nBody text.",
+            "Body text.",
+            "6 Conclusion\nBody text.\n7 References\n" + ENTRY,
+            ENTRY,
+            "Appendix A\nQuestionnaire items.",
+        )
+        outline = [
+            [1, "1 Introduction", 1],
+            [1, "6 Conclusion", 3],
+            [1, "7 References", 3],
+            [1, "Appendix A", 5],
+        ]
+
+        location = locate_bibliography(outline, page_count, page_text)
+
+        assert location.source == "outline"
+        assert (location.first_page, location.first_line) == (3, 2)
+        assert location.pages == [3, 4]
+        assert location.end_line is None
+
+    def test_heading_is_found_below_running_headers(self):
+        page_count, page_text = make_pages(
+            "1 Introduction\nBody text.",
+            "Body text.\n7 References\n" + ENTRY,
+            "References\n" + ENTRY,
+            "References\n" + ENTRY + "\n8 Glossary\nTerms used in this thesis.",
+        )
+
+        location = locate_bibliography([], page_count, page_text)
+
+        assert location.source == "heading"
+        assert (location.first_page, location.first_line) == (2, 1)
+        assert (location.last_page, location.end_line) == (4, 2)
+        text = bibliography_text(location, page_text)
+        assert text.startswith("7 References")
+        assert text.count("Smith, J. (2020)") == 3
+        assert "Glossary" not in text
+
+    def test_back_matter_on_its_own_page_ends_the_previous_page(self):
+        page_count, page_text = make_pages(
+            "Body text.",
+            "Bibliography\n" + ENTRY,
+            "Appendix\nQuestionnaire items.",
+        )
+
+        location = locate_bibliography([], page_count, page_text)
+
+        assert location.pages == [2]
+        assert location.end_line is None
+
+    def test_document_without_bibliography(self):
+        page_count, page_text = make_pages("1 Introduction\nBody text.", "Body text about references.")
+
+        assert locate_bibliography([], page_count, page_text) is None
@@ -0,0 +1,87 @@
+"""Tests for the local classification of extracted blocks."""
+
+from veritascribe.block_classifier import BlockClassifier
+from veritascribe.data_models import BlockKind
+
+CODE = "int total = 0;\nfor (int i = 0; i < n; i++) { total += values[i]; }\nreturn total;"
+
+
+def blocks_mode_block(text: str) -> dict:
+    """A block as read in "blocks" mode: position and text, no fonts."""
+    return {"bbox": (72.0, 100.0, 400.0, 160.0), "lines": [{"spans": [{"text": text}]}]}
+
+
+def dict_mode_block(text: str, font: str) -> dict:
+    return {"bbox": (72.0, 100.0, 400.0, 160.0), "lines": [{"spans": [{"text": text, "font": font, "flags": 0}]}]}
+
+
+class TestCodeDetection:
+    """Test code detection with and without font information."""
+
+    def test_code_is_recognized_lexically_without_fonts(self):
+        assert BlockClassifier().classify(CODE, blocks_mode_block(CODE)) == BlockKind.CODE
+
+    def test_monospaced_font_marks_code_in_dict_mode(self):
+        listing = "result = compute totals for every region"
+        classifier = BlockClassifier()
+
+        assert classifier.classify(listing, blocks_mode_block(listing)) == BlockKind.PROSE
+        assert classifier.classify(listing, dict_mode_block(listing, "Courier")) == BlockKind.CODE
+
+
+def lines_block(*lines: str) -> dict:
+    return {"bbox": (72.0, 100.0, 400.0, 160.0), "lines": [{"spans": [{"text": line}]} for line in lines]}
+
+
+def classify(*lines: str) -> BlockKind:
+    return BlockClassifier().classify(" ".join(lines), lines_block(*lines))
+
+
+class TestNumberHeavyProse:
+    """Test that reported statistics and numbers in sentences stay prose."""
+
+    def test_apa_statistics_are_prose(self):
+        assert classify(
+            "The difference between groups was significant, t(98) = 2.31, p < .05, d = 0.46."
+        ) == BlockKind.PROSE
+        assert classify(
+            "Participants (n = 120) had a mean age of 23.4 years (SD = 2.1)."
+        ) == BlockKind.PROSE
+        assert classify(
+            "Engagement correlated weakly with final grades (r = .21, p = .04), and the model",
+            "explained a modest share of the variance, R² = .18."
+        ) == BlockKind.PROSE
+
+    def test_anova_results_are_prose(self):
+        assert classify(
+            "A one-way ANOVA revealed an effect of condition on recall, F(2, 87) = 5.12,",
+            "p = .008, η² = .11. The delayed group (M = 12.4, SD = 3.1) recalled fewer",
+            "items than the immediate group (M = 15.2, SD = 2.8)."
+        ) == BlockKind.PROSE
+
+    def test_numbers_in_a_sentence_are_prose(self):
+        assert classify(
+            "In 2020, 2021, 2022 and 2023 the sample sizes were 120, 135, 150 and 160."
+        ) == BlockKind.PROSE
+
+    def test_grids_and_formulas_are_recognized(self):
+        assert classify("Group M SD n", "Control 12.4 3.1 45", "Delayed 15.2 2.8 45") == BlockKind.TABLE
+        assert classify("∑ x_i = n · μ") == BlockKind.MATH
+
+
+class TestReferenceDetection:
+    """Test that only bibliography entries count as references."""
+
+    def test_sentence_starting_with_a_citation_is_prose(self):
+        assert classify(
+            "Smith, J. (2020) show that feedback timing affects retention in novice learners."
+        ) == BlockKind.PROSE
+
+    def test_entries_are_references(self):
+        assert classify(
+            "Smith, J. (2020). Feedback timing and retention. Journal of Learning, 12(3), 45-67."
+        ) == BlockKind.REFERENCE
+        assert classify(
+            "Doe, A. B., & Smith, J. (2019). Spaced practice. Learning Press.",
+            "Müller, K. (n.d.). Retrieval practice in schools. Retrieved from the archive."
+        ) == BlockKind.REFERENCE
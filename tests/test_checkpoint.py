@@ -0,0 +1,74 @@
+"""Tests for resuming analyses from per-block checkpoints."""
+
+from veritascribe.checkpoint import AnalysisCheckpoint
+from veritascribe.data_models import AnalysisResult, TextBlock
+
+
+def make_result(block_index: int, analysis_failed: bool = False) -> AnalysisResult:
+    return AnalysisResult(
+        text_block=TextBlock(
+            content=f"Paragraph {block_index} of the analyzed thesis.",
+            page_number=1,
+            block_index=block_index
+        ),
+        analysis_failed=analysis_failed
+    )
+
+
+def write_checkpoint(path, *results: AnalysisResult, key: str = "key") -> None:
+    checkpoint = AnalysisCheckpoint(path, key, "thesis.pdf")
+    checkpoint.open()
+    for result in results:
+        checkpoint.append(result)
+    checkpoint.close()
+
+
+class TestCheckpointResume:
+    """Test loading and continuing interrupted checkpoints."""
+
+    def test_partial_tail_is_truncated_on_resume(self, tmp_path):
+        path = tmp_path / "thesis.jsonl"
+        write_checkpoint(path, make_result(0), make_result(1))
+        complete_size = path.stat().st_size
+        # A crash in the middle of writing the third entry
+        with open(path, "ab") as f:
+            f.write(make_result(2).model_dump_json().encode("utf-8")[:40])
+
+        checkpoint = AnalysisCheckpoint(path, "key")
+        assert sorted(checkpoint.load()) == [0, 1]
+
+        checkpoint.open(resume=True)
+        assert path.stat().st_size == complete_size
+        checkpoint.append(make_result(2))
+        checkpoint.close()
+
+        assert sorted(AnalysisCheckpoint(path, "key").load()) == [0, 1, 2]
+
+    def test_corrupted_entry_ends_the_checkpoint(self, tmp_path):
+        path = tmp_path / "thesis.jsonl"
+        write_checkpoint(path, make_result(0))
+        with open(path, "ab") as f:
+            f.write(b'{"text_block": null}\n')
+        with open(path, "ab") as f:
+            f.write(make_result(1).model_dump_json().encode("utf-8") + b"\n")
+
+        assert sorted(AnalysisCheckpoint(path, "key").load()) == [0]
+
+    def test_failed_blocks_are_not_restored(self, tmp_path):
+        path = tmp_path / "thesis.jsonl"
+        write_checkpoint(path, make_result(0), make_result(1, analysis_failed=True))
+
+        assert sorted(AnalysisCheckpoint(path, "key").load()) == [0]
+
+    def test_checkpoint_of_another_configuration_is_ignored(self, tmp_path):
+        path = tmp_path / "thesis.jsonl"
+        write_checkpoint(path, make_result(0), key="other")
+
+        checkpoint = AnalysisCheckpoint(path, "key")
+        assert checkpoint.load() == {}
+
+        # Resuming starts a new checkpoint instead of appending to the old one
+        checkpoint.open(resume=True)
+        checkpoint.append(make_result(1))
+        checkpoint.close()
+        assert sorted(AnalysisCheckpoint(path, "key").load()) == [1]
@@ -0,0 +1,35 @@
+"""Tests for settings that are resolved per run."""
+
+from pathlib import Path
+
+from veritascribe.config import VeritaScribeSettings
+
+
+def make_settings(**overrides) -> VeritaScribeSettings:
+    return VeritaScribeSettings(_env_file=None, **overrides)
+
+
+class TestRunDirectories:
+    """Test where checkpoints and cached extractions are kept."""
+
+    def test_default_to_the_output_directory(self, tmp_path):
+        settings = make_settings(output_directory=str(tmp_path / "reports"))
+
+        assert Path(settings.checkpoint_directory_for()) == tmp_path / "reports" / "checkpoints"
+        assert Path(settings.extraction_cache_directory_for()) == tmp_path / "reports" / "extraction_cache"
+
+    def test_follow_the_output_directory_of_the_run(self, tmp_path):
+        settings = make_settings(output_directory=str(tmp_path / "reports"))
+        run_directory = str(tmp_path / "run")
+
+        assert Path(settings.checkpoint_directory_for(run_directory)) == tmp_path / "run" / "checkpoints"
+        assert Path(settings.extraction_cache_directory_for(run_directory)) == tmp_path / "run" / "extraction_cache"
+
+    def test_configured_directories_are_kept(self, tmp_path):
+        settings = make_settings(
+            checkpoint_directory=str(tmp_path / "cp"),
+            extraction_cache_directory=str(tmp_path / "cache")
+        )
+
+        assert settings.checkpoint_directory_for(str(tmp_path / "run")) == str(tmp_path / "cp")
+        assert settings.extraction_cache_directory_for(str(tmp_path / "run")) == str(tmp_path / "cache")
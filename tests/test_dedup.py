@@ -0,0 +1,126 @@
+"""Tests for the detection of repeated blocks and the sharing of their results."""
+
+from veritascribe.data_models import AnalysisResult, GrammarCorrectionError, LocationHint, TextBlock
+from veritascribe.dedup import BlockDeduplicator, DuplicateMatch, share_result
+
+# 100 distinct words, so every word shingle occurs once
+WORDS = [f"{first}{second}" for first in ("alpha", "beta", "gamma", "delta", "epsilon")
+         for second in ("red", "green", "blue", "white", "black", "brown", "grey", "pink", "gold", "teal",
+                        "cyan", "lime", "navy", "plum", "rose", "sand", "snow", "tan", "wine", "jade")]
+
+
+def make_block(content: str, block_index: int, page_number: int = 1, top: float = 100.0) -> TextBlock:
+    return TextBlock(
+        content=content,
+        page_number=page_number,
+        block_index=block_index,
+        bounding_box=(50.0, top, 550.0, top + 30.0)
+    )
+
+
+def make_error(original_text: str, bounding_box=None) -> GrammarCorrectionError:
+    return GrammarCorrectionError(
+        severity="medium",
+        original_text=original_text,
+        suggested_correction=original_text.upper(),
+        explanation="A finding used to follow the result across blocks.",
+        location=LocationHint(page_number=1, bounding_box=bounding_box, paragraph_index=0)
+    )
+
+
+def with_word_replaced(position: int) -> str:
+    words = list(WORDS)
+    words[position] = "changed"
+    return " ".join(words)
+
+
+class TestBlockDeduplicator:
+    """Test exact and MinHash near-duplicate matching."""
+
+    def test_exact_duplicate_ignores_case_and_whitespace(self):
+        deduplicator = BlockDeduplicator()
+        text = " ".join(WORDS)
+
+        assert deduplicator.match(make_block(text, 0)) is None
+        assert deduplicator.match(make_block(text.upper().replace(" ", "  "), 1)) == DuplicateMatch(0, exact=True)
+
+    def test_near_duplicate_threshold(self):
+        # One replaced word changes 5 of 96 shingles: Jaccard similarity 91/101
+        original = make_block(" ".join(WORDS), 0)
+        revised = make_block(with_word_replaced(50), 1)
+
+        lenient = BlockDeduplicator(near_duplicate_threshold=0.85)
+        lenient.match(original)
+        match = lenient.match(revised)
+        assert match is not None and not match.exact
+        assert match.representative_index == 0
+        assert abs(match.similarity - 91 / 101) < 1e-4
+
+        strict = BlockDeduplicator(near_duplicate_threshold=0.95)
+        strict.match(original)
+        assert strict.match(revised) is None
+
+    def test_threshold_above_one_disables_near_duplicates(self):
+        deduplicator = BlockDeduplicator(near_duplicate_threshold=1.01)
+        deduplicator.match(make_block(" ".join(WORDS), 0))
+
+        assert deduplicator.match(make_block(with_word_replaced(50), 1)) is None
+
+    def test_unrelated_blocks_are_not_matched(self):
+        deduplicator = BlockDeduplicator(near_duplicate_threshold=0.5)
+
+        duplicates = deduplicator.find_duplicates([
+            make_block(" ".join(WORDS[:50]), 0),
+            make_block(" ".join(WORDS[50:]), 1),
+        ])
+
+        assert duplicates == {}
+
+    def test_copies_of_a_near_duplicate_share_its_representative(self):
+        deduplicator = BlockDeduplicator(near_duplicate_threshold=0.85)
+
+        duplicates = deduplicator.find_duplicates([
+            make_block(" ".join(WORDS), 0),
+            make_block(with_word_replaced(50), 1),
+            make_block(with_word_replaced(50), 2),
+        ])
+
+        assert [match.representative_index for match in duplicates.values()] == [0, 0]
+        assert not duplicates[2].exact
+
+
+class TestShareResult:
+    """Test fanning out a representative's result to its duplicates."""
+
+    def test_errors_move_to_the_duplicate_block(self):
+        representative = make_block(" ".join(WORDS), 0, page_number=1, top=100.0)
+        duplicate = make_block(" ".join(WORDS), 7, page_number=3, top=300.0)
+        result = AnalysisResult(
+            text_block=representative,
+            errors=[make_error("alphared", bounding_box=(60.0, 105.0, 120.0, 115.0))],
+            processing_time_seconds=1.5
+        )
+
+        shared = share_result(result, duplicate, DuplicateMatch(0, exact=True))
+
+        assert shared.text_block is duplicate
+        assert shared.duplicate_of == 0
+        assert shared.processing_time_seconds is None
+        (error,) = shared.errors
+        assert error.location.page_number == 3
+        assert error.location.paragraph_index == 7
+        assert error.location.bounding_box == (60.0, 305.0, 120.0, 315.0)
+        # The representative's result is left as it was
+        assert result.errors[0].location.bounding_box == (60.0, 105.0, 120.0, 115.0)
+
+    def test_near_duplicate_keeps_only_errors_in_its_text(self):
+        representative = make_block(" ".join(WORDS), 0)
+        duplicate = make_block(with_word_replaced(50), 1, top=140.0)
+        result = AnalysisResult(
+            text_block=representative,
+            errors=[make_error("alphared"), make_error(WORDS[50])]
+        )
+
+        shared = share_result(result, duplicate, DuplicateMatch(0, exact=False, similarity=0.9))
+
+        assert [error.original_text for error in shared.errors] == ["alphared"]
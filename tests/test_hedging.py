@@ -0,0 +1,107 @@
+"""Tests for LLM call deadlines and hedged requests."""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from veritascribe.hedging import LLMCallTimeoutError, RequestController
+
+
+@pytest.fixture
+def release():
+    """Event that lets blocked calls finish once the test is done."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def make_controller(**kwargs) -> RequestController:
+    """Controller that hedges every call slower than 1ms."""
+    controller = RequestController(
+        hedging_enabled=True, hedge_percentile=0.0, hedge_min_samples=1, **kwargs
+    )
+    controller.latencies.observe(0.001)
+    return controller
+
+
+class TestDeadlines:
+    """Test the per-call deadline."""
+
+    def test_slow_call_raises_timeout(self, release):
+        controller = RequestController(timeout=0.05)
+        try:
+            start = time.perf_counter()
+            with pytest.raises(LLMCallTimeoutError):
+                controller.call(release.wait, 5)
+            assert time.perf_counter() - start < 1
+            assert controller.get_stats().timeouts == 1
+        finally:
+            controller.shutdown()
+
+    def test_fast_call_returns_its_result(self):
+        controller = RequestController(timeout=1)
+        try:
+            assert controller.call(lambda value: value * 2, 21) == 42
+            assert controller.get_stats().timeouts == 0
+        finally:
+            controller.shutdown()
+
+    def test_errors_are_raised_as_they_are(self):
+        controller = RequestController(timeout=1)
+
+        def fail():
+            raise ValueError("bad response")
+
+        try:
+            with pytest.raises(ValueError):
+                controller.call(fail)
+            assert controller.get_stats().failures == 1
+        finally:
+            controller.shutdown()
+
+
+class TestHedging:
+    """Test hedged requests and their budget."""
+
+    def test_hedge_wins_over_a_stuck_primary(self, release):
+        controller = make_controller(hedge_budget=1.0, timeout=2)
+        attempts = itertools.count()
+
+        def request():
+            # The primary attempt hangs, the hedge answers
+            if next(attempts) == 0:
+                release.wait(5)
+                return "primary"
+            return "hedge"
+
+        try:
+            assert controller.call(request) == "hedge"
+            stats = controller.get_stats()
+            assert stats.hedged_requests == 1
+            assert stats.hedges_won == 1
+        finally:
+            controller.shutdown()
+
+    def test_hedges_stay_within_the_budget(self):
+        controller = make_controller(hedge_budget=0.25)
+        try:
+            for _ in range(8):
+                controller.call(time.sleep, 0.02)
+            stats = controller.get_stats()
+            assert stats.calls == 8
+            assert stats.hedged_requests == 2
+            assert stats.hedges_skipped == 6
+        finally:
+            controller.shutdown()
+
+    def test_denied_permit_skips_the_hedge(self):
+        controller = make_controller(hedge_budget=1.0)
+        try:
+            controller.call(time.sleep, 0.02, hedge_permit=lambda: False)
+            stats = controller.get_stats()
+            assert stats.hedged_requests == 0
+            assert stats.hedges_skipped == 1
+        finally:
+            controller.shutdown()
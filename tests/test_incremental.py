@@ -0,0 +1,72 @@
+"""Tests for the reuse of baseline results in revised documents."""
+
+from veritascribe.data_models import (
+    AnalysisResult,
+    GrammarCorrectionError,
+    LocationHint,
+    TextBlock,
+    ThesisAnalysisReport,
+)
+from veritascribe.incremental import BaselineMatcher
+
+
+def make_block(content: str, block_index: int, page_number: int = 1) -> TextBlock:
+    return TextBlock(
+        content=content,
+        page_number=page_number,
+        block_index=block_index,
+        bounding_box=(50.0, 100.0 + 40 * block_index, 550.0, 130.0 + 40 * block_index)
+    )
+
+
+def make_error(page_number: int) -> GrammarCorrectionError:
+    return GrammarCorrectionError(
+        severity="medium",
+        original_text="data was",
+        suggested_correction="data were",
+        explanation="Data is a plural noun in academic writing.",
+        location=LocationHint(page_number=page_number)
+    )
+
+
+class TestBaselineMatcher:
+    """Test alignment of revised blocks with baseline results."""
+
+    def test_reused_near_duplicate_is_not_counted_as_deduplicated(self):
+        """A result shared within the baseline run is reused without its stale sharing index."""
+        original = "The data was analyzed using a mixed-methods design."
+        near_duplicate = "The data was analysed using a mixed-methods design."
+        baseline = ThesisAnalysisReport(
+            document_name="thesis_v1.pdf",
+            total_pages=1,
+            total_text_blocks=2,
+            analysis_results=[
+                AnalysisResult(text_block=make_block(original, 0), errors=[make_error(1)]),
+                AnalysisResult(text_block=make_block(near_duplicate, 1), errors=[make_error(1)], duplicate_of=0),
+            ]
+        )
+        assert baseline.deduplicated_blocks == 1
+
+        # The revision adds a paragraph in front, so indices shift
+        revised_blocks = [
+            make_block("A new introductory paragraph about the research question.", 0),
+            make_block(original, 1),
+            make_block(near_duplicate, 2),
+        ]
+        reused, to_analyze = BaselineMatcher(baseline).match(revised_blocks)
+
+        assert [block.block_index for block in to_analyze] == [0]
+        assert [result.text_block.block_index for result in reused] == [1, 2]
+        assert all(result.reused_from_baseline for result in reused)
+        assert all(result.duplicate_of is None for result in reused)
+
+        report = ThesisAnalysisReport(
+            document_name="thesis_v2.pdf",
+            total_pages=1,
+            total_text_blocks=len(revised_blocks),
+            analysis_results=[AnalysisResult(text_block=revised_blocks[0])] + reused
+        )
+        assert report.reused_blocks == 2
+        assert report.deduplicated_blocks == 0
+        assert report.reanalyzed_blocks == 1
+        assert report.total_errors == 2
@@ -0,0 +1,72 @@
+"""Tests for the handling of LLM call deadlines in the analysis orchestrator."""
+
+import pytest
+
+from veritascribe import pipeline as pipeline_module
+from veritascribe.data_models import GrammarCorrectionError, LocationHint, TextBlock
+from veritascribe.hedging import LLMCallTimeoutError
+from veritascribe.llm_modules import AnalysisOrchestrator
+from veritascribe.pdf_processor import create_test_pdf
+
+
+def make_block(block_index: int = 0) -> TextBlock:
+    return TextBlock(
+        content="The data was analyzed using a mixed-methods design (Smith, 2020).",
+        page_number=1,
+        block_index=block_index
+    )
+
+
+def grammar_errors(text_block, language=None):
+    return [GrammarCorrectionError(
+        severity="low",
+        original_text="data was",
+        suggested_correction="data were",
+        explanation="Data is a plural noun in academic writing.",
+        location=LocationHint(page_number=text_block.page_number)
+    )]
+
+
+def time_out(*args, **kwargs):
+    raise LLMCallTimeoutError("LLM call did not finish within 1s")
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    """Orchestrator whose grammar check succeeds and content and citation checks time out."""
+    orchestrator = AnalysisOrchestrator()
+    monkeypatch.setattr(orchestrator, "linguistic_analyzer", grammar_errors)
+    monkeypatch.setattr(orchestrator, "content_validator", time_out)
+    monkeypatch.setattr(orchestrator, "citation_checker", time_out)
+    return orchestrator
+
+
+class TestAnalysisTimeouts:
+    """Test that a timed-out LLM call only affects its own block."""
+
+    def test_timeout_returns_errors_of_finished_modules(self, orchestrator):
+        errors = orchestrator.analyze_text_block(make_block(), modules=("grammar", "content", "citation"))
+
+        assert [error.original_text for error in errors] == ["data was"]
+
+    def test_timeout_raises_when_requested(self, orchestrator):
+        with pytest.raises(LLMCallTimeoutError):
+            orchestrator.analyze_text_block(
+                make_block(), modules=("grammar", "content", "citation"), raise_on_timeout=True
+            )
+
+    def test_batch_analysis_continues_after_timeout(self, orchestrator):
+        results = orchestrator.batch_analyze_blocks([make_block(0), make_block(1)])
+
+        assert sorted(results) == [0, 1]
+
+    def test_quick_analysis_marks_timed_out_blocks_failed(self, orchestrator, monkeypatch, tmp_path):
+        monkeypatch.setattr(pipeline_module, "initialize_system", lambda: None)
+        pdf_path = create_test_pdf(str(tmp_path / "thesis.pdf"))
+        quick_pipeline = pipeline_module.QuickAnalysisPipeline(str(tmp_path))
+        quick_pipeline.analysis_orchestrator = orchestrator
+
+        report = quick_pipeline.quick_analyze(pdf_path, max_blocks=3)
+
+        assert report.total_text_blocks > 0
+        assert all(result.analysis_failed for result in report.analysis_results)
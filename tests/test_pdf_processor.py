@@ -0,0 +1,26 @@
+"""Tests for PDF text extraction."""
+
+from veritascribe.config import VeritaScribeSettings
+from veritascribe.pdf_processor import PDFProcessor
+
+
+def make_processor(tmp_path, **overrides) -> PDFProcessor:
+    settings = VeritaScribeSettings(
+        _env_file=None,
+        output_directory=str(tmp_path),
+        detect_sections=False,
+        **overrides
+    )
+    return PDFProcessor(settings)
+
+
+class TestExtractionCacheKey:
+    """Test that cached extractions are only served to matching settings."""
+
+    def test_key_depends_on_the_extraction_mode(self, tmp_path):
+        blocks_mode = make_processor(tmp_path, text_extraction_mode="blocks")
+        dict_mode = make_processor(tmp_path, text_extraction_mode="dict")
+
+        assert blocks_mode.extraction_mode != dict_mode.extraction_mode
+        assert blocks_mode._extraction_cache_key("0" * 64, None, False) != \
+            dict_mode._extraction_cache_key("0" * 64, None, False)
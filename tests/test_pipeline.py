@@ -0,0 +1,46 @@
+"""Tests for streamed analyses and their checkpoints."""
+
+import json
+
+from veritascribe import pipeline as pipeline_module
+from veritascribe.checkpoint import AnalysisCheckpoint
+from veritascribe.llm_modules import AnalysisOrchestrator
+from veritascribe.pdf_processor import create_test_pdf
+
+
+def checkpointed_block_indices(checkpoint_directory) -> list:
+    (path,) = checkpoint_directory.glob("*.jsonl")
+    lines = path.read_text().splitlines()[1:]
+    return [json.loads(line)["text_block"]["block_index"] for line in lines]
+
+
+class TestPipelinedResume:
+    """Test resuming a pipelined analysis from its checkpoint."""
+
+    def test_restored_results_are_not_appended_again(self, monkeypatch, tmp_path):
+        # No LLM: every block is analyzed without findings
+        monkeypatch.setattr(pipeline_module, "initialize_system", lambda: None)
+        monkeypatch.setattr(AnalysisOrchestrator, "analyze_text_block", lambda self, *args, **kwargs: [])
+        # Keep the checkpoint of the completed run for inspection
+        monkeypatch.setattr(AnalysisCheckpoint, "remove", AnalysisCheckpoint.close)
+
+        pdf_path = create_test_pdf(str(tmp_path / "thesis.pdf"))
+        analysis_pipeline = pipeline_module.create_analysis_pipeline()
+        monkeypatch.setattr(analysis_pipeline.settings, "pipelined_analysis", True)
+        monkeypatch.setattr(analysis_pipeline.settings, "parallel_processing", False)
+        monkeypatch.setattr(analysis_pipeline.settings, "report_formats", [])
+        output_directory = tmp_path / "out"
+
+        # Interrupt the first run after its first result
+        events = analysis_pipeline.stream_analysis(str(pdf_path), str(output_directory))
+        for progress in events:
+            if progress.result is not None:
+                break
+        events.close()
+        assert len(checkpointed_block_indices(output_directory / "checkpoints")) == 1
+
+        *_, final = analysis_pipeline.stream_analysis(str(pdf_path), str(output_directory), resume=True)
+
+        indices = checkpointed_block_indices(output_directory / "checkpoints")
+        assert final.report.resumed_blocks == 1
+        assert len(indices) == len(set(indices)) == final.report.total_text_blocks
@@ -0,0 +1,95 @@
+"""Tests for report formats and their compression."""
+
+import importlib.util
+import json
+
+import pytest
+
+from veritascribe.data_models import (
+    AnalysisResult,
+    GrammarCorrectionError,
+    LocationHint,
+    TextBlock,
+    ThesisAnalysisReport,
+)
+from veritascribe.incremental import load_baseline_report
+from veritascribe.report_compression import check_compression, read_report_bytes
+from veritascribe.report_export import check_report_formats, export_report, report_file_path
+
+
+def make_report() -> ThesisAnalysisReport:
+    results = [
+        AnalysisResult(
+            text_block=TextBlock(
+                content=f"Paragraph {block_index}: the data was analyzed using a mixed-methods design.",
+                page_number=1,
+                block_index=block_index
+            ),
+            errors=[GrammarCorrectionError(
+                severity="medium",
+                original_text="data was",
+                suggested_correction="data were",
+                explanation="Data is a plural noun in academic writing.",
+                location=LocationHint(page_number=1)
+            )]
+        )
+        for block_index in range(3)
+    ]
+    return ThesisAnalysisReport(
+        document_name="thesis.pdf",
+        total_pages=1,
+        total_text_blocks=len(results),
+        analysis_results=results,
+        total_processing_time_seconds=1.5
+    )
+
+
+@pytest.fixture(params=["none", "gzip", "zstd"])
+def compression(request):
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    return request.param
+
+
+class TestCompressedReports:
+    """Test that reports read back the same with every compression."""
+
+    def test_json_report_round_trip(self, compression, tmp_path):
+        report = make_report()
+
+        paths = export_report(report, tmp_path / "thesis", ["json"], compression)
+
+        assert paths["json"] == report_file_path(tmp_path / "thesis", "json", compression)
+        assert paths["json"].name == {
+            "none": "thesis_report.json", "gzip": "thesis_report.json.gz", "zstd": "thesis_report.json.zst"
+        }[compression]
+        loaded = load_baseline_report(str(paths["json"]))
+        assert loaded.model_dump() == report.model_dump()
+
+    def test_ndjson_errors_round_trip(self, compression, tmp_path):
+        paths = export_report(make_report(), tmp_path / "thesis", ["ndjson"], compression)
+
+        records = [json.loads(line) for line in read_report_bytes(paths["ndjson"]).splitlines()]
+        assert [record["block_index"] for record in records] == [0, 1, 2]
+        assert all(record["document"] == "thesis.pdf" for record in records)
+        assert records[0]["original_text"] == "data was"
+
+
+class TestFormatChecks:
+    """Test that unusable formats fail before any analysis."""
+
+    def test_unknown_format_and_compression(self):
+        with pytest.raises(ValueError):
+            check_report_formats(["xml"])
+        with pytest.raises(ValueError):
+            check_compression("bzip2")
+
+    @pytest.mark.skipif(importlib.util.find_spec("zstandard") is not None, reason="zstandard is installed")
+    def test_zstd_without_its_package(self):
+        with pytest.raises(ValueError, match="zstandard"):
+            check_report_formats(["json"], "zstd")
+
+    @pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+    def test_parquet_without_its_package(self):
+        with pytest.raises(ValueError, match="pyarrow"):
+            check_report_formats(["parquet"])
@@ -0,0 +1,94 @@
+"""Tests for the incrementally maintained report statistics."""
+
+from veritascribe.data_models import (
+    AnalysisResult,
+    ContentPlausibilityError,
+    GrammarCorrectionError,
+    LocationHint,
+    TextBlock,
+    ThesisAnalysisReport,
+)
+from veritascribe.report_index import ReportIndex
+
+
+def make_block(block_index: int, page_number: int) -> TextBlock:
+    return TextBlock(
+        content="The data was analyzed using a mixed-methods design.",
+        page_number=page_number,
+        block_index=block_index
+    )
+
+
+def grammar_error(page_number: int, severity: str = "medium") -> GrammarCorrectionError:
+    return GrammarCorrectionError(
+        severity=severity,
+        original_text="data was",
+        suggested_correction="data were",
+        explanation="Data is a plural noun in academic writing.",
+        location=LocationHint(page_number=page_number)
+    )
+
+
+def content_error(page_number: int) -> ContentPlausibilityError:
+    return ContentPlausibilityError(
+        severity="high",
+        original_text="mixed-methods design",
+        explanation="The design is not described in the methodology chapter.",
+        plausibility_issue="Unsupported claim",
+        location=LocationHint(page_number=page_number)
+    )
+
+
+class TestReportIndex:
+    """Test counts and error lists kept result by result."""
+
+    def test_statistics_match_the_results(self):
+        results = [
+            AnalysisResult(text_block=make_block(0, 1), errors=[grammar_error(1), content_error(1)]),
+            AnalysisResult(text_block=make_block(1, 2), errors=[]),
+            AnalysisResult(text_block=make_block(2, 3), errors=[grammar_error(3, "low")]),
+        ]
+
+        statistics = ReportIndex(results).statistics()
+
+        assert statistics["total_text_blocks"] == 3
+        assert statistics["total_words"] == 24
+        assert statistics["total_errors"] == 3
+        assert statistics["errors_by_type"] == {"grammar": 2, "content_plausibility": 1}
+        assert statistics["errors_by_severity"] == {"medium": 1, "high": 1, "low": 1}
+        # Pages without errors are counted too
+        assert statistics["errors_by_page"] == {1: 2, 2: 0, 3: 1}
+
+    def test_error_lists_keep_the_order_results_were_added(self):
+        index = ReportIndex()
+        late = grammar_error(2, "high")
+        early = content_error(1)
+        index.add(AnalysisResult(text_block=make_block(1, 2), errors=[late]))
+        index.add(AnalysisResult(text_block=make_block(0, 1), errors=[early]))
+
+        assert index.high_severity_errors == [late, early]
+        assert index.errors_by_page == {2: [late], 1: [early]}
+
+    def test_provenance_counts(self):
+        index = ReportIndex([
+            AnalysisResult(text_block=make_block(0, 1)),
+            AnalysisResult(text_block=make_block(1, 1), reused_from_baseline=True),
+            AnalysisResult(text_block=make_block(2, 1), duplicate_of=0),
+        ])
+
+        assert (index.reanalyzed_blocks, index.reused_blocks, index.deduplicated_blocks) == (1, 1, 1)
+
+    def test_report_statistics_come_from_its_index(self):
+        report = ThesisAnalysisReport(
+            document_name="thesis.pdf",
+            total_pages=2,
+            total_text_blocks=2,
+            analysis_results=[
+                AnalysisResult(text_block=make_block(0, 1), errors=[grammar_error(1)]),
+                AnalysisResult(text_block=make_block(1, 2), errors=[content_error(2)]),
+            ]
+        )
+
+        assert report.total_errors == 2
+        assert report.errors_by_page == {1: 1, 2: 1}
+        assert report.index.errors_by_type["content_plausibility"][0].original_text == "mixed-methods design"
@@ -0,0 +1,92 @@
+"""Tests for writing JSON reports result by result."""
+
+import json
+
+from veritascribe.data_models import (
+    AnalysisResult,
+    GrammarCorrectionError,
+    LocationHint,
+    TextBlock,
+    ThesisAnalysisReport,
+)
+from veritascribe.incremental import block_fingerprint
+from veritascribe.report_writer import StreamingReportWriter
+
+
+def make_result(block_index: int, error_count: int = 1) -> AnalysisResult:
+    return AnalysisResult(
+        text_block=TextBlock(
+            content=f"Paragraph {block_index}: the data was analyzed using a mixed-methods design.",
+            page_number=block_index // 2 + 1,
+            block_index=block_index,
+            bounding_box=(50.0, 100.0, 550.0, 130.0)
+        ),
+        errors=[
+            GrammarCorrectionError(
+                severity="medium",
+                original_text="data was",
+                suggested_correction="data were",
+                explanation="Data is a plural noun in academic writing.",
+                location=LocationHint(page_number=block_index // 2 + 1)
+            )
+            for _ in range(error_count)
+        ]
+    )
+
+
+def make_report(*results: AnalysisResult) -> ThesisAnalysisReport:
+    return ThesisAnalysisReport(
+        document_name="thesis.pdf",
+        total_pages=2,
+        total_text_blocks=len(results),
+        analysis_results=list(results),
+        total_processing_time_seconds=1.5
+    )
+
+
+class TestStreamingReportWriter:
+    """Test reports written while results arrive."""
+
+    def test_streamed_report_loads_as_the_full_report(self, tmp_path):
+        report = make_report(make_result(0), make_result(1, error_count=2), make_result(2, error_count=0))
+        path = tmp_path / "thesis_report.json"
+
+        StreamingReportWriter.write_report(report, str(path))
+
+        loaded = ThesisAnalysisReport.model_validate_json(path.read_bytes())
+        assert loaded.model_dump() == report.model_dump()
+        assert loaded.total_errors == 3
+
+    def test_results_are_written_in_completion_order(self, tmp_path):
+        path = tmp_path / "thesis_report.json"
+        writer = StreamingReportWriter(str(path)).open()
+        for block_index in (2, 0, 1):
+            writer.append(make_result(block_index))
+        # Nothing appears under the report's name before it is complete
+        assert not path.exists()
+
+        writer.close(make_report().model_dump(exclude={'analysis_results'}))
+
+        data = json.loads(path.read_text())
+        assert [result["text_block"]["block_index"] for result in data["analysis_results"]] == [2, 0, 1]
+        assert data["total_text_blocks"] == 3
+        assert data["errors_by_page"] == {"1": 2, "2": 1}
+
+    def test_compact_report_references_blocks_by_hash(self, tmp_path):
+        result = make_result(0)
+        path = tmp_path / "thesis_report.json"
+
+        StreamingReportWriter.write_report(make_report(result), str(path), compact=True)
+
+        (text_block,) = [entry["text_block"] for entry in json.loads(path.read_text())["analysis_results"]]
+        assert "content" not in text_block
+        assert text_block["content_sha256"] == block_fingerprint(result.text_block.content)
+        assert text_block["block_index"] == 0
+
+    def test_discarded_report_leaves_no_files(self, tmp_path):
+        writer = StreamingReportWriter(str(tmp_path / "thesis_report.json")).open()
+        writer.append(make_result(0))
+
+        writer.discard()
+
+        assert list(tmp_path.iterdir()) == []
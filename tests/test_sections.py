@@ -0,0 +1,111 @@
+"""Tests for tagging blocks with their chapter and section."""
+
+from veritascribe.chunking import RawBlock
+from veritascribe.data_models import TextBlock
+from veritascribe.sections import BlockFont, SectionTracker, build_section_tree
+
+BODY = "The participants completed the questionnaire in two sessions of thirty minutes each."
+
+
+class PageBuilder:
+    """Numbers raw blocks document-wide and records their fonts."""
+
+    def __init__(self):
+        self.fonts = {}
+        self.count = 0
+
+    def page(self, page_number: int, *blocks) -> list:
+        """Blocks of one page from (text, size, bold) tuples."""
+        raw_blocks = []
+        for text, size, bold in blocks:
+            raw_blocks.append(RawBlock(text, page_number, None, self.count))
+            self.fonts[self.count] = BlockFont(size=size, bold=bold, characters=len(text.replace(" ", "")))
+            self.count += 1
+        return raw_blocks
+
+
+def heading(text: str, size: float = 16.0, bold: bool = True) -> tuple:
+    return text, size, bold
+
+
+def body(text: str = BODY) -> tuple:
+    return text, 11.0, False
+
+
+class TestSectionTracker:
+    """Test section paths across page boundaries."""
+
+    def test_section_continues_on_the_next_page(self):
+        builder = PageBuilder()
+        tracker = SectionTracker()
+        first = builder.page(1, heading("1 Introduction"), body(), body())
+        second = builder.page(2, body(), body())
+
+        tracker.tag_page(first, builder.fonts)
+        tracker.tag_page(second, builder.fonts)
+
+        assert [block.section_path for block in second] == [["1 Introduction"]] * 2
+
+    def test_heading_at_the_bottom_of_a_page_applies_to_the_next(self):
+        builder = PageBuilder()
+        tracker = SectionTracker()
+        first = builder.page(1, heading("1 Introduction"), body(), heading("2 Methods"))
+        second = builder.page(2, body())
+
+        tracker.tag_page(first, builder.fonts)
+        tracker.tag_page(second, builder.fonts)
+
+        assert first[1].section_path == ["1 Introduction"]
+        assert first[2].section_path == ["2 Methods"]
+        assert second[0].section_path == ["2 Methods"]
+
+    def test_heading_at_the_top_of_a_page_closes_the_previous_section(self):
+        builder = PageBuilder()
+        tracker = SectionTracker()
+        pages = [
+            builder.page(1, heading("1 Introduction"), body(), body()),
+            builder.page(2, heading("2 Methods"), body()),
+            builder.page(3, heading("2.1 Sampling", size=11.0), body()),
+            builder.page(4, body(), heading("3 Results"), body()),
+        ]
+
+        for page in pages:
+            tracker.tag_page(page, builder.fonts)
+
+        assert pages[0][2].section_path == ["1 Introduction"]
+        assert pages[1][1].section_path == ["2 Methods"]
+        assert pages[2][1].section_path == ["2 Methods", "2.1 Sampling"]
+        assert pages[3][0].section_path == ["2 Methods", "2.1 Sampling"]
+        assert pages[3][2].section_path == ["3 Results"]
+
+    def test_blocks_before_the_first_heading_have_no_section(self):
+        builder = PageBuilder()
+        tracker = SectionTracker()
+        first = builder.page(1, body(), body())
+        second = builder.page(2, heading("1 Introduction"), body())
+
+        tracker.tag_page(first, builder.fonts)
+        tracker.tag_page(second, builder.fonts)
+
+        assert [block.section_path for block in first] == [[], []]
+        assert second[1].section_path == ["1 Introduction"]
+
+
+class TestSectionTree:
+    """Test the tree of sections built from tagged blocks."""
+
+    def test_section_starts_on_the_page_of_its_first_block(self):
+        text_blocks = [
+            TextBlock(content=BODY, page_number=1, block_index=0, section_path=[]),
+            TextBlock(content=BODY, page_number=2, block_index=1, section_path=["1 Introduction"]),
+            TextBlock(content=BODY, page_number=3, block_index=2, section_path=["1 Introduction"]),
+            TextBlock(content=BODY, page_number=3, block_index=3, section_path=["1 Introduction", "1.1 Aims"]),
+        ]
+
+        root = build_section_tree(text_blocks)
+
+        assert root.block_indices == [0]
+        (chapter,) = root.children
+        assert (chapter.title, chapter.page_number, chapter.block_indices) == ("1 Introduction", 2, [1, 2])
+        (section,) = chapter.children
+        assert (section.level, section.page_number, section.block_indices) == (2, 3, [3])
@@ -0,0 +1,75 @@
+"""Tests for locating error text on a page word by word."""
+
+import fitz  # PyMuPDF
+
+from veritascribe.word_index import DocumentWordIndex, PageWordIndex, match_key
+
+
+def make_words(*lines: str, block_number: int = 0, top: float = 100.0) -> list:
+    """Words as from ``page.get_text("words")``, 10pt per character and 20pt per line."""
+    words = []
+    for line_number, line in enumerate(lines):
+        x = 50.0
+        y = top + 20.0 * line_number
+        for word_number, word in enumerate(line.split()):
+            words.append((x, y, x + 10.0 * len(word), y + 12.0, word, block_number, line_number, word_number))
+            x += 10.0 * (len(word) + 1)
+    return words
+
+
+class TestPageWordIndex:
+    """Test finding text among the words of a page."""
+
+    def test_match_key_ignores_case_punctuation_and_split_umlauts(self):
+        assert match_key("Die ¨Uber-Prüfung, z.B.") == match_key("die überprüfung zb")
+
+    def test_text_on_one_line_gives_one_box(self):
+        index = PageWordIndex(make_words("The data was analyzed carefully."))
+
+        assert index.find("data was") == [(90.0, 100.0, 170.0, 112.0)]
+
+    def test_text_across_a_hyphenated_line_break_gives_a_box_per_line(self):
+        index = PageWordIndex(make_words("The results of the ques-", "tionnaire shows a trend."))
+
+        boxes = index.find("questionnaire shows")
+
+        assert boxes == [(240.0, 100.0, 290.0, 112.0), (50.0, 120.0, 200.0, 132.0)]
+
+    def test_occurrence_must_start_inside_the_given_box(self):
+        words = make_words("The data was noisy.", top=100.0) + \
+            make_words("The data was clean.", block_number=1, top=300.0)
+        index = PageWordIndex(words)
+
+        assert index.find("data was")[0][1] == 100.0
+        assert index.find("data was", within=(40.0, 290.0, 550.0, 330.0))[0][1] == 300.0
+
+    def test_missing_word_means_not_found(self):
+        index = PageWordIndex(make_words("The data was analyzed carefully."))
+
+        assert index.find("data were analyzed") == []
+
+    def test_text_split_around_other_words_is_found_piece_by_piece(self):
+        words = make_words("The first paragraph ends here.", top=100.0) + \
+            make_words("2 Methods", block_number=1, top=200.0) + \
+            make_words("The second paragraph starts.", block_number=2, top=300.0)
+        index = PageWordIndex(words)
+
+        boxes = index.find("ends here. The second")
+
+        assert [box[1] for box in boxes] == [100.0, 300.0]
+
+
+class TestDocumentWordIndex:
+    """Test the per-page indices of an open document."""
+
+    def test_words_are_located_on_their_page(self):
+        doc = fitz.open()
+        for text in ("An introductory page.", "The data was analyzed."):
+            doc.new_page().insert_text((72, 100), text)
+
+        index = DocumentWordIndex(doc)
+
+        assert index.locate(1, "data was") == []
+        (box,) = index.locate(2, "data was")
+        assert 72 <= box[0] < box[2] and box[1] < 100 < box[3]
+        assert index.page(2) is index.page(2)